@@ -0,0 +1,61 @@
+"""
+Compares loading the `in` and `out` lists of a step with many of them with
+_ArrayLoader.load() and with load_field() of a new union loader for every
+element, as _ArrayLoader.load() used to.
+
+    python benchmarks/bench_array_loader.py [n_elements]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+
+BASEURI = 'file:///bench/main.cwl#main/step'
+
+
+def load_each(loader, doc, options):
+    r = []
+    for item in doc:
+        lf = cwl_schema.load_field(item, cwl_schema._UnionLoader((loader, loader.items)), BASEURI, options)
+        if isinstance(lf, list):
+            r.extend(lf)
+        else:
+            r.append(lf)
+    return r
+
+
+def load(loader, doc, options):
+    return loader.load(doc, BASEURI, options)
+
+
+def time_load(load, loader, doc, repeat=5):
+    best = None
+    for _ in range(repeat):
+        options = cwl_schema.LoadingOptions()
+        start = time.time()
+        load(loader, doc, options)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n_elements = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cases = [
+        ('in', cwl_schema.array_of_WorkflowStepInputLoader,
+         [{'id': 'input-%d' % i, 'source': 'other/output-%d' % i} for i in range(n_elements)]),
+        ('out', cwl_schema.array_of_union_of_strtype_or_WorkflowStepOutputLoader,
+         ['output-%d' % i for i in range(n_elements)]),
+    ]
+    for name, loader, doc in cases:
+        before = time_load(load_each, loader, doc)
+        after = time_load(load, loader, doc)
+        print('%d %s: load_field per element %.3fs, _ArrayLoader %.3fs, speedup %.1fx'
+              % (n_elements, name, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
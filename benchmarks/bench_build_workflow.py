@@ -0,0 +1,43 @@
+"""
+Times building chain-shaped workflows of growing size with the cwlpy
+builder, which should scale linearly with the number of steps.
+
+    python benchmarks/bench_build_workflow.py [max_steps]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cwlpy import Workflow, WorkflowStep  # noqa: E402
+
+
+def build(n_steps, inputs_per_step=5):
+    """n_steps steps, each connected to the previous one and to the workflow inputs."""
+    workflow = Workflow('main')
+    steps = [WorkflowStep('step-%d' % i, run='tool.cwl') for i in range(n_steps)]
+    for step in steps:
+        workflow.add_step(step)
+    for i, step in enumerate(steps):
+        for j in range(inputs_per_step):
+            workflow.connect_input(step, 'wf-input-%d' % j, 'input-%d' % j)
+        if i:
+            workflow.connect_steps(steps[i - 1], step, 'output', 'previous')
+        workflow.connect_output(step, 'output', 'wf-output-%d' % i)
+    return workflow
+
+
+def main():
+    max_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    n_steps = 1000
+    while n_steps <= max_steps:
+        start = time.time()
+        build(n_steps)
+        elapsed = time.time() - start
+        print('%6d steps: %.3fs, %.1fus per step' % (n_steps, elapsed, 1e6 * elapsed / n_steps))
+        n_steps *= 2
+
+
+if __name__ == '__main__':
+    main()
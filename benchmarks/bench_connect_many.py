@@ -0,0 +1,65 @@
+"""
+Compares connecting a generated workflow one connection at a time and with
+Workflow.connect_many().
+
+    python benchmarks/bench_connect_many.py [n_steps] [inputs_per_step]
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cwlpy import Workflow, WorkflowStep  # noqa: E402
+
+
+def make_steps(n_steps):
+    workflow = Workflow('main')
+    steps = [WorkflowStep('step-%d' % i, run='tool.cwl') for i in range(n_steps)]
+    for step in steps:
+        workflow.add_step(step)
+    return workflow, steps
+
+
+def edges(steps, inputs_per_step):
+    for i, step in enumerate(steps):
+        for j in range(inputs_per_step):
+            if i > j:
+                yield (steps[i - j - 1], 'output', step, 'input-%d' % j)
+            else:
+                yield (None, 'wf-input-%d' % j, step, 'input-%d' % j)
+    yield (steps[-1], 'output', None, 'wf-output')
+
+
+def connect_one_by_one(workflow, edges):
+    for source, source_port, target, target_port in edges:
+        if source is None:
+            workflow.connect_input(target, source_port, target_port)
+        elif target is None:
+            workflow.connect_output(source, source_port, target_port)
+        else:
+            workflow.connect_steps(source, target, source_port, target_port)
+
+
+def time_connect(n_steps, inputs_per_step, connect):
+    workflow, steps = make_steps(n_steps)
+    links = list(edges(steps, inputs_per_step))
+    gc.collect()
+    start = time.time()
+    connect(workflow, links)
+    return time.time() - start
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    inputs_per_step = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    n_links = sum(1 for _ in edges(list(range(n_steps)), inputs_per_step))
+    one_by_one = time_connect(n_steps, inputs_per_step, connect_one_by_one)
+    many = time_connect(n_steps, inputs_per_step, Workflow.connect_many)
+    print('%d steps, %d links: one by one %.3fs, connect_many %.3fs, speedup %.2fx'
+          % (n_steps, n_links, one_by_one, many, one_by_one / many))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares peak memory and time of writing a large loaded workflow with
+yaml.safe_dump(workflow.save()) and json.dump(workflow.save()) against the
+streaming dump_yaml() and dump_json(), into a temporary file.
+
+    python benchmarks/bench_dump.py [n_steps]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from ruamel import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from cwlpy import dump_yaml, dump_json  # noqa: E402
+from workflows import make_workflow  # noqa: E402
+
+
+def measure(function, path):
+    with open(path, 'w') as stream:
+        start = time.time()
+        function(stream)
+        elapsed = time.time() - start
+    # Separately, as tracing allocations slows everything down
+    with open(path, 'w') as stream:
+        tracemalloc.start()
+        function(stream)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak / 1024.0 / 1024.0
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workflow = cwl_schema.load_document(make_workflow(n_steps), 'file:///tmp/main.cwl')
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        cases = [
+            ('yaml.safe_dump(save())',
+             lambda stream: yaml.safe_dump(workflow.save(), stream, default_flow_style=False)),
+            ('dump_yaml', lambda stream: dump_yaml(workflow, stream)),
+            ('json.dump(save())', lambda stream: json.dump(workflow.save(), stream)),
+            ('dump_json', lambda stream: dump_json(workflow, stream)),
+        ]
+        for name, function in cases:
+            elapsed, peak = measure(function, path)
+            print('%d steps, %-24s %.2fs, peak %.1f MiB' % (n_steps, name + ':', elapsed, peak))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
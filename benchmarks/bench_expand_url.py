@@ -0,0 +1,64 @@
+"""
+Replays the expand_url() calls made while loading a large workflow, with
+and without the memo. The first pass mostly misses, as every id is
+expanded against its own base URL; later passes, as when the same
+LoadingOptions load the document again, find every expansion in the memo.
+
+    python benchmarks/bench_expand_url.py [n_steps] [passes]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from ruamel import yaml  # noqa: E402
+from workflows import make_workflow_yaml  # noqa: E402
+
+
+def record_calls(doc):
+    calls = []
+    expand_url = cwl_schema.expand_url
+
+    def recording(url, base_url, loadingOptions, *args, **kwargs):
+        calls.append((url, base_url, args, kwargs))
+        return expand_url(url, base_url, loadingOptions, *args, **kwargs)
+
+    cwl_schema.expand_url = recording
+    try:
+        cwl_schema.load_document(doc, 'file:///bench/main.cwl', cwl_schema.LoadingOptions())
+    finally:
+        cwl_schema.expand_url = expand_url
+    return calls
+
+
+def time_passes(calls, passes, max_entries):
+    options = cwl_schema.LoadingOptions()
+    options.url_cache.max_entries = max_entries
+    expand_url = cwl_schema.expand_url
+    times = []
+    for _ in range(passes):
+        start = time.time()
+        for url, base_url, args, kwargs in calls:
+            expand_url(url, base_url, options, *args, **kwargs)
+        times.append(time.time() - start)
+    return times, options.url_cache
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    passes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    doc = yaml.round_trip_load(make_workflow_yaml(n_steps))
+    cwl_schema.add_lc_filename(doc, 'file:///bench/main.cwl')
+    calls = record_calls(doc)
+    uncached, _ = time_passes(calls, passes, 0)
+    cached, cache = time_passes(calls, passes, cwl_schema.ExpandUrlCache().max_entries)
+    print('%d calls: no memo %.1fms per pass; memo %.1fms first pass, %.1fms later passes '
+          '(%.0fx), hit rate %.0f%%'
+          % (len(calls), 1000 * min(uncached), 1000 * cached[0], 1000 * min(cached[1:]),
+             min(uncached) / min(cached[1:]), 100 * cache.hit_rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Times filling in sizes and checksums for a directory of many files: reading
+and hashing one file at a time, fill_metadata() on a thread pool, and
+fill_metadata() again with a checksum cache of the first run.
+
+    python benchmarks/bench_fill_metadata.py [n_files] [file_kib]
+"""
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from cwlpy import fill_metadata, ChecksumCache  # noqa: E402
+
+
+def serial(directory):
+    files = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        with open(path, 'rb') as f:
+            data = f.read()
+        files.append({'class': 'File', 'path': path, 'size': len(data),
+                      'checksum': 'sha1$' + hashlib.sha1(data).hexdigest()})
+    return files
+
+
+def main():
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    file_kib = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    directory = tempfile.mkdtemp()
+    try:
+        data_dir = os.path.join(directory, 'data')
+        os.mkdir(data_dir)
+        block = os.urandom(1024)
+        for i in range(n_files):
+            with open(os.path.join(data_dir, '%06d.bin' % i), 'wb') as f:
+                f.write(block * file_kib)
+        location = cwl_schema.file_uri(data_dir)
+
+        start = time.time()
+        expected = serial(data_dir)
+        serial_time = time.time() - start
+
+        cache = ChecksumCache(os.path.join(directory, 'checksums.json'))
+        start = time.time()
+        value = fill_metadata({'class': 'Directory', 'location': location}, cache=cache)
+        parallel_time = time.time() - start
+        assert [f['checksum'] for f in value['listing']] == [f['checksum'] for f in expected]
+
+        start = time.time()
+        fill_metadata({'class': 'Directory', 'location': location},
+                      cache=ChecksumCache(os.path.join(directory, 'checksums.json')))
+        cached_time = time.time() - start
+
+        start = time.time()
+        fill_metadata({'class': 'Directory', 'location': location}, checksums=False)
+        listing_time = time.time() - start
+    finally:
+        shutil.rmtree(directory)
+    print('%d files of %d KiB: serial %.3fs, fill_metadata %.3fs, with cache %.3fs, without checksums %.3fs'
+          % (n_files, file_kib, serial_time, parallel_time, cached_time, listing_time))
+
+
+if __name__ == '__main__':
+    main()
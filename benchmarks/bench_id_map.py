@@ -0,0 +1,61 @@
+"""
+Compares loading a large workflow whose steps and inputs are written in map
+form, from its file, when _IdMapLoader changes the parsed document in place,
+and from the same document given as a dict, when it copies every entry.
+
+    python benchmarks/bench_id_map.py [n_steps]
+"""
+import copy
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from ruamel import yaml  # noqa: E402
+from workflows import make_workflow  # noqa: E402
+
+
+def map_form(workflow):
+    for key in ('inputs', 'outputs', 'steps'):
+        workflow[key] = dict((entry.pop('id'), entry) for entry in workflow[key])
+    for step in workflow['steps'].values():
+        step['in'] = dict((entry.pop('id'), entry) for entry in step['in'])
+        step['run']['inputs'] = dict((entry.pop('id'), entry) for entry in step['run']['inputs'])
+    return workflow
+
+
+def best_of(load, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        load()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tmpdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmpdir, 'main.cwl')
+        with open(path, 'w') as f:
+            f.write(yaml.safe_dump(map_form(make_workflow(n_steps)), default_flow_style=False))
+        url = cwl_schema.file_uri(path)
+        options = cwl_schema.prefetch(url)
+        parsed = options.idx[url]
+        docs = [copy.deepcopy(parsed) for _ in range(3)]
+        given = best_of(lambda: cwl_schema.load_document(docs.pop(), url))
+        owned = best_of(lambda: cwl_schema.load_document(url, loadingOptions=options))
+        print('%d steps: copying map entries %.3fs, in place %.3fs, speedup %.1fx'
+              % (n_steps, given, owned, given / owned))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
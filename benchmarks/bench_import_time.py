@@ -0,0 +1,54 @@
+"""
+Measures the time to import cwlpy in a fresh interpreter, with and without
+cached bytecode.
+
+    python benchmarks/bench_import_time.py [runs]
+"""
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_TIME = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)\s*$')
+
+
+def import_time(env, module='cwlpy'):
+    """Cumulative import time of module in microseconds, from -X importtime."""
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                               cwd=ROOT, env=env, stderr=subprocess.PIPE)
+    _, err = process.communicate()
+    for line in err.decode().splitlines():
+        match = IMPORT_TIME.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1))
+    raise RuntimeError(err.decode())
+
+
+def median_import_time(env, runs):
+    times = sorted(import_time(env) for _ in range(runs))
+    return times[len(times) // 2] / 1000.0
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 11
+    cache = tempfile.mkdtemp()
+    try:
+        env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+        env.pop('PYTHONPYCACHEPREFIX', None)
+        uncached = median_import_time(env, runs)
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        import_time(env)  # writes the bytecode
+        cached = median_import_time(env, runs)
+        print('import cwlpy: %.1fms without bytecode, %.1fms with bytecode (median of %d)'
+              % (uncached, cached, runs))
+    finally:
+        shutil.rmtree(cache)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Times saving a workflow built with cwlpy, with an inline tool for every
+step, the first time and then again after each edit to one of its steps,
+when only the edited step is saved again.
+
+    python benchmarks/bench_incremental_save.py [n_steps] [n_edits]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from bench_build_workflow import build  # noqa: E402
+from workflows import make_tool  # noqa: E402
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_edits = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    workflow = build(n_steps)
+    for i, step in enumerate(workflow.steps):
+        step.set_run(cwl_schema.load_document(make_tool(i), 'file:///tmp/tool-%d.cwl' % i))
+
+    start = time.time()
+    workflow.save()
+    cold = time.time() - start
+
+    start = time.time()
+    for i in range(n_edits):
+        workflow.steps[(i * 7919) % n_steps].label = 'edit %d' % i
+        workflow.save()
+    edited = (time.time() - start) / n_edits
+    print('%d steps: first save %.3fs, save after editing one step %.4fs (%.0fx)'
+          % (n_steps, cold, edited, cold / edited))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Times validating a job order with an array of many Files and a few other
+inputs, with the compiled validator and with a naive checker walking the
+schema objects for every value.
+
+    python benchmarks/bench_job_order_validator.py [n_files]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import six
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from cwlpy.validator import job_order_validator, _compile  # noqa: E402
+
+TOOL = """
+class: CommandLineTool
+cwlVersion: v1.0
+baseCommand: index
+inputs:
+  reads: File[]
+  threads: int?
+  sample:
+    type:
+      type: record
+      fields:
+        - {name: name, type: string}
+        - {name: lanes, type: {type: array, items: int}}
+  mode:
+    type:
+      type: enum
+      symbols: [fast, exact]
+outputs: []
+"""
+
+
+def naive_errors(type_, value, path):
+    """The obvious recursive checker, interpreting the schema for every value."""
+    shortname = lambda id: id.split('#')[-1].split('/')[-1]  # noqa: E731
+    if isinstance(type_, list):
+        for alternative in type_:
+            if not naive_errors(alternative, value, path):
+                return []
+        return [path + ': matches none of the types']
+    if type_ == 'null':
+        return [] if value is None else [path + ': expected null']
+    if type_ in ('int', 'long'):
+        ok = isinstance(value, six.integer_types) and not isinstance(value, bool)
+        return [] if ok else [path + ': expected int']
+    if type_ == 'string':
+        return [] if isinstance(value, six.string_types) else [path + ': expected string']
+    if type_ == 'File':
+        ok = isinstance(value, dict) and value.get('class') == 'File' and ('location' in value or 'path' in value)
+        return [] if ok else [path + ': expected File']
+    if type_.type == 'array':
+        if not isinstance(value, list):
+            return [path + ': expected array']
+        errors = []
+        for index, item in enumerate(value):
+            errors.extend(naive_errors(type_.items, item, '%s[%d]' % (path, index)))
+        return errors
+    if type_.type == 'enum':
+        return [] if value in [shortname(s) for s in type_.symbols] else [path + ': not a symbol']
+    if type_.type == 'record':
+        if not isinstance(value, dict):
+            return [path + ': expected record']
+        errors = []
+        for field in type_.fields:
+            name = shortname(field.name)
+            errors.extend(naive_errors(field.type, value.get(name), path + '.' + name))
+        return errors
+    raise ValueError(type_)
+
+
+def naive_validate(tool, job_order):
+    errors = []
+    for parameter in tool.inputs:
+        name = parameter.id.split('#')[-1]
+        errors.extend(naive_errors(parameter.type, job_order.get(name), name))
+    return errors
+
+
+def best_of(repeat, function):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        function()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main():
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'tool.cwl')
+        with open(path, 'w') as f:
+            f.write(TOOL)
+        tool = cwl_schema.load_document(cwl_schema.file_uri(path))
+    finally:
+        shutil.rmtree(directory)
+    job_order = {
+        'reads': [{'class': 'File', 'location': 'file:///data/%d.fastq' % i, 'size': i} for i in range(n_files)],
+        'threads': 8,
+        'sample': {'name': 'sample', 'lanes': [1, 2, 3, 4]},
+        'mode': 'fast',
+    }
+    assert not naive_validate(tool, job_order)
+    job_order_validator(tool)(job_order)
+
+    compile_time = best_of(3, lambda: _compile(tool))
+    naive = best_of(3, lambda: naive_validate(tool, job_order))
+    compiled = best_of(3, lambda: job_order_validator(tool)(job_order))
+    print('%d Files: naive checker %.3fs, compiled validator %.3fs (%.1fx), compiling %.2fms'
+          % (n_files, naive, compiled, naive / compiled, compile_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares loading a packed JSON $graph document through the JSON decoder and
+through the round-trip YAML parser.
+
+    python benchmarks/bench_json_load.py [n_tools]
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from workflows import make_tool  # noqa: E402
+
+
+def time_load(url, track_lines):
+    options = cwl_schema.LoadingOptions(track_lines=track_lines)
+    start = time.time()
+    cwl_schema.load_document(url, loadingOptions=options)
+    return time.time() - start
+
+
+def main():
+    n_tools = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tmpdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmpdir, 'packed.cwl')
+        with open(path, 'w') as f:
+            json.dump({'cwlVersion': 'v1.0', '$graph': [make_tool(i) for i in range(n_tools)]}, f)
+        url = cwl_schema.file_uri(path)
+        yaml_parser = time_load(url, True)
+        json_decoder = time_load(url, False)
+        print('%d tools (%d bytes): YAML parser %.3fs, JSON decoder %.3fs, speedup %.1fx'
+              % (n_tools, os.path.getsize(path), yaml_parser, json_decoder, yaml_parser / json_decoder))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Compares listing the steps of a large workflow with inline tools, loaded
+eagerly and with LoadingOptions(lazy_run=True).
+
+    python benchmarks/bench_lazy_run.py [n_steps]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from workflows import make_workflow  # noqa: E402
+
+
+def measure(doc, lazy_run):
+    tracemalloc.start()
+    start = time.time()
+    workflow = cwl_schema.load_document(doc, 'file:///bench/main.cwl', cwl_schema.LoadingOptions(lazy_run=lazy_run))
+    step_ids = [step.id for step in workflow.steps]
+    elapsed = time.time() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(step_ids) == len(doc['steps'])
+    return elapsed, memory
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    doc = make_workflow(n_steps)
+    eager = measure(doc, False)
+    lazy = measure(doc, True)
+    print('%d steps: eager %.3fs %.1f MB, lazy %.3fs %.1f MB'
+          % (n_steps, eager[0], eager[1] / 1e6, lazy[0], lazy[1] / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Reports the memory held per step by a large workflow with inline tools,
+loaded with cwl_schema, and by one built with the cwlpy builder.
+
+    python benchmarks/bench_memory.py [n_steps]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from bench_build_workflow import build  # noqa: E402
+from workflows import make_workflow  # noqa: E402
+
+
+def held(make):
+    """Bytes allocated by make() that are still held by what it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = make()
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, memory
+
+
+def load(n_steps):
+    # The parsed document is not kept, only what was loaded from it
+    return cwl_schema.load_document(make_workflow(n_steps), 'file:///bench/main.cwl')
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for name, make in (('loaded', lambda: load(n_steps)), ('built', lambda: build(n_steps))):
+        workflow, memory = held(make)
+        assert len(workflow.steps) == n_steps
+        print('%d steps, %-7s %.1f MB, %d bytes per step'
+              % (n_steps, name + ':', memory / 1e6, memory // n_steps))
+        del workflow
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares loading a large workflow file with a cold and a warm ParseCache.
+
+    python benchmarks/bench_parse_cache.py [n_steps]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from workflows import make_workflow_yaml  # noqa: E402
+
+
+def time_load(url, cache):
+    options = cwl_schema.LoadingOptions(parse_cache=cache)
+    start = time.time()
+    cwl_schema.load_document(url, loadingOptions=options)
+    return time.time() - start
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tmpdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmpdir, 'main.cwl')
+        with open(path, 'w') as f:
+            f.write(make_workflow_yaml(n_steps))
+        url = cwl_schema.file_uri(path)
+        cache = cwl_schema.ParseCache(os.path.join(tmpdir, 'cache'))
+        uncached = time_load(url, None)
+        cold = time_load(url, cache)
+        warm = time_load(url, cwl_schema.ParseCache(cache.directory))
+        print('%d steps: no cache %.3fs, cold cache %.3fs, warm cache %.3fs'
+              % (n_steps, uncached, cold, warm))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
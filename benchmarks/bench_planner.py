@@ -0,0 +1,40 @@
+"""
+Times planning generated workflows with varied resource requirements on a
+single machine and on a cluster.
+
+    python benchmarks/bench_planner.py [n_steps]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cwlpy import plan  # noqa: E402
+from bench_workflow_graph import make_workflow  # noqa: E402
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(0)
+    workflow = make_workflow(n_steps)
+    runtimes = {}
+    for step in workflow.steps:
+        step.hints = [{'class': 'ResourceRequirement', 'coresMin': rng.choice([1, 2, 4, 8]),
+                       'ramMin': rng.choice([1024, 4096, 16384])}]
+        runtimes[step.id] = rng.uniform(10, 600)
+    workflow.graph()
+    for name, nodes in [('1 node of 64 cores', [(64, 262144)]),
+                        ('100 nodes of 16 cores', [(16, 65536)] * 100)]:
+        start = time.time()
+        result = plan(workflow, nodes, runtimes)
+        elapsed = time.time() - start
+        print('%d steps on %s: planned in %.3fs, makespan %.0fs, critical path %.0fs, '
+              'core utilization %.0f%%'
+              % (n_steps, name, elapsed, result.makespan, result.critical_path_length,
+                 100 * result.core_utilization))
+
+
+if __name__ == '__main__':
+    main()
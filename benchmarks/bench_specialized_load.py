@@ -0,0 +1,43 @@
+"""
+Compares loading a large workflow with the generic loaders of cwl_schema.py
+and with the loaders specialize_cwl_schema.py generates from them. Both
+still build the same records and expand the same ids, which is most of
+what the specialized loaders take.
+
+    python benchmarks/bench_specialized_load.py [n_steps]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cwl_schema  # noqa: E402
+from specialize_cwl_schema import load_specialized  # noqa: E402
+from workflows import make_workflow  # noqa: E402
+
+
+def time_load(module, doc, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        loaded = module.load_document(doc, 'file:///bench/main.cwl')
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, loaded
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    specialized = load_specialized(os.path.join(ROOT, 'cwl_schema.py'))
+    doc = make_workflow(n_steps)
+    generic_time, generic = time_load(cwl_schema, doc)
+    specialized_time, loaded = time_load(specialized, doc)
+    assert loaded.save() == generic.save()
+    print('%d steps: generic %.3fs, specialized %.3fs, speedup %.1fx'
+          % (n_steps, generic_time, specialized_time, generic_time / specialized_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares loading a large workflow file with and without line tracking.
+
+    python benchmarks/bench_track_lines.py [n_steps]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from workflows import make_workflow_yaml  # noqa: E402
+
+
+def time_load(url, track_lines):
+    options = cwl_schema.LoadingOptions(track_lines=track_lines)
+    start = time.time()
+    cwl_schema.load_document(url, loadingOptions=options)
+    return time.time() - start
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tmpdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmpdir, 'main.cwl')
+        with open(path, 'w') as f:
+            f.write(make_workflow_yaml(n_steps))
+        url = cwl_schema.file_uri(path)
+        tracked = time_load(url, True)
+        plain = time_load(url, False)
+        print('%d steps: track_lines %.3fs, plain %.3fs, speedup %.1fx'
+              % (n_steps, tracked, plain, tracked / plain))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Times loading tools with many parameters, whose types are written in the
+type DSL (File[]?, string?, ...), with and without the resolutions of the
+type DSL remembered, and resolving a list of many types with and without
+leaving out the duplicates by a set.
+
+    python benchmarks/bench_type_dsl.py [n_parameters]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+
+TYPES = ['File', 'File?', 'File[]', 'File[]?', 'string', 'string?', 'string[]', 'int?', 'boolean', 'Directory?']
+
+
+def make_tool(n_parameters):
+    return {
+        'class': 'CommandLineTool',
+        'id': 'tool',
+        'baseCommand': 'tool',
+        'inputs': [{'id': 'input-%d' % i, 'type': TYPES[i % len(TYPES)]} for i in range(n_parameters)],
+        'outputs': [{'id': 'output-%d' % i, 'type': TYPES[i % len(TYPES)]} for i in range(n_parameters)],
+    }
+
+
+def resolve_uncached(loader, doc, baseuri, options):
+    # _TypeDSLLoader.resolve() without its cache
+    m = loader.typeDSLregex.match(doc)
+    if m:
+        first = cwl_schema.expand_url(m.group(1), baseuri, options, False, True, loader.refScope)
+        second = {"type": "array", "items": first} if m.group(2) else None
+        return [u"null", second or first] if m.group(3) else second or first
+    return doc
+
+
+def resolve_all_by_scan(loader, doc, baseuri, options):
+    # _TypeDSLLoader.resolve_all() leaving out duplicates by scanning the result
+    r = []
+    for d in doc:
+        resolved = loader.resolve(d, baseuri, options)
+        for i in (resolved if isinstance(resolved, list) else [resolved]):
+            if i not in r:
+                r.append(i)
+    return r
+
+
+def best_of(function, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        function()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n_parameters = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    doc = make_tool(n_parameters)
+    loader = cwl_schema.typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2
+    baseuris = ['file:///bench/tool.cwl#tool/input-%d' % i for i in range(n_parameters)]
+
+    def resolve(resolve):
+        options = cwl_schema.LoadingOptions()
+        for i, baseuri in enumerate(baseuris):
+            resolve(TYPES[i % len(TYPES)], baseuri, options)
+
+    uncached = best_of(lambda: resolve(lambda *args: resolve_uncached(loader, *args)))
+    cached = best_of(lambda: resolve(loader.resolve))
+    print('%d types: resolved %.3fs, with the cache %.3fs, speedup %.1fx'
+          % (n_parameters, uncached, cached, uncached / cached))
+
+    names = ['Type%d[]?' % i for i in range(n_parameters)]
+    options = cwl_schema.LoadingOptions()
+    scan = best_of(lambda: resolve_all_by_scan(loader, names, baseuris[0], options), repeat=1)
+    by_set = best_of(lambda: loader.resolve_all(names, baseuris[0], options), repeat=1)
+    print('%d types in a list: duplicates left out by scanning %.3fs, by a set %.3fs, speedup %.1fx'
+          % (n_parameters, scan, by_set, scan / by_set))
+
+    load = best_of(lambda: cwl_schema.load_document(doc, 'file:///bench/tool.cwl'))
+    print('%d parameters: tool loaded in %.3fs' % (n_parameters, load))
+
+
+if __name__ == '__main__':
+    main()
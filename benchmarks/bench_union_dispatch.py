@@ -0,0 +1,39 @@
+"""
+Compares loading a large workflow with and without _UnionLoader dispatch.
+
+    python benchmarks/bench_union_dispatch.py [n_steps]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cwl_schema  # noqa: E402
+from ruamel import yaml  # noqa: E402
+from workflows import make_workflow_yaml  # noqa: E402
+
+
+def time_load(doc, union_dispatch, repeat=3):
+    best = None
+    for _ in range(repeat):
+        options = cwl_schema.LoadingOptions(union_dispatch=union_dispatch)
+        start = time.time()
+        cwl_schema.load_document(doc, 'file:///bench/main.cwl', options)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    doc = yaml.round_trip_load(make_workflow_yaml(n_steps))
+    cwl_schema.add_lc_filename(doc, 'file:///bench/main.cwl')
+    linear = time_load(doc, union_dispatch=False)
+    dispatch = time_load(doc, union_dispatch=True)
+    print('%d steps: try-every-alternative %.3fs, dispatch %.3fs, speedup %.1fx'
+          % (n_steps, linear, dispatch, linear / dispatch))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Times building Workflow.graph() and running its analyses on generated
+workflows of growing size, which should scale linearly.
+
+    python benchmarks/bench_workflow_graph.py [max_steps]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cwlpy import Workflow, WorkflowStep  # noqa: E402
+
+
+def make_workflow(n_steps, inputs_per_step=3, seed=0):
+    """Each step reads the output of up to inputs_per_step random earlier steps."""
+    rng = random.Random(seed)
+    workflow = Workflow('main')
+    steps = [WorkflowStep('step-%d' % i, run='tool.cwl') for i in range(n_steps)]
+    for step in steps:
+        workflow.add_step(step)
+    edges = []
+    for i, step in enumerate(steps):
+        for j in range(inputs_per_step):
+            if i:
+                edges.append((steps[rng.randrange(i)], 'output', step, 'input-%d' % j))
+            else:
+                edges.append((None, 'wf-input', step, 'input-%d' % j))
+    workflow.connect_many(edges)
+    return workflow
+
+
+def timed(function, *args):
+    start = time.time()
+    result = function(*args)
+    return result, time.time() - start
+
+
+def main():
+    max_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    n_steps = max_steps
+    sizes = []
+    while n_steps >= 5000 and len(sizes) < 4:
+        sizes.insert(0, n_steps)
+        n_steps //= 2
+    for n_steps in sizes:
+        workflow = make_workflow(n_steps)
+        graph, build = timed(workflow.graph)
+        _, cached = timed(workflow.graph)
+        _, order = timed(graph.topological_order)
+        _, components = timed(graph.components)
+        _, descendants = timed(graph.descendants, 0)
+        _, longest = timed(graph.longest_path)
+        print('%6d steps, %6d edges: build %.3fs, cached %.6fs, topological order %.3fs, '
+              'components %.3fs, descendants %.3fs, longest path %.3fs'
+              % (n_steps, graph.edge_count, build, cached, order, components, descendants, longest))
+
+
+if __name__ == '__main__':
+    main()
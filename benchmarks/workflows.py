@@ -0,0 +1,57 @@
+"""
+Synthetic CWL documents for the benchmarks in this directory.
+"""
+from ruamel import yaml
+
+
+def make_tool(index):
+    return {
+        'class': 'CommandLineTool',
+        'id': 'tool-%d' % index,
+        'baseCommand': ['tool', str(index)],
+        'requirements': [
+            {'class': 'ResourceRequirement', 'coresMin': 1 + index % 4, 'ramMin': 256},
+            {'class': 'DockerRequirement', 'dockerPull': 'example/tool:%d' % index},
+            {'class': 'InlineJavascriptRequirement'},
+        ],
+        'hints': [{'class': 'ResourceRequirement', 'coresMax': 8}],
+        'inputs': [
+            {'id': 'input', 'type': 'File', 'inputBinding': {'position': 1}},
+            {'id': 'flags', 'type': 'string[]?', 'inputBinding': {'prefix': '--flag'}},
+            {'id': 'threads', 'type': 'int?'},
+        ],
+        'outputs': [
+            {'id': 'output', 'type': 'File', 'outputBinding': {'glob': 'out-%d.txt' % index}},
+        ],
+    }
+
+
+def make_workflow(n_steps, inline_tools=True):
+    """
+    A chain-shaped workflow with n_steps steps, each consuming the previous
+    step's output. Returns plain dicts/lists as produced by a JSON parser.
+    """
+    steps = []
+    for i in range(n_steps):
+        source = 'wf-input' if i == 0 else 'step-%d/output' % (i - 1)
+        steps.append({
+            'id': 'step-%d' % i,
+            'run': make_tool(i) if inline_tools else 'tool-%d.cwl' % i,
+            'in': [{'id': 'input', 'source': source}, {'id': 'flags', 'default': ['-v']}],
+            'out': ['output'],
+            'requirements': [{'class': 'ResourceRequirement', 'coresMin': 1}],
+        })
+    return {
+        'class': 'Workflow',
+        'cwlVersion': 'v1.0',
+        'id': 'main',
+        'requirements': [{'class': 'ScatterFeatureRequirement'}],
+        'inputs': [{'id': 'wf-input', 'type': 'File'}],
+        'outputs': [{'id': 'wf-output', 'type': 'File',
+                     'outputSource': 'step-%d/output' % (n_steps - 1)}],
+        'steps': steps,
+    }
+
+
+def make_workflow_yaml(n_steps, inline_tools=True):
+    return yaml.safe_dump(make_workflow(n_steps, inline_tools), default_flow_style=False)
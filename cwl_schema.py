@@ -6,6 +6,7 @@ import ruamel.yaml
 from ruamel.yaml.comments import CommentedBase, CommentedMap, CommentedSeq
 import re
 import os
+import threading
 import traceback
 
 from typing import (Any, AnyStr, Callable, cast, Dict, List, Iterable, Tuple,
@@ -193,52 +194,368 @@ import six
 from six.moves import urllib, StringIO
 import ruamel.yaml as yaml
 import copy
+import errno
 import re
+import sys
 from typing import List, Text, Dict, Union, Any, Sequence
 import uuid
 
 class ValidationException(Exception):
-    pass
+    """
+    The message may be a _DeferredError, which is only formatted into text
+    when the exception is converted to a string.
+    """
+
+    def __str__(self):
+        if self.args and isinstance(self.args[0], _DeferredError):
+            self.args = (self.args[0].render(),) + self.args[1:]
+        return super(ValidationException, self).__str__()
+
+
+class _DeferredError(object):
+    """
+    Structured record of a failed load. Most failures are discarded because
+    a later union alternate succeeds, so formatting is left to render(),
+    which by default gives message as is.
+    """
+
+    message = u""  # type: Text
+
+    def render(self):  # type: () -> Text
+        return self.message
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return repr(self.render())
+
+
+class _Message(_DeferredError):
+    """A message that is %-formatted on demand."""
+
+    def __init__(self, fmt, *args):  # type: (Text, *Any) -> None
+        self.fmt = fmt
+        self.args = args
+
+    def render(self):
+        return self.fmt % self.args
+
+
+class _SourceError(_DeferredError):
+    """
+    Failure of the value at item[key]. Rendered as message (followed by the
+    rendered cause, if any) with the file:line:col lead of that value.
+    """
+
+    def __init__(self, item, key, message, cause=None):
+        # type: (Any, Any, Text, Union[Exception, None]) -> None
+        self.item = item
+        self.key = key
+        self.message = message
+        self.cause = cause
+
+    def position(self):
+        # type: () -> Union[Tuple[Text, int, int], None]
+        """(filename, line, column) of the failing value, 1-based, if known."""
+        if not isinstance(self.item, CommentedBase):
+            return None
+        lc = self.item.lc
+        if lc.data is not None and self.key in lc.data:
+            line, col = lc.data[self.key][0], lc.data[self.key][1]
+        else:
+            line, col = lc.line, lc.col
+        return (getattr(lc, "filename", ""), (line or 0) + 1, (col or 0) + 1)
+
+    def render(self):
+        message = self.message
+        if self.cause is not None:
+            message += six.text_type(self.cause)
+        return SourceLine(self.item, self.key, str).makeError(message)
+
+
+class _RecordError(_DeferredError):
+    """Failures of the fields of one record."""
+
+    def __init__(self, classname, errors):  # type: (Text, List[_SourceError]) -> None
+        self.classname = classname
+        self.errors = errors
+
+    def render(self):
+        return "Trying '%s'\n" % self.classname + "\n".join(six.text_type(e) for e in self.errors)
+
+
+class _ArrayError(_DeferredError):
+    """Failures of the items of a list."""
+
+    def __init__(self, errors):  # type: (List[_SourceError]) -> None
+        self.errors = errors
+
+    def render(self):
+        return "\n".join(six.text_type(e) for e in self.errors)
+
+
+class _UnionError(_DeferredError):
+    """Every alternate of a union failed; causes[i] is why alternates[i] did."""
+
+    def __init__(self, alternates, causes):  # type: (Sequence[_Loader], List[Exception]) -> None
+        self.alternates = alternates
+        self.causes = causes
+
+    def render(self):
+        return bullets(["tried %s but\n%s" % (t, indent(six.text_type(e)))
+                        for t, e in zip(self.alternates, self.causes)], "- ")
+
+class _NoExtensionFields(dict):
+    """
+    The extension_fields of every record loaded without any. Being shared,
+    it cannot be changed: assign a dict of its own to the record instead.
+    """
+    __slots__ = ()
+
+    def _unchangeable(self, *args, **kwargs):
+        raise TypeError("extension_fields of a record without any are shared, assign a new dict instead")
+
+    __setitem__ = __delitem__ = __ior__ = _unchangeable
+    clear = pop = popitem = setdefault = update = _unchangeable
+
+
+_NO_EXTENSION_FIELDS = _NoExtensionFields()
+
 
 class Savable(object):
-    pass
+    __slots__ = ('__weakref__',)
+
+    # Kept by the classes given to cache_saves(), see there
+    _saved = None
+    _save_parents = ()
+    _save_token = None
+    _save_shared = False
+
+    def mark_dirty(self):  # type: () -> None
+        """
+        Drops the save() result cached by this object, and by every object
+        it was last saved as a part of, so that the next save() of any of
+        them rebuilds it.
+        """
+        stack = [self]
+        seen = set()
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            # Objects being copied or unpickled may not have their slots yet
+            if getattr(obj, '_saved', None) is not None:
+                obj._saved = None
+            stack.extend(getattr(obj, '_save_parents', ()))
+
+
+# What the objects of cache_saves() classes keep, with their defaults in Savable
+SAVE_CACHE_SLOTS = ('_saved', '_save_parents', '_save_token', '_save_shared')
+
+_saving_state = threading.local()
+
+
+def _saving():  # type: () -> List[Tuple[Savable, object, set]]
+    # (object, token, built) of the objects of cache_saves() classes this
+    # thread is saving, innermost last: built holds the ids of the dicts and
+    # lists that saving the object has built so far, see _fresh_copy()
+    try:
+        return _saving_state.stack
+    except AttributeError:
+        _saving_state.stack = []
+        return _saving_state.stack
+
+
+def _add_save_parent(obj, parent, token):
+    # An object saved twice as a part of one parent, or as a part of two,
+    # would make its cached result appear twice in the parent's: YAML writes
+    # that as an anchor and an alias. Such objects are rebuilt every time.
+    if obj._save_token is token:
+        obj._save_shared = True
+    obj._save_token = token
+    if not obj._save_parents:
+        obj._save_parents = [parent]
+    elif not any(known is parent for known in obj._save_parents):
+        obj._save_parents.append(parent)
+        obj._save_shared = True
+    if obj._save_shared:
+        obj._saved = None
+
+
+def _fresh_copy(value, built):
+    # value, built by save(), with the dicts and lists whose ids are in built
+    # copied, and everything else, as the values of fields that save()
+    # returns as they are, shared
+    if isinstance(value, dict):
+        return {k: _fresh_copy(v, built) if id(v) in built else v for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fresh_copy(v, built) if id(v) in built else v for v in value]
+    return value
+
+
+def _caching_save(save):
+    def caching_save(self, top=False):
+        saving = _saving()
+        if saving:
+            _add_save_parent(self, *saving[-1][:2])
+        # (top, result, the ids of the dicts and lists it was built of)
+        saved = self._saved
+        if saved is None or saved[0] != top:
+            built = set()  # type: set
+            saving.append((self, object(), built))
+            try:
+                result = save(self, top)
+            finally:
+                saving.pop()
+            built.add(id(result))
+            saved = (top, result, built)
+            if not self._save_shared:
+                self._saved = saved
+            elif not saving:
+                return result
+        if saving:
+            # A part of what is being saved, which the outermost save() copies
+            saving[-1][2].update(saved[2])
+            return saved[1]
+        return _fresh_copy(saved[1], saved[2])
+    caching_save.__name__ = save.__name__
+    caching_save.__doc__ = save.__doc__
+    caching_save.__wrapped__ = save
+    return caching_save
+
+
+def _initializing_save_cache(init):
+    def initializing_save_cache(self, *args, **kwargs):
+        for name in SAVE_CACHE_SLOTS:
+            object.__setattr__(self, name, getattr(Savable, name))
+        init(self, *args, **kwargs)
+    initializing_save_cache.__name__ = init.__name__
+    initializing_save_cache.__doc__ = init.__doc__
+    return initializing_save_cache
+
+
+def _dirtying_setattr(self, name, value):
+    object.__setattr__(self, name, value)
+    if not name.startswith('_') and name != 'loadingOptions':
+        self.mark_dirty()
+
+
+def cache_saves(cls):
+    """
+    Class decorator making the objects of cls, a subclass of a generated
+    record class, keep the result of their last save() and return it again
+    until they are marked dirty. Setting any of their fields marks them dirty,
+    and with them every object of such a class that they were saved as a part
+    of, so that saving again only rebuilds the records on the way to what
+    changed. Objects that are a part of more than one record, or twice of
+    one, are not cached.
+
+    Only setting a field is noticed. Changing the value of a field in place,
+    as obj.hints.append(...), obj.requirements[0] = ... or setting a field of
+    a record class without cache_saves(), is not, and save() keeps returning
+    the result from before the change: callers that do so must call
+    mark_dirty() on the record holding the changed value. The id-indexed
+    lists of the cwlpy builders are the exception, they mark their record
+    dirty themselves.
+
+    save() returns a copy of the dicts and lists of the cached result, which
+    the caller may change. The cached result is that of the last save(top)
+    with the same top. If cls has __slots__, they must
+    include SAVE_CACHE_SLOTS.
+    """
+    cls.__init__ = _initializing_save_cache(six.get_unbound_function(cls.__init__))
+    cls.save = _caching_save(six.get_unbound_function(cls.save))
+    cls.__setattr__ = _dirtying_setattr
+    return cls
+
+def _default_fetcher():
+    import requests
+    from cachecontrol.wrapper import CacheControl
+    from cachecontrol.caches import FileCache
+    from schema_salad.ref_resolver import DefaultFetcher
+    if "HOME" in os.environ:
+        session = CacheControl(
+            requests.Session(),
+            cache=FileCache(os.path.join(os.environ["HOME"], ".cache", "salad")))
+    elif "TMP" in os.environ:
+        session = CacheControl(
+            requests.Session(),
+            cache=FileCache(os.path.join(os.environ["TMP"], ".cache", "salad")))
+    else:
+        session = CacheControl(
+            requests.Session(),
+            cache=FileCache("/tmp", ".cache", "salad"))
+    return DefaultFetcher({}, session)
+
+def _default_urljoin(base_url, url):  # type: (Text, Text) -> Text
+    # DefaultFetcher.urljoin, for POSIX paths
+    if url.startswith("_:"):
+        return url
+    basesplit = urllib.parse.urlsplit(base_url)
+    split = urllib.parse.urlsplit(url)
+    if basesplit.scheme and basesplit.scheme != "file" and split.scheme == "file":
+        raise ValidationException(
+            "Not resolving potential remote exploit %s from base %s" % (url, base_url))
+    return urllib.parse.urljoin(base_url, url)
 
 class LoadingOptions(object):
-    def __init__(self, fetcher=None, namespaces=None, fileuri=None, copyfrom=None, schemas=None):
+    def __init__(self, fetcher=None, namespaces=None, fileuri=None, copyfrom=None, schemas=None,
+                 union_dispatch=None, parse_cache=None, track_lines=None, lazy_run=None,
+                 owns_documents=None):
         if copyfrom is not None:
             self.idx = copyfrom.idx
+            self.includes = copyfrom.includes
+            self.owned = copyfrom.owned
             if fetcher is None:
-                fetcher = copyfrom.fetcher
+                # Share the fetcher with copyfrom, creating it there on
+                # first use if neither has done so yet
+                self._fetcher_source = copyfrom
             if fileuri is None:
                 fileuri = copyfrom.fileuri
             if namespaces is None:
                 namespaces = copyfrom.namespaces
             if namespaces is None:
                 schemas = copyfrom.schemas
+            if union_dispatch is None:
+                union_dispatch = copyfrom.union_dispatch
+            if parse_cache is None:
+                parse_cache = copyfrom.parse_cache
+            if track_lines is None:
+                track_lines = copyfrom.track_lines
+            if lazy_run is None:
+                lazy_run = copyfrom.lazy_run
+            if owns_documents is None:
+                owns_documents = copyfrom.owns_documents
         else:
             self.idx = {}
-
-        if fetcher is None:
-            import os
-            import requests
-            from cachecontrol.wrapper import CacheControl
-            from cachecontrol.caches import FileCache
-            from schema_salad.ref_resolver import DefaultFetcher
-            if "HOME" in os.environ:
-                session = CacheControl(
-                    requests.Session(),
-                    cache=FileCache(os.path.join(os.environ["HOME"], ".cache", "salad")))
-            elif "TMP" in os.environ:
-                session = CacheControl(
-                    requests.Session(),
-                    cache=FileCache(os.path.join(os.environ["TMP"], ".cache", "salad")))
-            else:
-                session = CacheControl(
-                    requests.Session(),
-                    cache=FileCache("/tmp", ".cache", "salad"))
-            self.fetcher = DefaultFetcher({}, session)
-        else:
-            self.fetcher = fetcher
+            self.includes = {}  # type: Dict[Text, Text]
+            # The URLs in idx of the documents parsed here that have no YAML
+            # aliases, so that no part of them is in two places
+            self.owned = set()  # type: set
+        if fetcher is not None or copyfrom is None:
+            self._fetcher_source = None
+        # Created on first use, see the fetcher property
+        self._fetcher = fetcher
+
+        self.parse_cache = parse_cache  # type: Union[ParseCache, None]
+        # Whether to parse fetched documents with the round-trip loader, which
+        # records the line/column of every node for error messages, as by
+        # default. When False, JSON is parsed with the JSON decoder and YAML
+        # with the (C accelerated, if available) safe loader, which produce
+        # plain dicts and lists instead: much faster, but errors carry no
+        # positions.
+        self.track_lines = True if track_lines is None else track_lines  # type: bool
+        # Load WorkflowStep.run as a LazyProcess
+        self.lazy_run = bool(lazy_run)
+        # Whether the document being loaded is one of owned, which
+        # _IdMapLoader then changes in place instead of copying its entries
+        self.owns_documents = bool(owns_documents)
+
+        # When set, _UnionLoader only tries the alternates that can possibly
+        # accept a document, see _UnionLoader.candidates()
+        self.union_dispatch = True if union_dispatch is None else union_dispatch
 
         self.fileuri = fileuri
 
@@ -247,30 +564,112 @@ class LoadingOptions(object):
         self.namespaces = namespaces
         self.schemas = schemas
 
-        if namespaces is not None:
-            self.vocab = self.vocab.copy()
-            self.rvocab = self.rvocab.copy()
-            for k,v in six.iteritems(namespaces):
-                self.vocab[k] = v
-                self.rvocab[v] = k
+        if copyfrom is not None and fetcher is None and namespaces is copyfrom.namespaces:
+            # Same vocabulary and fetcher, so expand_url() gives the same results
+            self.vocab = copyfrom.vocab
+            self.rvocab = copyfrom.rvocab
+            self.url_cache = copyfrom.url_cache
+        else:
+            if namespaces is not None:
+                self.vocab = self.vocab.copy()
+                self.rvocab = self.rvocab.copy()
+                for k,v in six.iteritems(namespaces):
+                    self.vocab[k] = v
+                    self.rvocab[v] = k
+            self.url_cache = ExpandUrlCache()
+
+    @property
+    def fetcher(self):
+        """The fetcher, creating the default one on first use: importing
+        requests and cachecontrol and opening the HTTP cache is the costly
+        part of a LoadingOptions, and documents built in memory never
+        fetch anything."""
+        if self._fetcher is None:
+            if self._fetcher_source is not None:
+                self._fetcher = self._fetcher_source.fetcher
+            else:
+                self._fetcher = _default_fetcher()
+        return self._fetcher
+
+    @fetcher.setter
+    def fetcher(self, fetcher):
+        self._fetcher = fetcher
+
+    def _existing_fetcher(self):
+        options = self
+        while options._fetcher is None and options._fetcher_source is not None:
+            options = options._fetcher_source
+        return options._fetcher
+
+    def urljoin(self, base_url, url):  # type: (Text, Text) -> Text
+        """fetcher.urljoin(base_url, url), without creating the default
+        fetcher just for this."""
+        fetcher = self._existing_fetcher()
+        if fetcher is None:
+            if sys.platform == "win32":
+                return self.fetcher.urljoin(base_url, url)
+            return _default_urljoin(base_url, url)
+        return fetcher.urljoin(base_url, url)
 
 
 
 def load_field(val, fieldtype, baseuri, loadingOptions):
     if isinstance(val, dict):
         if "$import" in val:
-            return _document_load_by_url(fieldtype, loadingOptions.fetcher.urljoin(loadingOptions.fileuri, val["$import"]), loadingOptions)
+            return _document_load_by_url(fieldtype, loadingOptions.urljoin(loadingOptions.fileuri, val["$import"]), loadingOptions)
         elif "$include" in val:
-            val = loadingOptions.fetcher.fetch_text(loadingOptions.fetcher.urljoin(loadingOptions.fileuri, val["$include"]))
+            url = loadingOptions.urljoin(loadingOptions.fileuri, val["$include"])
+            if url in loadingOptions.includes:
+                val = loadingOptions.includes[url]
+            else:
+                val = loadingOptions.fetcher.fetch_text(url)
     return fieldtype.load(val, baseuri, loadingOptions)
 
 
 def save(val, top=True):
     if isinstance(val, Savable):
-        return val.save(top=top)
-    if isinstance(val, list):
-        return [save(v, top=False) for v in val]
-    return val
+        r = val.save(top=top)
+    elif isinstance(val, list):
+        r = [save(v, top=False) for v in val]
+    else:
+        return val
+    saving = _saving()
+    if saving:
+        saving[-1][2].add(id(r))
+    return r
+
+class ExpandUrlCache(object):
+    """
+    Memo of expand_url() results, shared by the LoadingOptions that have the
+    same vocabulary and fetcher. Holds at most max_entries results, base
+    URLs and parsed type DSL strings (see _TypeDSLLoader.resolve()),
+    starting over when full; 0 disables it.
+    """
+
+    def __init__(self, max_entries=65536):  # type: (int) -> None
+        self.max_entries = max_entries
+        self.results = {}  # type: Dict[Tuple[Text, Text, bool, bool, Union[int, None]], Text]
+        self.bases = {}  # type: Dict[Text, Any]
+        self.types = {}  # type: Dict[Text, Tuple]
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):  # type: () -> float
+        total = self.hits + self.misses
+        return float(self.hits) / total if total else 0.0
+
+    def split_base(self, base_url):  # type: (Text) -> Any
+        """urllib.parse.urlsplit(base_url), remembered."""
+        split = self.bases.get(base_url)
+        if split is None:
+            split = urllib.parse.urlsplit(base_url)
+            if self.max_entries:
+                if len(self.bases) >= self.max_entries:
+                    self.bases.clear()
+                self.bases[base_url] = split
+        return split
+
 
 def expand_url(url,                 # type: Union[str, Text]
                base_url,            # type: Union[str, Text]
@@ -284,13 +683,26 @@ def expand_url(url,                 # type: Union[str, Text]
     if not isinstance(url, six.string_types):
         return url
 
-    url = Text(url)
-
-    if url in (u"@id", u"@type"):
-        return url
-
-    if vocab_term and url in loadingOptions.vocab:
-        return url
+    if url in (u"@id", u"@type") or (vocab_term and url in loadingOptions.vocab):
+        return Text(url)
+
+    cache = loadingOptions.url_cache
+    if not cache.max_entries:
+        return _expand_url(Text(url), base_url, loadingOptions, scoped_id, vocab_term, scoped_ref)
+    key = (url, base_url, scoped_id, vocab_term, scoped_ref)
+    result = cache.results.get(key)
+    if result is not None:
+        cache.hits += 1
+        return result
+    cache.misses += 1
+    result = _expand_url(Text(url), base_url, loadingOptions, scoped_id, vocab_term, scoped_ref)
+    if len(cache.results) >= cache.max_entries:
+        cache.results.clear()
+    cache.results[key] = result
+    return result
+
+def _expand_url(url, base_url, loadingOptions, scoped_id, vocab_term, scoped_ref):
+    # type: (Text, Text, LoadingOptions, bool, bool, Union[int, None]) -> Text
 
     if bool(loadingOptions.vocab) and u":" in url:
         prefix = url.split(u":")[0]
@@ -303,7 +715,7 @@ def expand_url(url,                 # type: Union[str, Text]
         or url.startswith(u"${")):
         pass
     elif scoped_id and not bool(split.fragment):
-        splitbase = urllib.parse.urlsplit(base_url)
+        splitbase = loadingOptions.url_cache.split_base(base_url)
         frg = u""
         if bool(splitbase.fragment):
             frg = splitbase.fragment + u"/" + split.path
@@ -313,7 +725,7 @@ def expand_url(url,                 # type: Union[str, Text]
         url = urllib.parse.urlunsplit(
             (splitbase.scheme, splitbase.netloc, pt, splitbase.query, frg))
     elif scoped_ref is not None and not bool(split.fragment):
-        splitbase = urllib.parse.urlsplit(base_url)
+        splitbase = loadingOptions.url_cache.split_base(base_url)
         sp = splitbase.fragment.split(u"/")
         n = scoped_ref
         while n > 0 and len(sp) > 0:
@@ -324,7 +736,7 @@ def expand_url(url,                 # type: Union[str, Text]
             splitbase.scheme, splitbase.netloc, splitbase.path, splitbase.query,
             u"/".join(sp)))
     else:
-        url = loadingOptions.fetcher.urljoin(base_url, url)
+        url = loadingOptions.urljoin(base_url, url)
 
     if vocab_term:
         split = urllib.parse.urlsplit(url)
@@ -337,11 +749,17 @@ def expand_url(url,                 # type: Union[str, Text]
     return url
 
 
+
 class _Loader(object):
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, Text, LoadingOptions, Union[Text, None]) -> Any
         pass
 
+    def accepts(self):
+        # type: () -> Union[Tuple[type, ...], None]
+        """Python types this loader can possibly succeed on, None if unknown."""
+        return None
+
 class _AnyLoader(_Loader):
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if doc is not None:
@@ -355,9 +773,12 @@ class _PrimitiveLoader(_Loader):
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if not isinstance(doc, self.tp):
-            raise ValidationException("Expected a %s but got %s" % (self.tp, type(doc)))
+            raise ValidationException(_Message("Expected a %s but got %s", self.tp, type(doc)))
         return doc
 
+    def accepts(self):
+        return self.tp if isinstance(self.tp, tuple) else (self.tp,)
+
     def __repr__(self):
         return str(self.tp)
 
@@ -365,25 +786,40 @@ class _ArrayLoader(_Loader):
     def __init__(self, items):
         # type: (_Loader) -> None
         self.items = items
+        # What each element is loaded with: nested lists are flattened
+        self.nested = _UnionLoader((self, items))
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if not isinstance(doc, list):
             raise ValidationException("Expected a list")
         r = []
         errors = []
-        for i in range(0, len(doc)):
+        items = self.items
+        for i, val in enumerate(doc):
             try:
-                lf = load_field(doc[i], _UnionLoader((self, self.items)), baseuri, loadingOptions)
+                if isinstance(val, list) or (isinstance(val, dict) and ("$import" in val or "$include" in val)):
+                    lf = load_field(val, self.nested, baseuri, loadingOptions)
+                else:
+                    # As self.nested.load() would, self failing on anything
+                    # but a list
+                    try:
+                        lf = items.load(val, baseuri, loadingOptions)
+                    except ValidationException as e:
+                        raise ValidationException(_UnionError(
+                            self.nested.alternates, [ValidationException("Expected a list"), e]))
                 if isinstance(lf, list):
                     r.extend(lf)
                 else:
                     r.append(lf)
             except ValidationException as e:
-                errors.append(SourceLine(doc, i, str).makeError(six.text_type(e)))
+                errors.append(_SourceError(doc, i, u"", e))
         if errors:
-            raise ValidationException("\n".join(errors))
+            raise ValidationException(_ArrayError(errors))
         return r
 
+    def accepts(self):
+        return (list,)
+
     def __repr__(self):
         return "array<%s>" % self.items
 
@@ -396,36 +832,115 @@ class _EnumLoader(_Loader):
         if doc in self.symbols:
             return doc
         else:
-            raise ValidationException("Expected one of %s" % (self.symbols,))
+            raise ValidationException(_Message("Expected one of %s", self.symbols))
+
+    def accepts(self):
+        return six.string_types
 
 
 class _RecordLoader(_Loader):
-    def __init__(self, classtype):
-        # type: (type) -> None
+    def __init__(self, classtype, discriminator=None):
+        # type: (type, Union[Tuple[Text, Text], None]) -> None
         self.classtype = classtype
+        # (field, value) pair that every valid document of this record must
+        # carry, e.g. ('class', 'Workflow') or ('type', 'record')
+        self.discriminator = discriminator
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if not isinstance(doc, dict):
             raise ValidationException("Expected a dict")
         return self.classtype(doc, baseuri, loadingOptions, docRoot=docRoot)
 
+    def accepts(self):
+        return (dict,)
+
     def __repr__(self):
         return str(self.classtype)
 
 
 class _UnionLoader(_Loader):
+    discriminator_fields = ('class', 'type')
+
     def __init__(self, alternates):
         # type: (Sequence[_Loader]) -> None
         self.alternates = alternates
+        self._dispatch = {}  # type: Dict[Any, Sequence[_Loader]]
+        self._known = None   # type: Union[Dict[Text, frozenset], None]
+
+    def candidates(self, doc):
+        # type: (Any) -> Sequence[_Loader]
+        """
+        The alternates that could possibly load doc, in their original order.
+
+        Alternates are ruled out by the Python type of doc and, for mappings,
+        by a `class`/`type` discriminator that names a different record.
+        Returns self.alternates itself when nothing can be ruled out.
+        """
+        if self._known is None:
+            known = {}  # type: Dict[Text, set]
+            for t in self.alternates:
+                d = getattr(t, "discriminator", None)
+                if d is not None:
+                    known.setdefault(d[0], set()).add(d[1])
+            self._known = {k: frozenset(v) for k, v in six.iteritems(known)}
+
+        tp = type(doc)
+        key = tp  # type: Any
+        if isinstance(doc, dict) and self._known:
+            values = []
+            for field in self.discriminator_fields:
+                v = doc.get(field)
+                values.append(v if isinstance(v, six.string_types) and v in self._known.get(field, ()) else None)
+            key = (tp,) + tuple(values)
+        try:
+            return self._dispatch[key]
+        except KeyError:
+            pass
+
+        found = {}  # type: Dict[Text, Text]
+        if key is not tp:
+            found = {f: v for f, v in zip(self.discriminator_fields, key[1:]) if v is not None}
+        r = []
+        for t in self.alternates:
+            accepted = t.accepts()
+            if accepted is not None and not issubclass(tp, accepted):
+                continue
+            d = getattr(t, "discriminator", None)
+            if d is not None and d[0] in found and found[d[0]] != d[1]:
+                continue
+            r.append(t)
+        result = self.alternates if len(r) == len(self.alternates) else tuple(r)
+        self._dispatch[key] = result
+        return result
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
+        if loadingOptions.union_dispatch:
+            candidates = self.candidates(doc)
+            if candidates is not self.alternates:
+                for t in candidates:
+                    try:
+                        return t.load(doc, baseuri, loadingOptions, docRoot=docRoot)
+                    except ValidationException:
+                        pass
+                # Nothing matched; go through every alternate so that the
+                # error is the same as without dispatch.
+
         errors = []
         for t in self.alternates:
             try:
                 return t.load(doc, baseuri, loadingOptions, docRoot=docRoot)
             except ValidationException as e:
-                errors.append("tried %s but\n%s" % (t, indent(str(e))))
-        raise ValidationException(bullets(errors, "- "))
+                errors.append(e)
+        raise ValidationException(_UnionError(self.alternates, errors))
+
+    def accepts(self):
+        r = []
+        for t in self.alternates:
+            accepted = t.accepts()
+            if accepted is None:
+                return None
+            r.extend(accepted)
+        return tuple(r)
 
     def __repr__(self):
         return " | ".join(str(a) for a in self.alternates)
@@ -447,6 +962,20 @@ class _URILoader(_Loader):
                              self.scoped_id, self.vocab_term, self.scoped_ref)
         return self.inner.load(doc, baseuri, loadingOptions)
 
+    def accepts(self):
+        return self.inner.accepts()
+
+def _type_key(t):
+    # A hashable stand-in for t, equal for types that are equal, when t is
+    # a name or an array of a name, as _TypeDSLLoader.resolve() returns
+    if isinstance(t, six.string_types):
+        return t
+    if isinstance(t, dict) and len(t) == 2 and t.get("type") == "array" and \
+            isinstance(t.get("items"), six.string_types):
+        return ("array", t["items"])
+    return None
+
+
 class _TypeDSLLoader(_Loader):
     typeDSLregex = re.compile(u"^([^[?]+)(\[\])?(\?)?$")
 
@@ -456,42 +985,56 @@ class _TypeDSLLoader(_Loader):
         self.refScope = refScope
 
     def resolve(self, doc, baseuri, loadingOptions):
-        m = self.typeDSLregex.match(doc)
-        if m:
-            first = expand_url(m.group(1), baseuri, loadingOptions, False, True, self.refScope)
-            second = third = None
-            if bool(m.group(2)):
-                second = {"type": "array", "items": first}
-                #second = CommentedMap((("type", "array"),
-                #                       ("items", first)))
-                #second.lc.add_kv_line_col("type", lc)
-                #second.lc.add_kv_line_col("items", lc)
-                #second.lc.filename = filename
-            if bool(m.group(3)):
-                third = [u"null", second or first]
-                #third = CommentedSeq([u"null", second or first])
-                #third.lc.add_kv_line_col(0, lc)
-                #third.lc.add_kv_line_col(1, lc)
-                #third.lc.filename = filename
-            doc = third or second or first
-        return doc
+        # The name, whether it is an array and whether it is optional, by
+        # doc: () if doc is not in the type DSL. Only names that are not in
+        # the vocabulary depend on baseuri, and expand_url() remembers those.
+        cache = loadingOptions.url_cache
+        parts = cache.types.get(doc)
+        if parts is None:
+            m = self.typeDSLregex.match(doc)
+            parts = (m.group(1), bool(m.group(2)), bool(m.group(3))) if m else ()
+            if cache.max_entries:
+                if len(cache.types) >= cache.max_entries:
+                    cache.types.clear()
+                cache.types[doc] = parts
+        if not parts:
+            return doc
+        name, array, optional = parts
+        if name in loadingOptions.vocab:
+            first = name
+        else:
+            first = expand_url(name, baseuri, loadingOptions, False, True, self.refScope)
+        # Fresh containers: the loaders may hold on to them
+        second = {"type": "array", "items": first} if array else None
+        if optional:
+            return [u"null", second or first]
+        return second or first
+
+    def resolve_all(self, doc, baseuri, loadingOptions):
+        """
+        doc, a list, with its strings resolved, leaving out the types they
+        resolve to that are already in it.
+        """
+        r = []
+        seen = set()
+        for d in doc:
+            if isinstance(d, six.string_types):
+                resolved = self.resolve(d, baseuri, loadingOptions)
+                for i in (resolved if isinstance(resolved, list) else (resolved,)):
+                    k = _type_key(i)
+                    if k not in seen:
+                        seen.add(k)
+                        r.append(i)
+            else:
+                k = _type_key(d)
+                if k is not None:
+                    seen.add(k)
+                r.append(d)
+        return r
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if isinstance(doc, list):
-            r = []
-            for d in doc:
-                if isinstance(d, six.string_types):
-                    resolved = self.resolve(d, baseuri, loadingOptions)
-                    if isinstance(resolved, list):
-                        for i in resolved:
-                            if i not in r:
-                                r.append(i)
-                    else:
-                        if resolved not in r:
-                            r.append(resolved)
-                else:
-                    r.append(d)
-            doc = r
+            doc = self.resolve_all(doc, baseuri, loadingOptions)
         elif isinstance(doc, six.string_types):
             doc = self.resolve(doc, baseuri, loadingOptions)
 
@@ -511,10 +1054,14 @@ class _IdMapLoader(_Loader):
             for k in sorted(doc.keys()):
                 val = doc[k]
                 if isinstance(val, dict):
-                    v = copy.copy(val)
-                    if hasattr(val, 'lc'):
-                        v.lc.data = val.lc.data
-                        v.lc.filename = val.lc.filename
+                    if loadingOptions.owns_documents:
+                        # Always given k as its subject, wherever it is loaded from
+                        v = val
+                    else:
+                        v = copy.copy(val)
+                        if hasattr(val, 'lc'):
+                            v.lc.data = val.lc.data
+                            v.lc.filename = val.lc.filename
                 else:
                     if self.mapPredicate:
                         v = {self.mapPredicate: val}
@@ -526,9 +1073,96 @@ class _IdMapLoader(_Loader):
         return self.inner.load(doc, baseuri, loadingOptions)
 
 
+class _LazyProcessLoader(_Loader):
+    def __init__(self, inner, process, document):
+        # type: (_URILoader, _Loader, _Loader) -> None
+        self.inner = inner
+        self.process = process    # loads an inline process
+        self.document = document  # loads a document with one or more processes
+
+    def load(self, doc, baseuri, loadingOptions, docRoot=None):
+        if not loadingOptions.lazy_run:
+            return self.inner.load(doc, baseuri, loadingOptions, docRoot=docRoot)
+        if isinstance(doc, six.string_types):
+            url = expand_url(doc, baseuri, loadingOptions, self.inner.scoped_id,
+                             self.inner.vocab_term, self.inner.scoped_ref)
+            return LazyProcess(self.document, loadingOptions, url=url)
+        if isinstance(doc, dict):
+            return LazyProcess(self.process, loadingOptions, doc=doc, baseuri=baseuri)
+        return self.inner.load(doc, baseuri, loadingOptions, docRoot=docRoot)
+
+    def __repr__(self):
+        return repr(self.inner)
+
+
+class LazyProcess(Savable):
+    """
+    Stand-in for the process of a WorkflowStep.run, loaded with
+    LoadingOptions(lazy_run=True). The CommandLineTool, ExpressionTool or
+    Workflow is only loaded and validated when one of its attributes is
+    first accessed, or by resolve().
+
+    A reference by URL is loaded once per LoadingOptions.idx and saves as
+    the URL, like the string it replaces; an inline process saves as the
+    loaded process.
+    """
+
+    __slots__ = ('loader', 'loadingOptions', 'url', 'doc', 'baseuri', 'process')
+
+    def __init__(self, loader, loadingOptions, url=None, doc=None, baseuri=None):
+        # type: (_Loader, LoadingOptions, Union[Text, None], Any, Union[Text, None]) -> None
+        self.loader = loader
+        self.loadingOptions = loadingOptions
+        self.url = url
+        self.doc = doc
+        self.baseuri = baseuri
+        self.process = None  # type: Any
+
+    @property
+    def loaded(self):  # type: () -> bool
+        return self.process is not None
+
+    def resolve(self):  # type: () -> Any
+        if self.process is not None:
+            return self.process
+        if self.url is None:
+            self.process = self.loader.load(self.doc, self.baseuri, self.loadingOptions)
+            self.doc = None
+            return self.process
+        idx = self.loadingOptions.idx
+        key = (LazyProcess, "process", self.url)
+        if key not in idx:
+            docurl, frag = urllib.parse.urldefrag(self.url)
+            dockey = (LazyProcess, "document", docurl)
+            if dockey not in idx:
+                idx[dockey] = _document_load_by_url(self.loader, docurl, self.loadingOptions)
+            loaded = idx[dockey]
+            if isinstance(loaded, list):
+                matches = [p for p in loaded if p.id == self.url or (not frag and p.id == docurl + u"#main")]
+                if not matches:
+                    raise ValidationException("No process with id %s in %s" % (self.url, docurl))
+                loaded = matches[0]
+            idx[key] = loaded
+        self.process = idx[key]
+        return self.process
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def save(self, top=False):
+        if self.url is not None:
+            return self.url
+        return self.resolve().save(top=top)
+
+    def __repr__(self):
+        return "LazyProcess(%s)" % (self.url if self.url is not None else "<inline>")
+
+
 def _document_load(loader, doc, baseuri, loadingOptions):
     if isinstance(doc, six.string_types):
-        return _document_load_by_url(loader, loadingOptions.fetcher.urljoin(baseuri, doc), loadingOptions)
+        return _document_load_by_url(loader, loadingOptions.urljoin(baseuri, doc), loadingOptions)
 
     if isinstance(doc, dict):
         if "$namespaces" in doc:
@@ -553,34 +1187,286 @@ def _document_load(loader, doc, baseuri, loadingOptions):
     raise ValidationException()
 
 
-def _document_load_by_url(loader, url, loadingOptions):
-    if url in loadingOptions.idx:
-        return _document_load(loader, loadingOptions.idx[url], url, loadingOptions)
+_schema_digest = None  # type: Union[Text, None]
 
-    text = loadingOptions.fetcher.fetch_text(url)
+def schema_digest():  # type: () -> Text
+    """Digest of this module's source, which changes whenever it is regenerated."""
+    global _schema_digest
+    if _schema_digest is None:
+        import hashlib
+        source = os.path.splitext(__file__)[0] + ".py"
+        with open(source, "rb") as f:
+            _schema_digest = hashlib.sha1(f.read()).hexdigest()
+    return _schema_digest
+
+
+class ParseCache(object):
+    """
+    Directory of parsed documents shared between processes.
+
+    Entries are the parsed YAML (with line/column information) pickled under
+    a name derived from the document URL, its text and schema_digest(), so a
+    changed document or a regenerated cwl_schema never hits a stale entry.
+    Entries are written to a temporary file and renamed into place, so
+    concurrent readers see either a whole entry or none. Once the directory
+    grows past max_bytes, the least recently used entries are removed.
+
+    Entries are unpickled, so the directory must only be writable by
+    trusted users.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        # type: (Text, int) -> None
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def path(self, url, text, variant=""):
+        # type: (Text, Union[Text, bytes], Text) -> Text
+        import hashlib
+        if not isinstance(text, bytes):
+            text = text.encode("utf-8")
+        h = hashlib.sha256()
+        for part in (schema_digest(), variant, url, relname(url)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        h.update(text)
+        return os.path.join(self.directory, h.hexdigest() + self.suffix)
+
+    def get(self, url, text, variant=""):
+        # type: (Text, Union[Text, bytes], Text) -> Any
+        from six.moves import cPickle as pickle
+        path = self.path(url, text, variant)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass  # evicted by another process meanwhile
+        self.hits += 1
+        return result
+
+    def put(self, url, text, result, variant=""):
+        # type: (Text, Union[Text, bytes], Any, Text) -> None
+        import tempfile
+        from six.moves import cPickle as pickle
+        path = self.path(url, text, variant)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+            getattr(os, "replace", os.rename)(tmp, path)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    def evict(self):  # type: () -> None
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _json_loads(text):  # type: (Union[Text, bytes]) -> Any
+    # Replaced by the decoder itself on first use
+    global _json_loads
+    try:
+        import orjson
+        _json_loads = orjson.loads
+    except ImportError:
+        import json
+        _json_loads = json.loads
+    return _json_loads(text)
+
+def _looks_like_json(text, url):
+    # type: (Union[Text, bytes], Text) -> bool
+    if urllib.parse.urlsplit(url).path.endswith(".json"):
+        return True
+    start = text[:64].lstrip()
+    return start[:1] in (u"{", u"[", b"{", b"[")
+
+def _parse_document(text, url, loadingOptions):
+    # type: (Union[Text, bytes], Text, LoadingOptions) -> Any
+    if not loadingOptions.track_lines and _looks_like_json(text, url):
+        try:
+            return _json_loads(text)
+        except ValueError:
+            pass  # YAML flow style, or not JSON after all
     if isinstance(text, bytes):
-        textIO = StringIO(text.decode('utf-8'))
-    else:
-        textIO = StringIO(text)
+        text = text.decode('utf-8')
+    if not loadingOptions.track_lines:
+        return yaml.load(text, Loader=_SafeLoader)
+    textIO = StringIO(text)
     textIO.name = url    # type: ignore
     result = yaml.round_trip_load(textIO)
     add_lc_filename(result, url)
+    return result
 
-    loadingOptions.idx[url] = result
 
-    loadingOptions = LoadingOptions(copyfrom=loadingOptions, fileuri=url)
+def _fetch_document(url, loadingOptions):
+    # type: (Text, LoadingOptions) -> Any
+    text = loadingOptions.fetcher.fetch_text(url)
+    cache = loadingOptions.parse_cache
+    variant = "" if loadingOptions.track_lines else "plain"
+    result = cache.get(url, text, variant) if cache is not None else None
+    if result is None:
+        result = _parse_document(text, url, loadingOptions)
+        if cache is not None:
+            cache.put(url, text, result, variant)
+    # No "&", no anchor, and so no aliases
+    if (b"&" if isinstance(text, bytes) else u"&") not in text:
+        loadingOptions.owned.add(url)
+    return result
+
+
+def _document_load_by_url(loader, url, loadingOptions):
+    if url in loadingOptions.idx:
+        result = loadingOptions.idx[url]
+    else:
+        result = _fetch_document(url, loadingOptions)
+        loadingOptions.idx[url] = result
+
+    loadingOptions = LoadingOptions(copyfrom=loadingOptions, fileuri=url,
+                                    owns_documents=url in loadingOptions.owned)
 
     return _document_load(loader, result, url, loadingOptions)
 
+
+def _external_references(doc, url, fetcher, follow_runs):
+    # type: (Any, Text, Any, bool) -> Iterable[Tuple[Text, Text]]
+    """
+    ("import" | "include", url) for every $import and $include reference in
+    a parsed document, and every run reference if follow_runs, resolved
+    against the document's url.
+    """
+    stack = [doc]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get("$import"), six.string_types):
+                yield "import", fetcher.urljoin(url, node["$import"])
+            elif isinstance(node.get("$include"), six.string_types):
+                yield "include", fetcher.urljoin(url, node["$include"])
+            run = node.get("run") if follow_runs else None
+            if (isinstance(run, six.string_types) and not run.startswith(u"#")
+                    and not run.startswith(u"$(") and not run.startswith(u"${")):
+                yield "import", urllib.parse.urldefrag(fetcher.urljoin(url, run))[0]
+            stack.extend(six.itervalues(node))
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def prefetch(doc, baseuri=None, loadingOptions=None, max_workers=8, follow_runs=None):
+    # type: (Any, Union[Text, None], Union[LoadingOptions, None], int, Union[bool, None]) -> LoadingOptions
+    """
+    Fetch and parse a document and everything it references through
+    $import or $include, max_workers at a time, recording them in
+    loadingOptions so that a following load_document() with the same
+    options does no fetching of its own.
+
+    A step's run given as a url is only loaded through a LazyProcess, so the
+    documents it names are fetched as well only if follow_runs, which
+    defaults to loadingOptions.lazy_run.
+
+    Failures are ignored here and left for load_document() to report.
+    Returns loadingOptions, created if not given.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    if baseuri is None:
+        baseuri = file_uri(os.getcwd()) + "/"
+    if loadingOptions is None:
+        loadingOptions = LoadingOptions()
+    fetcher = loadingOptions.fetcher
+    if follow_runs is None:
+        follow_runs = loadingOptions.lazy_run
+
+    seen = set()  # type: set
+    pending = {}  # type: Dict[Any, Tuple[Text, Text]]
+
+    def scan(node, url):
+        for kind, ref in _external_references(node, url, fetcher, follow_runs):
+            if ref in seen:
+                continue
+            seen.add(ref)
+            if kind == "include":
+                if ref not in loadingOptions.includes:
+                    pending[executor.submit(fetcher.fetch_text, ref)] = (kind, ref)
+            elif ref in loadingOptions.idx:
+                scan(loadingOptions.idx[ref], ref)
+            else:
+                pending[executor.submit(_fetch_document, ref, loadingOptions)] = (kind, ref)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if isinstance(doc, six.string_types):
+            scan({"$import": doc}, baseuri)
+        else:
+            scan(doc, loadingOptions.fileuri or baseuri)
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, ref = pending.pop(future)
+                if future.exception() is not None:
+                    continue
+                if kind == "include":
+                    loadingOptions.includes[ref] = future.result()
+                else:
+                    loadingOptions.idx[ref] = future.result()
+                    scan(loadingOptions.idx[ref], ref)
+    return loadingOptions
+
+if os.name == "nt":
+    def _pathname2url(path):  # type: (str) -> str
+        return urllib.request.pathname2url(path)
+else:
+    # All urllib.request.pathname2url does on POSIX, without importing
+    # urllib.request and with it http.client, email and ssl
+    _pathname2url = urllib.parse.quote
+
 def file_uri(path, split_frag=False):  # type: (str, bool) -> str
     if path.startswith("file://"):
         return path
     if split_frag:
         pathsp = path.split("#", 2)
         frag = "#" + urllib.parse.quote(str(pathsp[1])) if len(pathsp) == 2 else ""
-        urlpath = urllib.request.pathname2url(str(pathsp[0]))
+        urlpath = _pathname2url(str(pathsp[0]))
     else:
-        urlpath = urllib.request.pathname2url(path)
+        urlpath = _pathname2url(path)
         frag = ""
     if urlpath.startswith("//"):
         return "file:%s%s" % (urlpath, frag)
@@ -598,18 +1484,16 @@ class RecordField(Savable):
     """
 A field of a record.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'name', 'doc', 'type', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -624,28 +1508,31 @@ A field of a record.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'RecordField'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('RecordField', errors))
 
     def save(self, top=False):
         r = {}
@@ -670,39 +1557,40 @@ A field of a record.
 
 
 class RecordSchema(Savable):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'fields', 'type', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'fields' in doc:
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'RecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('RecordSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -728,36 +1616,37 @@ class EnumSchema(Savable):
 Define an enumerated type.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'symbols', 'type', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'EnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('EnumSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -779,36 +1668,37 @@ Define an enumerated type.
 
 
 class ArraySchema(Savable):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'items', 'type', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'ArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('ArraySchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -899,11 +1789,9 @@ An ExpressionTool may forward file references from input to output by using
 the same value for `location`.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'location', 'path', 'basename', 'dirname', 'nameroot', 'nameext', 'checksum', 'size', 'secondaryFiles', 'format', 'contents', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -914,7 +1802,7 @@ the same value for `location`.
             try:
                 self.location = load_field(doc.get('location'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'location', str).makeError("the `location` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'location', "the `location` field is not valid because:\n", e))
         else:
             self.location = None
 
@@ -922,7 +1810,7 @@ the same value for `location`.
             try:
                 self.path = load_field(doc.get('path'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'path', str).makeError("the `path` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'path', "the `path` field is not valid because:\n", e))
         else:
             self.path = None
 
@@ -930,7 +1818,7 @@ the same value for `location`.
             try:
                 self.basename = load_field(doc.get('basename'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'basename', str).makeError("the `basename` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'basename', "the `basename` field is not valid because:\n", e))
         else:
             self.basename = None
 
@@ -938,7 +1826,7 @@ the same value for `location`.
             try:
                 self.dirname = load_field(doc.get('dirname'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dirname', str).makeError("the `dirname` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dirname', "the `dirname` field is not valid because:\n", e))
         else:
             self.dirname = None
 
@@ -946,7 +1834,7 @@ the same value for `location`.
             try:
                 self.nameroot = load_field(doc.get('nameroot'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'nameroot', str).makeError("the `nameroot` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'nameroot', "the `nameroot` field is not valid because:\n", e))
         else:
             self.nameroot = None
 
@@ -954,7 +1842,7 @@ the same value for `location`.
             try:
                 self.nameext = load_field(doc.get('nameext'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'nameext', str).makeError("the `nameext` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'nameext', "the `nameext` field is not valid because:\n", e))
         else:
             self.nameext = None
 
@@ -962,7 +1850,7 @@ the same value for `location`.
             try:
                 self.checksum = load_field(doc.get('checksum'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'checksum', str).makeError("the `checksum` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'checksum', "the `checksum` field is not valid because:\n", e))
         else:
             self.checksum = None
 
@@ -970,7 +1858,7 @@ the same value for `location`.
             try:
                 self.size = load_field(doc.get('size'), union_of_None_type_or_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'size', str).makeError("the `size` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'size', "the `size` field is not valid because:\n", e))
         else:
             self.size = None
 
@@ -978,7 +1866,7 @@ the same value for `location`.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -986,7 +1874,7 @@ the same value for `location`.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -994,23 +1882,26 @@ the same value for `location`.
             try:
                 self.contents = load_field(doc.get('contents'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'contents', str).makeError("the `contents` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'contents', "the `contents` field is not valid because:\n", e))
         else:
             self.contents = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `dirname`, `nameroot`, `nameext`, `checksum`, `size`, `secondaryFiles`, `format`, `contents`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `dirname`, `nameroot`, `nameext`, `checksum`, `size`, `secondaryFiles`, `format`, `contents`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'File'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('File', errors))
 
     def save(self, top=False):
         r = {}
@@ -1107,11 +1998,9 @@ Name conflicts (the same `basename` appearing multiple times in `listing`
 or in any entry in `secondaryFiles` in the listing) is a fatal error.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'location', 'path', 'basename', 'listing', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -1122,7 +2011,7 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.location = load_field(doc.get('location'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'location', str).makeError("the `location` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'location', "the `location` field is not valid because:\n", e))
         else:
             self.location = None
 
@@ -1130,7 +2019,7 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.path = load_field(doc.get('path'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'path', str).makeError("the `path` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'path', "the `path` field is not valid because:\n", e))
         else:
             self.path = None
 
@@ -1138,7 +2027,7 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.basename = load_field(doc.get('basename'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'basename', str).makeError("the `basename` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'basename', "the `basename` field is not valid because:\n", e))
         else:
             self.basename = None
 
@@ -1146,23 +2035,26 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.listing = load_field(doc.get('listing'), union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'listing', str).makeError("the `listing` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'listing', "the `listing` field is not valid because:\n", e))
         else:
             self.listing = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `listing`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `listing`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'Directory'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('Directory', errors))
 
     def save(self, top=False):
         r = {}
@@ -1192,40 +2084,38 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
 
 
 class SchemaBase(Savable):
-    pass
+    __slots__ = ()
 
 class Parameter(SchemaBase):
     """
 Define an input or output parameter to a process.
 
     """
-    pass
+    __slots__ = ()
 
 class InputBinding(Savable):
-    pass
+    __slots__ = ()
 
 class OutputBinding(Savable):
-    pass
+    __slots__ = ()
 
 class InputSchema(SchemaBase):
-    pass
+    __slots__ = ()
 
 class OutputSchema(SchemaBase):
-    pass
+    __slots__ = ()
 
 class InputRecordField(RecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('inputBinding', 'label')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1240,20 +2130,20 @@ class InputRecordField(RecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'inputBinding' in doc:
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -1261,23 +2151,26 @@ class InputRecordField(RecordField):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'InputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('InputRecordField', errors))
 
     def save(self, top=False):
         r = {}
@@ -1308,18 +2201,16 @@ class InputRecordField(RecordField):
 
 
 class InputRecordSchema(RecordSchema, InputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('name', 'label')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1334,36 +2225,39 @@ class InputRecordSchema(RecordSchema, InputSchema):
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_InputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'InputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('InputRecordSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -1391,18 +2285,16 @@ class InputRecordSchema(RecordSchema, InputSchema):
 
 
 class InputEnumSchema(EnumSchema, InputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('name', 'label', 'inputBinding')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1416,18 +2308,18 @@ class InputEnumSchema(EnumSchema, InputSchema):
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1435,23 +2327,26 @@ class InputEnumSchema(EnumSchema, InputSchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'InputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('InputEnumSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -1482,28 +2377,26 @@ class InputEnumSchema(EnumSchema, InputSchema):
 
 
 class InputArraySchema(ArraySchema, InputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label', 'inputBinding')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1511,23 +2404,26 @@ class InputArraySchema(ArraySchema, InputSchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'InputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('InputArraySchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -1555,18 +2451,16 @@ class InputArraySchema(ArraySchema, InputSchema):
 
 
 class OutputRecordField(RecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('outputBinding',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1581,36 +2475,39 @@ class OutputRecordField(RecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'outputBinding' in doc:
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'OutputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('OutputRecordField', errors))
 
     def save(self, top=False):
         r = {}
@@ -1638,47 +2535,48 @@ class OutputRecordField(RecordField):
 
 
 class OutputRecordSchema(RecordSchema, OutputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'fields' in doc:
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_OutputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'OutputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('OutputRecordSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -1703,28 +2601,26 @@ class OutputRecordSchema(RecordSchema, OutputSchema):
 
 
 class OutputEnumSchema(EnumSchema, OutputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label', 'outputBinding')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1732,23 +2628,26 @@ class OutputEnumSchema(EnumSchema, OutputSchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'OutputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('OutputEnumSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -1776,28 +2675,26 @@ class OutputEnumSchema(EnumSchema, OutputSchema):
 
 
 class OutputArraySchema(ArraySchema, OutputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label', 'outputBinding')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1805,23 +2702,26 @@ class OutputArraySchema(ArraySchema, OutputSchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'OutputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('OutputArraySchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -1849,18 +2749,16 @@ class OutputArraySchema(ArraySchema, OutputSchema):
 
 
 class InputParameter(Parameter):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'label', 'secondaryFiles', 'streamable', 'doc', 'format', 'inputBinding', 'default', 'type', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -1875,7 +2773,7 @@ class InputParameter(Parameter):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1883,7 +2781,7 @@ class InputParameter(Parameter):
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -1891,7 +2789,7 @@ class InputParameter(Parameter):
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -1899,7 +2797,7 @@ class InputParameter(Parameter):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -1907,7 +2805,7 @@ class InputParameter(Parameter):
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -1915,7 +2813,7 @@ class InputParameter(Parameter):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -1923,7 +2821,7 @@ class InputParameter(Parameter):
             try:
                 self.default = load_field(doc.get('default'), union_of_None_type_or_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'default', str).makeError("the `default` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'default', "the `default` field is not valid because:\n", e))
         else:
             self.default = None
 
@@ -1931,23 +2829,26 @@ class InputParameter(Parameter):
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'InputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('InputParameter', errors))
 
     def save(self, top=False):
         r = {}
@@ -1990,18 +2891,16 @@ class InputParameter(Parameter):
 
 
 class OutputParameter(Parameter):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'label', 'secondaryFiles', 'streamable', 'doc', 'outputBinding', 'format', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -2016,7 +2915,7 @@ class OutputParameter(Parameter):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -2024,7 +2923,7 @@ class OutputParameter(Parameter):
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -2032,7 +2931,7 @@ class OutputParameter(Parameter):
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -2040,7 +2939,7 @@ class OutputParameter(Parameter):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -2048,7 +2947,7 @@ class OutputParameter(Parameter):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -2056,23 +2955,26 @@ class OutputParameter(Parameter):
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'OutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('OutputParameter', errors))
 
     def save(self, top=False):
         r = {}
@@ -2118,7 +3020,7 @@ Process requirements are the primary mechanism for specifying extensions to
 the CWL core specification.
 
     """
-    pass
+    __slots__ = ()
 
 class Process(Savable):
     """
@@ -2128,7 +3030,7 @@ document.  Note that the `Process` object is abstract and cannot be
 directly executed.
 
     """
-    pass
+    __slots__ = ()
 
 class InlineJavascriptRequirement(ProcessRequirement):
     """
@@ -2137,11 +3039,9 @@ If this requirement is not present, the workflow platform must not perform expre
 interpolatation.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'expressionLib', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -2152,23 +3052,26 @@ interpolatation.
             try:
                 self.expressionLib = load_field(doc.get('expressionLib'), union_of_None_type_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'expressionLib', str).makeError("the `expressionLib` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'expressionLib', "the `expressionLib` field is not valid because:\n", e))
         else:
             self.expressionLib = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `expressionLib`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `expressionLib`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'InlineJavascriptRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('InlineJavascriptRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -2199,11 +3102,9 @@ processed in the order listed such that later schema definitions may refer
 to earlier schema definitions.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'types', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -2213,21 +3114,24 @@ to earlier schema definitions.
         try:
             self.types = load_field(doc.get('types'), array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'types', str).makeError("the `types` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `types`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'types', "the `types` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `types`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'SchemaDefRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('SchemaDefRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -2254,36 +3158,37 @@ by the workflow platform when executing the command line tool.  May be the
 result of executing an expression, such as getting a parameter from input.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'envName', 'envValue', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.envName = load_field(doc.get('envName'), strtype, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'envName', str).makeError("the `envName` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'envName', "the `envName` field is not valid because:\n", e))
 
         try:
             self.envValue = load_field(doc.get('envValue'), union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'envValue', str).makeError("the `envValue` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `envName`, `envValue`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'envValue', "the `envValue` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `envName`, `envValue`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'EnvironmentDef'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('EnvironmentDef', errors))
 
     def save(self, top=False):
         r = {}
@@ -2339,18 +3244,16 @@ effective value.
   - **null**: Add nothing.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'loadContents', 'position', 'prefix', 'separate', 'itemSeparator', 'valueFrom', 'shellQuote', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'loadContents' in doc:
             try:
                 self.loadContents = load_field(doc.get('loadContents'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'loadContents', str).makeError("the `loadContents` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'loadContents', "the `loadContents` field is not valid because:\n", e))
         else:
             self.loadContents = None
 
@@ -2358,7 +3261,7 @@ effective value.
             try:
                 self.position = load_field(doc.get('position'), union_of_None_type_or_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'position', str).makeError("the `position` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'position', "the `position` field is not valid because:\n", e))
         else:
             self.position = None
 
@@ -2366,7 +3269,7 @@ effective value.
             try:
                 self.prefix = load_field(doc.get('prefix'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'prefix', str).makeError("the `prefix` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'prefix', "the `prefix` field is not valid because:\n", e))
         else:
             self.prefix = None
 
@@ -2374,7 +3277,7 @@ effective value.
             try:
                 self.separate = load_field(doc.get('separate'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'separate', str).makeError("the `separate` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'separate', "the `separate` field is not valid because:\n", e))
         else:
             self.separate = None
 
@@ -2382,7 +3285,7 @@ effective value.
             try:
                 self.itemSeparator = load_field(doc.get('itemSeparator'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'itemSeparator', str).makeError("the `itemSeparator` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'itemSeparator', "the `itemSeparator` field is not valid because:\n", e))
         else:
             self.itemSeparator = None
 
@@ -2390,7 +3293,7 @@ effective value.
             try:
                 self.valueFrom = load_field(doc.get('valueFrom'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'valueFrom', str).makeError("the `valueFrom` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'valueFrom', "the `valueFrom` field is not valid because:\n", e))
         else:
             self.valueFrom = None
 
@@ -2398,23 +3301,26 @@ effective value.
             try:
                 self.shellQuote = load_field(doc.get('shellQuote'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'shellQuote', str).makeError("the `shellQuote` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'shellQuote', "the `shellQuote` field is not valid because:\n", e))
         else:
             self.shellQuote = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `loadContents`, `position`, `prefix`, `separate`, `itemSeparator`, `valueFrom`, `shellQuote`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `loadContents`, `position`, `prefix`, `separate`, `itemSeparator`, `valueFrom`, `shellQuote`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandLineBinding'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandLineBinding', errors))
 
     def save(self, top=False):
         r = {}
@@ -2464,18 +3370,16 @@ following order:
   - secondaryFiles
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'glob', 'loadContents', 'outputEval', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'glob' in doc:
             try:
                 self.glob = load_field(doc.get('glob'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'glob', str).makeError("the `glob` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'glob', "the `glob` field is not valid because:\n", e))
         else:
             self.glob = None
 
@@ -2483,7 +3387,7 @@ following order:
             try:
                 self.loadContents = load_field(doc.get('loadContents'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'loadContents', str).makeError("the `loadContents` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'loadContents', "the `loadContents` field is not valid because:\n", e))
         else:
             self.loadContents = None
 
@@ -2491,23 +3395,26 @@ following order:
             try:
                 self.outputEval = load_field(doc.get('outputEval'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputEval', str).makeError("the `outputEval` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputEval', "the `outputEval` field is not valid because:\n", e))
         else:
             self.outputEval = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `glob`, `loadContents`, `outputEval`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `glob`, `loadContents`, `outputEval`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputBinding'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandOutputBinding', errors))
 
     def save(self, top=False):
         r = {}
@@ -2532,18 +3439,16 @@ following order:
 
 
 class CommandInputRecordField(InputRecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2558,20 +3463,20 @@ class CommandInputRecordField(InputRecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'inputBinding' in doc:
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -2579,23 +3484,26 @@ class CommandInputRecordField(InputRecordField):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandInputRecordField', errors))
 
     def save(self, top=False):
         r = {}
@@ -2626,18 +3534,16 @@ class CommandInputRecordField(InputRecordField):
 
 
 class CommandInputRecordSchema(InputRecordSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2652,36 +3558,39 @@ class CommandInputRecordSchema(InputRecordSchema):
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_CommandInputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandInputRecordSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -2709,18 +3618,16 @@ class CommandInputRecordSchema(InputRecordSchema):
 
 
 class CommandInputEnumSchema(InputEnumSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2734,18 +3641,18 @@ class CommandInputEnumSchema(InputEnumSchema):
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -2753,23 +3660,26 @@ class CommandInputEnumSchema(InputEnumSchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandInputEnumSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -2800,28 +3710,26 @@ class CommandInputEnumSchema(InputEnumSchema):
 
 
 class CommandInputArraySchema(InputArraySchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -2829,23 +3737,26 @@ class CommandInputArraySchema(InputArraySchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandInputArraySchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -2873,18 +3784,16 @@ class CommandInputArraySchema(InputArraySchema):
 
 
 class CommandOutputRecordField(OutputRecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2899,36 +3808,39 @@ class CommandOutputRecordField(OutputRecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'outputBinding' in doc:
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandOutputRecordField', errors))
 
     def save(self, top=False):
         r = {}
@@ -2956,18 +3868,16 @@ class CommandOutputRecordField(OutputRecordField):
 
 
 class CommandOutputRecordSchema(OutputRecordSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('name',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2982,36 +3892,39 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_CommandOutputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandOutputRecordSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -3039,28 +3952,26 @@ class CommandOutputRecordSchema(OutputRecordSchema):
 
 
 class CommandOutputEnumSchema(OutputEnumSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3068,23 +3979,26 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandOutputEnumSchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -3112,28 +4026,26 @@ class CommandOutputEnumSchema(OutputEnumSchema):
 
 
 class CommandOutputArraySchema(OutputArraySchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3141,23 +4053,26 @@ class CommandOutputArraySchema(OutputArraySchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandOutputArraySchema', errors))
 
     def save(self, top=False):
         r = {}
@@ -3188,18 +4103,16 @@ class CommandInputParameter(InputParameter):
     """
 An input parameter for a CommandLineTool.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -3214,7 +4127,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3222,7 +4135,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -3230,7 +4143,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -3238,7 +4151,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -3246,7 +4159,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -3254,7 +4167,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -3262,7 +4175,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.default = load_field(doc.get('default'), union_of_None_type_or_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'default', str).makeError("the `default` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'default', "the `default` field is not valid because:\n", e))
         else:
             self.default = None
 
@@ -3270,23 +4183,26 @@ An input parameter for a CommandLineTool.
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandInputParameter', errors))
 
     def save(self, top=False):
         r = {}
@@ -3332,18 +4248,16 @@ class CommandOutputParameter(OutputParameter):
     """
 An output parameter for a CommandLineTool.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -3358,7 +4272,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3366,7 +4280,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -3374,7 +4288,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -3382,7 +4296,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -3390,7 +4304,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -3398,7 +4312,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -3406,23 +4320,26 @@ An output parameter for a CommandLineTool.
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandOutputParameter', errors))
 
     def save(self, top=False):
         r = {}
@@ -3466,11 +4383,9 @@ class CommandLineTool(Process):
 This defines the schema of the CWL Command Line Tool Description document.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'inputs', 'outputs', 'requirements', 'hints', 'label', 'doc', 'cwlVersion', 'baseCommand', 'arguments', 'stdin', 'stderr', 'stdout', 'successCodes', 'temporaryFailCodes', 'permanentFailCodes', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -3481,7 +4396,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.id = load_field(doc.get('id'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -3495,18 +4410,18 @@ This defines the schema of the CWL Command Line Tool Description document.
         try:
             self.inputs = load_field(doc.get('inputs'), idmap_inputs_array_of_CommandInputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'inputs', str).makeError("the `inputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'inputs', "the `inputs` field is not valid because:\n", e))
 
         try:
             self.outputs = load_field(doc.get('outputs'), idmap_outputs_array_of_CommandOutputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'outputs', str).makeError("the `outputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'outputs', "the `outputs` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -3514,7 +4429,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -3522,7 +4437,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3530,7 +4445,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -3538,7 +4453,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.cwlVersion = load_field(doc.get('cwlVersion'), uri_union_of_None_type_or_CWLVersionLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'cwlVersion', str).makeError("the `cwlVersion` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'cwlVersion', "the `cwlVersion` field is not valid because:\n", e))
         else:
             self.cwlVersion = None
 
@@ -3546,7 +4461,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.baseCommand = load_field(doc.get('baseCommand'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'baseCommand', str).makeError("the `baseCommand` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'baseCommand', "the `baseCommand` field is not valid because:\n", e))
         else:
             self.baseCommand = None
 
@@ -3554,7 +4469,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.arguments = load_field(doc.get('arguments'), union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'arguments', str).makeError("the `arguments` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'arguments', "the `arguments` field is not valid because:\n", e))
         else:
             self.arguments = None
 
@@ -3562,7 +4477,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.stdin = load_field(doc.get('stdin'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'stdin', str).makeError("the `stdin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'stdin', "the `stdin` field is not valid because:\n", e))
         else:
             self.stdin = None
 
@@ -3570,7 +4485,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.stderr = load_field(doc.get('stderr'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'stderr', str).makeError("the `stderr` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'stderr', "the `stderr` field is not valid because:\n", e))
         else:
             self.stderr = None
 
@@ -3578,7 +4493,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.stdout = load_field(doc.get('stdout'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'stdout', str).makeError("the `stdout` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'stdout', "the `stdout` field is not valid because:\n", e))
         else:
             self.stdout = None
 
@@ -3586,7 +4501,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.successCodes = load_field(doc.get('successCodes'), union_of_None_type_or_array_of_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'successCodes', str).makeError("the `successCodes` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'successCodes', "the `successCodes` field is not valid because:\n", e))
         else:
             self.successCodes = None
 
@@ -3594,7 +4509,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.temporaryFailCodes = load_field(doc.get('temporaryFailCodes'), union_of_None_type_or_array_of_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'temporaryFailCodes', str).makeError("the `temporaryFailCodes` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'temporaryFailCodes', "the `temporaryFailCodes` field is not valid because:\n", e))
         else:
             self.temporaryFailCodes = None
 
@@ -3602,23 +4517,26 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.permanentFailCodes = load_field(doc.get('permanentFailCodes'), union_of_None_type_or_array_of_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'permanentFailCodes', str).makeError("the `permanentFailCodes` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'permanentFailCodes', "the `permanentFailCodes` field is not valid because:\n", e))
         else:
             self.permanentFailCodes = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `baseCommand`, `arguments`, `stdin`, `stderr`, `stdout`, `successCodes`, `temporaryFailCodes`, `permanentFailCodes`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `baseCommand`, `arguments`, `stdin`, `stderr`, `stdout`, `successCodes`, `temporaryFailCodes`, `permanentFailCodes`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'CommandLineTool'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('CommandLineTool', errors))
 
     def save(self, top=False):
         r = {}
@@ -3718,11 +4636,9 @@ using `--env` or `--env-file` and interact with the container's preexisting
 environment as defined by Docker.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'dockerPull', 'dockerLoad', 'dockerFile', 'dockerImport', 'dockerImageId', 'dockerOutputDirectory', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -3733,7 +4649,7 @@ environment as defined by Docker.
             try:
                 self.dockerPull = load_field(doc.get('dockerPull'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerPull', str).makeError("the `dockerPull` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerPull', "the `dockerPull` field is not valid because:\n", e))
         else:
             self.dockerPull = None
 
@@ -3741,7 +4657,7 @@ environment as defined by Docker.
             try:
                 self.dockerLoad = load_field(doc.get('dockerLoad'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerLoad', str).makeError("the `dockerLoad` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerLoad', "the `dockerLoad` field is not valid because:\n", e))
         else:
             self.dockerLoad = None
 
@@ -3749,7 +4665,7 @@ environment as defined by Docker.
             try:
                 self.dockerFile = load_field(doc.get('dockerFile'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerFile', str).makeError("the `dockerFile` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerFile', "the `dockerFile` field is not valid because:\n", e))
         else:
             self.dockerFile = None
 
@@ -3757,7 +4673,7 @@ environment as defined by Docker.
             try:
                 self.dockerImport = load_field(doc.get('dockerImport'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerImport', str).makeError("the `dockerImport` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerImport', "the `dockerImport` field is not valid because:\n", e))
         else:
             self.dockerImport = None
 
@@ -3765,7 +4681,7 @@ environment as defined by Docker.
             try:
                 self.dockerImageId = load_field(doc.get('dockerImageId'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerImageId', str).makeError("the `dockerImageId` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerImageId', "the `dockerImageId` field is not valid because:\n", e))
         else:
             self.dockerImageId = None
 
@@ -3773,23 +4689,26 @@ environment as defined by Docker.
             try:
                 self.dockerOutputDirectory = load_field(doc.get('dockerOutputDirectory'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerOutputDirectory', str).makeError("the `dockerOutputDirectory` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerOutputDirectory', "the `dockerOutputDirectory` field is not valid because:\n", e))
         else:
             self.dockerOutputDirectory = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `dockerPull`, `dockerLoad`, `dockerFile`, `dockerImport`, `dockerImageId`, `dockerOutputDirectory`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `dockerPull`, `dockerLoad`, `dockerFile`, `dockerImport`, `dockerImageId`, `dockerOutputDirectory`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'DockerRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('DockerRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -3830,11 +4749,9 @@ A list of software packages that should be configured in the environment of
 the defined process.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'packages', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -3844,21 +4761,24 @@ the defined process.
         try:
             self.packages = load_field(doc.get('packages'), idmap_packages_array_of_SoftwarePackageLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'packages', str).makeError("the `packages` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `packages`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'packages', "the `packages` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `packages`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'SoftwareRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('SoftwareRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -3879,23 +4799,21 @@ the defined process.
 
 
 class SoftwarePackage(Savable):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'package', 'version', 'specs', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.package = load_field(doc.get('package'), strtype, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'package', str).makeError("the `package` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'package', "the `package` field is not valid because:\n", e))
 
         if 'version' in doc:
             try:
                 self.version = load_field(doc.get('version'), union_of_None_type_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'version', str).makeError("the `version` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'version', "the `version` field is not valid because:\n", e))
         else:
             self.version = None
 
@@ -3903,23 +4821,26 @@ class SoftwarePackage(Savable):
             try:
                 self.specs = load_field(doc.get('specs'), union_of_None_type_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'specs', str).makeError("the `specs` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'specs', "the `specs` field is not valid because:\n", e))
         else:
             self.specs = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `package`, `version`, `specs`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `package`, `version`, `specs`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'SoftwarePackage'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('SoftwarePackage', errors))
 
     def save(self, top=False):
         r = {}
@@ -3951,47 +4872,48 @@ executing an expression, such as building a configuration file from a
 template.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'entryname', 'entry', 'writable', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'entryname' in doc:
             try:
                 self.entryname = load_field(doc.get('entryname'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'entryname', str).makeError("the `entryname` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'entryname', "the `entryname` field is not valid because:\n", e))
         else:
             self.entryname = None
 
         try:
             self.entry = load_field(doc.get('entry'), union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'entry', str).makeError("the `entry` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'entry', "the `entry` field is not valid because:\n", e))
 
         if 'writable' in doc:
             try:
                 self.writable = load_field(doc.get('writable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'writable', str).makeError("the `writable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'writable', "the `writable` field is not valid because:\n", e))
         else:
             self.writable = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `entryname`, `entry`, `writable`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `entryname`, `entry`, `writable`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'Dirent'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('Dirent', errors))
 
     def save(self, top=False):
         r = {}
@@ -4019,11 +4941,9 @@ class InitialWorkDirRequirement(ProcessRequirement):
     """
 Define a list of files and subdirectories that must be created by the workflow platform in the designated output directory prior to executing the command line tool.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'listing', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4033,21 +4953,24 @@ Define a list of files and subdirectories that must be created by the workflow p
         try:
             self.listing = load_field(doc.get('listing'), union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'listing', str).makeError("the `listing` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `listing`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'listing', "the `listing` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `listing`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'InitialWorkDirRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('InitialWorkDirRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -4073,11 +4996,9 @@ Define a list of environment variables which will be set in the
 execution environment of the tool.  See `EnvironmentDef` for details.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'envDef', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4087,21 +5008,24 @@ execution environment of the tool.  See `EnvironmentDef` for details.
         try:
             self.envDef = load_field(doc.get('envDef'), idmap_envDef_array_of_EnvironmentDefLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'envDef', str).makeError("the `envDef` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `envDef`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'envDef', "the `envDef` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `envDef`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'EnvVarRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('EnvVarRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -4132,11 +5056,9 @@ argument is joined into the command string without quoting, which allows
 the use of shell metacharacters such as `|` for pipes.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4144,18 +5066,21 @@ the use of shell metacharacters such as `|` for pipes.
             raise ValidationException("Not a ShellCommandRequirement")
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'ShellCommandRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('ShellCommandRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -4196,11 +5121,9 @@ It is an error if the value of any of these fields is negative.
 If neither "min" nor "max" is specified for a resource, an implementation may provide a default.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'coresMin', 'coresMax', 'ramMin', 'ramMax', 'tmpdirMin', 'tmpdirMax', 'outdirMin', 'outdirMax', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4211,7 +5134,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.coresMin = load_field(doc.get('coresMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'coresMin', str).makeError("the `coresMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'coresMin', "the `coresMin` field is not valid because:\n", e))
         else:
             self.coresMin = None
 
@@ -4219,7 +5142,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.coresMax = load_field(doc.get('coresMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'coresMax', str).makeError("the `coresMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'coresMax', "the `coresMax` field is not valid because:\n", e))
         else:
             self.coresMax = None
 
@@ -4227,7 +5150,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.ramMin = load_field(doc.get('ramMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'ramMin', str).makeError("the `ramMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'ramMin', "the `ramMin` field is not valid because:\n", e))
         else:
             self.ramMin = None
 
@@ -4235,7 +5158,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.ramMax = load_field(doc.get('ramMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'ramMax', str).makeError("the `ramMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'ramMax', "the `ramMax` field is not valid because:\n", e))
         else:
             self.ramMax = None
 
@@ -4243,7 +5166,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.tmpdirMin = load_field(doc.get('tmpdirMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'tmpdirMin', str).makeError("the `tmpdirMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'tmpdirMin', "the `tmpdirMin` field is not valid because:\n", e))
         else:
             self.tmpdirMin = None
 
@@ -4251,7 +5174,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.tmpdirMax = load_field(doc.get('tmpdirMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'tmpdirMax', str).makeError("the `tmpdirMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'tmpdirMax', "the `tmpdirMax` field is not valid because:\n", e))
         else:
             self.tmpdirMax = None
 
@@ -4259,7 +5182,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.outdirMin = load_field(doc.get('outdirMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outdirMin', str).makeError("the `outdirMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outdirMin', "the `outdirMin` field is not valid because:\n", e))
         else:
             self.outdirMin = None
 
@@ -4267,23 +5190,26 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.outdirMax = load_field(doc.get('outdirMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outdirMax', str).makeError("the `outdirMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outdirMax', "the `outdirMax` field is not valid because:\n", e))
         else:
             self.outdirMax = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `coresMin`, `coresMax`, `ramMin`, `ramMax`, `tmpdirMin`, `tmpdirMax`, `outdirMin`, `outdirMax`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `coresMin`, `coresMax`, `ramMin`, `ramMax`, `tmpdirMin`, `tmpdirMax`, `outdirMin`, `outdirMax`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'ResourceRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('ResourceRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -4325,18 +5251,16 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
 
 
 class ExpressionToolOutputParameter(OutputParameter):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4351,7 +5275,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -4359,7 +5283,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -4367,7 +5291,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -4375,7 +5299,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -4383,7 +5307,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -4391,7 +5315,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -4399,23 +5323,26 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'ExpressionToolOutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('ExpressionToolOutputParameter', errors))
 
     def save(self, top=False):
         r = {}
@@ -4459,11 +5386,9 @@ class ExpressionTool(Process):
 Execute an expression as a Workflow step.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'inputs', 'outputs', 'requirements', 'hints', 'label', 'doc', 'cwlVersion', 'expression', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4474,7 +5399,7 @@ Execute an expression as a Workflow step.
             try:
                 self.id = load_field(doc.get('id'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4488,18 +5413,18 @@ Execute an expression as a Workflow step.
         try:
             self.inputs = load_field(doc.get('inputs'), idmap_inputs_array_of_InputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'inputs', str).makeError("the `inputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'inputs', "the `inputs` field is not valid because:\n", e))
 
         try:
             self.outputs = load_field(doc.get('outputs'), idmap_outputs_array_of_ExpressionToolOutputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'outputs', str).makeError("the `outputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'outputs', "the `outputs` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -4507,7 +5432,7 @@ Execute an expression as a Workflow step.
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -4515,7 +5440,7 @@ Execute an expression as a Workflow step.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -4523,7 +5448,7 @@ Execute an expression as a Workflow step.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -4531,28 +5456,31 @@ Execute an expression as a Workflow step.
             try:
                 self.cwlVersion = load_field(doc.get('cwlVersion'), uri_union_of_None_type_or_CWLVersionLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'cwlVersion', str).makeError("the `cwlVersion` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'cwlVersion', "the `cwlVersion` field is not valid because:\n", e))
         else:
             self.cwlVersion = None
 
         try:
             self.expression = load_field(doc.get('expression'), union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'expression', str).makeError("the `expression` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `expression`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'expression', "the `expression` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `expression`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'ExpressionTool'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('ExpressionTool', errors))
 
     def save(self, top=False):
         r = {}
@@ -4603,18 +5531,16 @@ connected to one or more parameters defined in the workflow that will
 provide the value of the output parameter.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('outputSource', 'linkMerge', 'type')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4629,7 +5555,7 @@ provide the value of the output parameter.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -4637,7 +5563,7 @@ provide the value of the output parameter.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -4645,7 +5571,7 @@ provide the value of the output parameter.
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -4653,7 +5579,7 @@ provide the value of the output parameter.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -4661,7 +5587,7 @@ provide the value of the output parameter.
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -4669,7 +5595,7 @@ provide the value of the output parameter.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -4677,7 +5603,7 @@ provide the value of the output parameter.
             try:
                 self.outputSource = load_field(doc.get('outputSource'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputSource', str).makeError("the `outputSource` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputSource', "the `outputSource` field is not valid because:\n", e))
         else:
             self.outputSource = None
 
@@ -4685,7 +5611,7 @@ provide the value of the output parameter.
             try:
                 self.linkMerge = load_field(doc.get('linkMerge'), union_of_None_type_or_LinkMergeMethodLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'linkMerge', str).makeError("the `linkMerge` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'linkMerge', "the `linkMerge` field is not valid because:\n", e))
         else:
             self.linkMerge = None
 
@@ -4693,23 +5619,26 @@ provide the value of the output parameter.
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `outputSource`, `linkMerge`, `type`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `outputSource`, `linkMerge`, `type`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowOutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('WorkflowOutputParameter', errors))
 
     def save(self, top=False):
         r = {}
@@ -4755,7 +5684,7 @@ provide the value of the output parameter.
 
 
 class Sink(Savable):
-    pass
+    __slots__ = ()
 
 class WorkflowStepInput(Sink):
     """
@@ -4800,18 +5729,16 @@ specified, the default method is "merge_nested".
      single elements.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'source', 'linkMerge', 'default', 'valueFrom', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4826,7 +5753,7 @@ specified, the default method is "merge_nested".
             try:
                 self.source = load_field(doc.get('source'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'source', str).makeError("the `source` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'source', "the `source` field is not valid because:\n", e))
         else:
             self.source = None
 
@@ -4834,7 +5761,7 @@ specified, the default method is "merge_nested".
             try:
                 self.linkMerge = load_field(doc.get('linkMerge'), union_of_None_type_or_LinkMergeMethodLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'linkMerge', str).makeError("the `linkMerge` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'linkMerge', "the `linkMerge` field is not valid because:\n", e))
         else:
             self.linkMerge = None
 
@@ -4842,7 +5769,7 @@ specified, the default method is "merge_nested".
             try:
                 self.default = load_field(doc.get('default'), union_of_None_type_or_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'default', str).makeError("the `default` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'default', "the `default` field is not valid because:\n", e))
         else:
             self.default = None
 
@@ -4850,23 +5777,26 @@ specified, the default method is "merge_nested".
             try:
                 self.valueFrom = load_field(doc.get('valueFrom'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'valueFrom', str).makeError("the `valueFrom` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'valueFrom', "the `valueFrom` field is not valid because:\n", e))
         else:
             self.valueFrom = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `source`, `linkMerge`, `id`, `default`, `valueFrom`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `source`, `linkMerge`, `id`, `default`, `valueFrom`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowStepInput'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('WorkflowStepInput', errors))
 
     def save(self, top=False):
         r = {}
@@ -4904,18 +5834,16 @@ as a `source` to connect with input parameters of other workflow steps, or
 with an output parameter of the process.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4927,18 +5855,21 @@ with an output parameter of the process.
                 raise ValidationException("Missing id")
         baseuri = self.id
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowStepOutput'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('WorkflowStepOutput', errors))
 
     def save(self, top=False):
         r = {}
@@ -5015,18 +5946,16 @@ It is a fatal error if a workflow directly or indirectly invokes itself as
 a subworkflow (recursive workflows are not allowed).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'in_', 'out', 'requirements', 'hints', 'label', 'doc', 'run', 'scatter', 'scatterMethod', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -5040,18 +5969,18 @@ a subworkflow (recursive workflows are not allowed).
         try:
             self.in_ = load_field(doc.get('in'), idmap_in__array_of_WorkflowStepInputLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'in', str).makeError("the `in` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'in', "the `in` field is not valid because:\n", e))
 
         try:
             self.out = load_field(doc.get('out'), uri_union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'out', str).makeError("the `out` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'out', "the `out` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -5059,7 +5988,7 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -5067,7 +5996,7 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -5075,20 +6004,20 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
-            self.run = load_field(doc.get('run'), uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None, baseuri, loadingOptions)
+            self.run = load_field(doc.get('run'), lazy_uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'run', str).makeError("the `run` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'run', "the `run` field is not valid because:\n", e))
 
         if 'scatter' in doc:
             try:
                 self.scatter = load_field(doc.get('scatter'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'scatter', str).makeError("the `scatter` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'scatter', "the `scatter` field is not valid because:\n", e))
         else:
             self.scatter = None
 
@@ -5096,23 +6025,26 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.scatterMethod = load_field(doc.get('scatterMethod'), uri_union_of_None_type_or_ScatterMethodLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'scatterMethod', str).makeError("the `scatterMethod` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'scatterMethod', "the `scatterMethod` field is not valid because:\n", e))
         else:
             self.scatterMethod = None
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `in`, `out`, `requirements`, `hints`, `label`, `doc`, `run`, `scatter`, `scatterMethod`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `in`, `out`, `requirements`, `hints`, `label`, `doc`, `run`, `scatter`, `scatterMethod`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowStep'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('WorkflowStep', errors))
 
     def save(self, top=False):
         r = {}
@@ -5206,11 +6138,9 @@ available as standard [extensions](#Extensions_and_Metadata) to core
 workflow semantics.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'id', 'inputs', 'outputs', 'requirements', 'hints', 'label', 'doc', 'cwlVersion', 'steps', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5221,7 +6151,7 @@ workflow semantics.
             try:
                 self.id = load_field(doc.get('id'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -5235,18 +6165,18 @@ workflow semantics.
         try:
             self.inputs = load_field(doc.get('inputs'), idmap_inputs_array_of_InputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'inputs', str).makeError("the `inputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'inputs', "the `inputs` field is not valid because:\n", e))
 
         try:
             self.outputs = load_field(doc.get('outputs'), idmap_outputs_array_of_WorkflowOutputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'outputs', str).makeError("the `outputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'outputs', "the `outputs` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -5254,7 +6184,7 @@ workflow semantics.
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -5262,7 +6192,7 @@ workflow semantics.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -5270,7 +6200,7 @@ workflow semantics.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -5278,28 +6208,31 @@ workflow semantics.
             try:
                 self.cwlVersion = load_field(doc.get('cwlVersion'), uri_union_of_None_type_or_CWLVersionLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'cwlVersion', str).makeError("the `cwlVersion` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'cwlVersion', "the `cwlVersion` field is not valid because:\n", e))
         else:
             self.cwlVersion = None
 
         try:
             self.steps = load_field(doc.get('steps'), idmap_steps_union_of_array_of_WorkflowStepLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'steps', str).makeError("the `steps` field is not valid because:\n"+str(e)))
-
-
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `steps`" % (k)))
-                    break
+            errors.append(_SourceError(doc, 'steps', "the `steps` field is not valid because:\n", e))
+
+
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `steps`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'Workflow'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('Workflow', errors))
 
     def save(self, top=False):
         r = {}
@@ -5349,11 +6282,9 @@ Indicates that the workflow platform must support nested workflows in
 the `run` field of [WorkflowStep](#WorkflowStep).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5361,18 +6292,21 @@ the `run` field of [WorkflowStep](#WorkflowStep).
             raise ValidationException("Not a SubworkflowFeatureRequirement")
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'SubworkflowFeatureRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('SubworkflowFeatureRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -5395,11 +6329,9 @@ Indicates that the workflow platform must support the `scatter` and
 `scatterMethod` fields of [WorkflowStep](#WorkflowStep).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5407,18 +6339,21 @@ Indicates that the workflow platform must support the `scatter` and
             raise ValidationException("Not a ScatterFeatureRequirement")
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'ScatterFeatureRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('ScatterFeatureRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -5441,11 +6376,9 @@ Indicates that the workflow platform must support multiple inbound data links
 listed in the `source` field of [WorkflowStepInput](#WorkflowStepInput).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5453,18 +6386,21 @@ listed in the `source` field of [WorkflowStepInput](#WorkflowStepInput).
             raise ValidationException("Not a MultipleInputFeatureRequirement")
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'MultipleInputFeatureRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('MultipleInputFeatureRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -5487,11 +6423,9 @@ Indicate that the workflow platform must support the `valueFrom` field
 of [WorkflowStepInput](#WorkflowStepInput).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields')
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5499,18 +6433,21 @@ of [WorkflowStepInput](#WorkflowStepInput).
             raise ValidationException("Not a StepInputExpressionRequirement")
 
 
-        self.extension_fields = {}
-        for k in doc.keys():
-            if k not in self.attrs:
-                if ":" in k:
-                    ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
-                    self.extension_fields[ex] = doc[k]
-                else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
-                    break
+        self.extension_fields = _NO_EXTENSION_FIELDS
+        if not self.attrs.issuperset(doc):
+            for k in doc.keys():
+                if k not in self.attrs:
+                    if ":" in k:
+                        ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                        if self.extension_fields is _NO_EXTENSION_FIELDS:
+                            self.extension_fields = {}
+                        self.extension_fields[ex] = doc[k]
+                    else:
+                        errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
+                        break
 
         if errors:
-            raise ValidationException("Trying 'StepInputExpressionRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_RecordError('StepInputExpressionRequirement', errors))
 
     def save(self, top=False):
         r = {}
@@ -5735,13 +6672,13 @@ Any_type = _AnyLoader()
 PrimitiveTypeLoader = _EnumLoader(("null", "boolean", "int", "long", "float", "double", "string",))
 AnyLoader = _EnumLoader(("Any",))
 RecordFieldLoader = _RecordLoader(RecordField)
-RecordSchemaLoader = _RecordLoader(RecordSchema)
-EnumSchemaLoader = _RecordLoader(EnumSchema)
-ArraySchemaLoader = _RecordLoader(ArraySchema)
+RecordSchemaLoader = _RecordLoader(RecordSchema, ('type', 'record'))
+EnumSchemaLoader = _RecordLoader(EnumSchema, ('type', 'enum'))
+ArraySchemaLoader = _RecordLoader(ArraySchema, ('type', 'array'))
 CWLVersionLoader = _EnumLoader(("draft-2", "draft-3.dev1", "draft-3.dev2", "draft-3.dev3", "draft-3.dev4", "draft-3.dev5", "draft-3", "draft-4.dev1", "draft-4.dev2", "draft-4.dev3", "v1.0.dev4", "v1.0",))
 CWLTypeLoader = _EnumLoader(("File", "Directory",))
-FileLoader = _RecordLoader(File)
-DirectoryLoader = _RecordLoader(Directory)
+FileLoader = _RecordLoader(File, ('class', 'File'))
+DirectoryLoader = _RecordLoader(Directory, ('class', 'Directory'))
 SchemaBaseLoader = _RecordLoader(SchemaBase)
 ParameterLoader = _RecordLoader(Parameter)
 ExpressionLoader = _EnumLoader(("ExpressionPlaceholder",))
@@ -5750,45 +6687,45 @@ OutputBindingLoader = _RecordLoader(OutputBinding)
 InputSchemaLoader = _RecordLoader(InputSchema)
 OutputSchemaLoader = _RecordLoader(OutputSchema)
 InputRecordFieldLoader = _RecordLoader(InputRecordField)
-InputRecordSchemaLoader = _RecordLoader(InputRecordSchema)
-InputEnumSchemaLoader = _RecordLoader(InputEnumSchema)
-InputArraySchemaLoader = _RecordLoader(InputArraySchema)
+InputRecordSchemaLoader = _RecordLoader(InputRecordSchema, ('type', 'record'))
+InputEnumSchemaLoader = _RecordLoader(InputEnumSchema, ('type', 'enum'))
+InputArraySchemaLoader = _RecordLoader(InputArraySchema, ('type', 'array'))
 OutputRecordFieldLoader = _RecordLoader(OutputRecordField)
-OutputRecordSchemaLoader = _RecordLoader(OutputRecordSchema)
-OutputEnumSchemaLoader = _RecordLoader(OutputEnumSchema)
-OutputArraySchemaLoader = _RecordLoader(OutputArraySchema)
+OutputRecordSchemaLoader = _RecordLoader(OutputRecordSchema, ('type', 'record'))
+OutputEnumSchemaLoader = _RecordLoader(OutputEnumSchema, ('type', 'enum'))
+OutputArraySchemaLoader = _RecordLoader(OutputArraySchema, ('type', 'array'))
 InputParameterLoader = _RecordLoader(InputParameter)
 OutputParameterLoader = _RecordLoader(OutputParameter)
 ProcessRequirementLoader = _RecordLoader(ProcessRequirement)
 ProcessLoader = _RecordLoader(Process)
-InlineJavascriptRequirementLoader = _RecordLoader(InlineJavascriptRequirement)
-SchemaDefRequirementLoader = _RecordLoader(SchemaDefRequirement)
+InlineJavascriptRequirementLoader = _RecordLoader(InlineJavascriptRequirement, ('class', 'InlineJavascriptRequirement'))
+SchemaDefRequirementLoader = _RecordLoader(SchemaDefRequirement, ('class', 'SchemaDefRequirement'))
 EnvironmentDefLoader = _RecordLoader(EnvironmentDef)
 CommandLineBindingLoader = _RecordLoader(CommandLineBinding)
 CommandOutputBindingLoader = _RecordLoader(CommandOutputBinding)
 CommandInputRecordFieldLoader = _RecordLoader(CommandInputRecordField)
-CommandInputRecordSchemaLoader = _RecordLoader(CommandInputRecordSchema)
-CommandInputEnumSchemaLoader = _RecordLoader(CommandInputEnumSchema)
-CommandInputArraySchemaLoader = _RecordLoader(CommandInputArraySchema)
+CommandInputRecordSchemaLoader = _RecordLoader(CommandInputRecordSchema, ('type', 'record'))
+CommandInputEnumSchemaLoader = _RecordLoader(CommandInputEnumSchema, ('type', 'enum'))
+CommandInputArraySchemaLoader = _RecordLoader(CommandInputArraySchema, ('type', 'array'))
 CommandOutputRecordFieldLoader = _RecordLoader(CommandOutputRecordField)
-CommandOutputRecordSchemaLoader = _RecordLoader(CommandOutputRecordSchema)
-CommandOutputEnumSchemaLoader = _RecordLoader(CommandOutputEnumSchema)
-CommandOutputArraySchemaLoader = _RecordLoader(CommandOutputArraySchema)
+CommandOutputRecordSchemaLoader = _RecordLoader(CommandOutputRecordSchema, ('type', 'record'))
+CommandOutputEnumSchemaLoader = _RecordLoader(CommandOutputEnumSchema, ('type', 'enum'))
+CommandOutputArraySchemaLoader = _RecordLoader(CommandOutputArraySchema, ('type', 'array'))
 CommandInputParameterLoader = _RecordLoader(CommandInputParameter)
 CommandOutputParameterLoader = _RecordLoader(CommandOutputParameter)
 stdoutLoader = _EnumLoader(("stdout",))
 stderrLoader = _EnumLoader(("stderr",))
-CommandLineToolLoader = _RecordLoader(CommandLineTool)
-DockerRequirementLoader = _RecordLoader(DockerRequirement)
-SoftwareRequirementLoader = _RecordLoader(SoftwareRequirement)
+CommandLineToolLoader = _RecordLoader(CommandLineTool, ('class', 'CommandLineTool'))
+DockerRequirementLoader = _RecordLoader(DockerRequirement, ('class', 'DockerRequirement'))
+SoftwareRequirementLoader = _RecordLoader(SoftwareRequirement, ('class', 'SoftwareRequirement'))
 SoftwarePackageLoader = _RecordLoader(SoftwarePackage)
 DirentLoader = _RecordLoader(Dirent)
-InitialWorkDirRequirementLoader = _RecordLoader(InitialWorkDirRequirement)
-EnvVarRequirementLoader = _RecordLoader(EnvVarRequirement)
-ShellCommandRequirementLoader = _RecordLoader(ShellCommandRequirement)
-ResourceRequirementLoader = _RecordLoader(ResourceRequirement)
+InitialWorkDirRequirementLoader = _RecordLoader(InitialWorkDirRequirement, ('class', 'InitialWorkDirRequirement'))
+EnvVarRequirementLoader = _RecordLoader(EnvVarRequirement, ('class', 'EnvVarRequirement'))
+ShellCommandRequirementLoader = _RecordLoader(ShellCommandRequirement, ('class', 'ShellCommandRequirement'))
+ResourceRequirementLoader = _RecordLoader(ResourceRequirement, ('class', 'ResourceRequirement'))
 ExpressionToolOutputParameterLoader = _RecordLoader(ExpressionToolOutputParameter)
-ExpressionToolLoader = _RecordLoader(ExpressionTool)
+ExpressionToolLoader = _RecordLoader(ExpressionTool, ('class', 'ExpressionTool'))
 LinkMergeMethodLoader = _EnumLoader(("merge_nested", "merge_flattened",))
 WorkflowOutputParameterLoader = _RecordLoader(WorkflowOutputParameter)
 SinkLoader = _RecordLoader(Sink)
@@ -5796,11 +6733,11 @@ WorkflowStepInputLoader = _RecordLoader(WorkflowStepInput)
 WorkflowStepOutputLoader = _RecordLoader(WorkflowStepOutput)
 ScatterMethodLoader = _EnumLoader(("dotproduct", "nested_crossproduct", "flat_crossproduct",))
 WorkflowStepLoader = _RecordLoader(WorkflowStep)
-WorkflowLoader = _RecordLoader(Workflow)
-SubworkflowFeatureRequirementLoader = _RecordLoader(SubworkflowFeatureRequirement)
-ScatterFeatureRequirementLoader = _RecordLoader(ScatterFeatureRequirement)
-MultipleInputFeatureRequirementLoader = _RecordLoader(MultipleInputFeatureRequirement)
-StepInputExpressionRequirementLoader = _RecordLoader(StepInputExpressionRequirement)
+WorkflowLoader = _RecordLoader(Workflow, ('class', 'Workflow'))
+SubworkflowFeatureRequirementLoader = _RecordLoader(SubworkflowFeatureRequirement, ('class', 'SubworkflowFeatureRequirement'))
+ScatterFeatureRequirementLoader = _RecordLoader(ScatterFeatureRequirement, ('class', 'ScatterFeatureRequirement'))
+MultipleInputFeatureRequirementLoader = _RecordLoader(MultipleInputFeatureRequirement, ('class', 'MultipleInputFeatureRequirement'))
+StepInputExpressionRequirementLoader = _RecordLoader(StepInputExpressionRequirement, ('class', 'StepInputExpressionRequirement'))
 uri_strtype_True_False_None = _URILoader(strtype, True, False, None)
 union_of_None_type_or_strtype = _UnionLoader((None_type, strtype,))
 union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype = _UnionLoader((PrimitiveTypeLoader, RecordSchemaLoader, EnumSchemaLoader, ArraySchemaLoader, strtype,))
@@ -5939,6 +6876,7 @@ idmap_steps_union_of_array_of_WorkflowStepLoader = _IdMapLoader(union_of_array_o
 union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader = _UnionLoader((CommandLineToolLoader, ExpressionToolLoader, WorkflowLoader,))
 array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader = _ArrayLoader(union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
 union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader = _UnionLoader((CommandLineToolLoader, ExpressionToolLoader, WorkflowLoader, array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader,))
+lazy_uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None = _LazyProcessLoader(uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None, union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
 
 
 
@@ -5947,4 +6885,12 @@ def load_document(doc, baseuri=None, loadingOptions=None):
         baseuri = file_uri(os.getcwd()) + "/"
     if loadingOptions is None:
         loadingOptions = LoadingOptions()
-    return _document_load(union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, doc, baseuri, loadingOptions)
+    elif loadingOptions.owns_documents and not isinstance(doc, six.string_types):
+        # doc is the caller's
+        loadingOptions = LoadingOptions(copyfrom=loadingOptions, owns_documents=False)
+    try:
+        return _document_load(union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, doc, baseuri, loadingOptions)
+    except ValidationException as e:
+        # Format the message now, releasing the documents it refers to.
+        six.text_type(e)
+        raise
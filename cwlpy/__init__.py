@@ -1,3 +1,6 @@
+import sys
+from importlib import import_module
+
 from .cwlpy import Workflow, \
   WorkflowStep, \
   WorkflowStepInput, \
@@ -9,3 +12,37 @@ from .cwlpy import Workflow, \
   WorkflowOutputConnection, \
   ValidationException
 
+# Imported on first use of one of their names, so that `import cwlpy` costs
+# only what building workflows needs
+_LAZY = {
+    'WorkflowGraph': 'graph',
+    'plan': 'planner',
+    'Plan': 'planner',
+    'step_resources': 'planner',
+    'LocalExecutor': 'executor',
+    'JobFailed': 'executor',
+    'job_order_validator': 'validator',
+    'validate_job_order': 'validator',
+    'fill_metadata': 'metadata',
+    'ChecksumCache': 'metadata',
+    'dump_yaml': 'serialize',
+    'dump_json': 'serialize',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(import_module('.' + _LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if sys.version_info < (3, 7):
+    # No module __getattr__ (PEP 562): import them all now
+    for _name in _LAZY:
+        __getattr__(_name)
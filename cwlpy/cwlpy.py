@@ -1,4 +1,5 @@
 import os
+import weakref
 import six
 import cwl_schema
 
@@ -18,6 +19,145 @@ class ValidationException(cwl_schema.ValidationException):
     pass
 
 
+class _IdIndexedList(list):
+    """
+    A list of objects with ids that also finds them by id, and tells whether
+    it holds an object, in constant time. Holding is by identity: an equal
+    object that is not one of the items is not in the list. Appending and
+    extending keep the index up to date; any other change drops it, to be
+    rebuilt on the next lookup. Ids must not change while their object is in
+    the list.
+
+    Any change also drops the graph cached by the workflow the list belongs
+    to, if owner is given, see _touch().
+    """
+
+    __slots__ = ('_by_id', '_members', '_owner')
+
+    def __init__(self, items=(), owner=None):
+        list.__init__(self, items)
+        self._by_id = None
+        self._members = None
+        self._owner = owner
+
+    def __reduce__(self):
+        # The index is rebuilt when needed
+        return _IdIndexedList, (list(self), self._owner)
+
+    def _index(self):
+        if self._by_id is None:
+            self._by_id = {}
+            self._members = {}
+            for item in self:
+                self._add(item)
+        return self._by_id
+
+    def _add(self, item):
+        self._by_id.setdefault(getattr(item, 'id', None), []).append(item)
+        self._members[id(item)] = self._members.get(id(item), 0) + 1
+
+    def _invalidate(self):
+        self._by_id = None
+        self._members = None
+
+    def _changed(self):
+        if self._owner is not None:
+            _touch(self._owner)
+
+    def by_id(self, id):
+        items = self._index().get(id)
+        return items[0] if items else None
+
+    def all_by_id(self, id):
+        return list(self._index().get(id, ()))
+
+    def __contains__(self, item):
+        self._index()
+        return id(item) in self._members
+
+    def append(self, item):
+        list.append(self, item)
+        if self._by_id is not None:
+            self._add(item)
+        self._changed()
+
+    def extend(self, items):
+        items = list(items)
+        list.extend(self, items)
+        if self._by_id is not None:
+            for item in items:
+                self._add(item)
+        self._changed()
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+
+def _invalidating(method):
+    def invalidating(self, *args, **kwargs):
+        self._invalidate()
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+    invalidating.__name__ = method.__name__
+    return invalidating
+
+
+for _name in ('insert', 'remove', 'pop', 'clear', 'sort', 'reverse', '__setitem__',
+              '__delitem__', '__imul__', '__setslice__', '__delslice__'):
+    if hasattr(list, _name):
+        setattr(_IdIndexedList, _name, _invalidating(getattr(list, _name)))
+
+
+def _indexed(owner, attr):
+    """owner.attr as an _IdIndexedList, converting it if it was replaced by a plain list."""
+    items = getattr(owner, attr)
+    if not isinstance(items, _IdIndexedList):
+        items = _IdIndexedList(items or [], owner)
+        setattr(owner, attr, items)
+    return items
+
+
+def _touch(obj):
+    """
+    Drops the graph cached by obj, if it is a workflow, or by the workflows it
+    is a part of. Steps and step inputs learn which workflows they are a part
+    of when a graph is built, see Workflow.graph(). Also marks obj dirty, see
+    cwl_schema.cache_saves().
+    """
+    if isinstance(obj, cwl_schema.Savable):
+        obj.mark_dirty()
+    if getattr(obj, '_graph', None) is not None:
+        obj._graph = None
+    for owner in _graph_owners(obj):
+        _touch(owner)
+
+
+# The workflows or steps of steps and step inputs not of this module's
+# classes, whose __slots__ have no room for them
+_other_graph_owners = weakref.WeakKeyDictionary()
+
+
+def _graph_owners(obj):
+    owners = getattr(obj, '_graph_owners', None)
+    if owners is None:
+        owners = _other_graph_owners.get(obj, ()) if isinstance(obj, cwl_schema.Savable) else ()
+    return owners
+
+
+def _add_graph_owner(obj, owner):
+    owners = _graph_owners(obj)
+    if not owners:
+        owners = [owner]
+        try:
+            obj._graph_owners = owners
+        except AttributeError:
+            _other_graph_owners[obj] = owners
+    elif owner not in owners:
+        owners.append(owner)
+
+
 class TemplateDocs(object):
     # These should probably be factories
     Workflow = {
@@ -52,38 +192,65 @@ class TemplateDocs(object):
     }
 
 
+@cwl_schema.cache_saves
 class Workflow(cwl_schema.Workflow):
 
+    __slots__ = cwl_schema.SAVE_CACHE_SLOTS + ('_graph', '_graph_steps')
+
     def __init__(self, id):
         super(Workflow, self).__init__(dict(TemplateDocs.Workflow), id, LOADING_OPTIONS)
         self.id = id
+        self.steps = _IdIndexedList(self.steps, self)
+        self.inputs = _IdIndexedList(self.inputs, self)
+        self.outputs = _IdIndexedList(self.outputs, self)
+        self._graph = None
 
     def add_step(self, step):
         # Must be a step!
         if not isinstance(step, cwl_schema.WorkflowStep):
             raise ValidationException("Not a WorkflowStep")
-        self.steps.append(step)
+        _indexed(self, 'steps').append(step)
 
     def step(self, step):
         self.add_step(step)
         return self
 
+    def step_by_id(self, id):
+        return _indexed(self, 'steps').by_id(id)
+
+    def graph(self):
+        """
+        The WorkflowGraph of the steps, cached until the workflow, its steps or
+        their inputs are changed, whether through the methods of this module or
+        by changing their lists. Setting attributes directly, as in
+        step_input.source = 'step/output', is not noticed.
+        """
+        from .graph import WorkflowGraph
+        steps = _indexed(self, 'steps')
+        graph = getattr(self, '_graph', None)
+        if graph is None or getattr(self, '_graph_steps', None) is not steps:
+            graph = WorkflowGraph(self)
+            for step in steps:
+                _add_graph_owner(step, self)
+                for step_input in _indexed(step, 'in_'):
+                    _add_graph_owner(step_input, step)
+            self._graph = graph
+            self._graph_steps = steps
+        return graph
+
     def input_parameter_by_id(self, id):
-        for param in self.inputs:
-            if param.id == id:
-                return param
-        return None
+        return _indexed(self, 'inputs').by_id(id)
 
     def add_input_parameter(self, input_parameter):
         if not isinstance(input_parameter, cwl_schema.InputParameter):
             raise ValidationException("Not an InputParameter")
-        self.inputs.append(input_parameter)
+        _indexed(self, 'inputs').append(input_parameter)
         return self
 
     def add_output_parameter(self, output_parameter):
         if not isinstance(output_parameter, cwl_schema.WorkflowOutputParameter):
             raise ValidationException("Not a WorkflowOutputParameter")
-        self.outputs.append(output_parameter)
+        _indexed(self, 'outputs').append(output_parameter)
         return self
 
     def connect_input(self, step, workflow_input_id, step_input_id=None):
@@ -107,46 +274,154 @@ class Workflow(cwl_schema.Workflow):
         connection.connect(step_output_id, step_input_id)
         return self
 
+    def connect_many(self, edges=None, source_steps=None, source_ports=None, target_steps=None,
+                     target_ports=None):
+        """
+        Makes many connections at once. Each edge is a (source step, source port,
+        target step, target port) tuple, where a step is a WorkflowStep of this
+        workflow, its id, or None for the workflow itself: a None source step
+        connects the workflow input named by the source port, as connect_input
+        does, and a None target step the workflow output named by the target
+        port, as connect_output does. The edges may instead be given as four
+        columns of equal length.
+
+        Every edge is checked before any is made. If any cannot be made, raises a
+        ValidationException listing all of them and leaves the workflow unchanged.
+        """
+        if edges is None:
+            columns = [source_steps, source_ports, target_steps, target_ports]
+            if any(column is None for column in columns):
+                raise ValidationException("Either edges or all four columns are required")
+            if len(set(len(column) for column in columns)) != 1:
+                raise ValidationException("Columns must have the same length")
+            edges = six.moves.zip(*columns)
+        steps = _indexed(self, 'steps')
+        outputs = _indexed(self, 'outputs')
+        errors = []
+        planned = []
+        claimed_inputs = set()
+        claimed_outputs = set()
+
+        def resolve(index, step, role):
+            if step is None:
+                return None
+            if isinstance(step, six.string_types):
+                found = steps.by_id(step)
+                if found is None:
+                    errors.append("edge {}: no {} step with id {}".format(index, role, step))
+                return found
+            if not isinstance(step, cwl_schema.WorkflowStep):
+                errors.append("edge {}: {} step is not a WorkflowStep".format(index, role))
+                return None
+            if step not in steps:
+                errors.append("edge {}: {} step {} is not a part of workflow".format(index, role, step.id))
+                return None
+            return step
+
+        for index, edge in enumerate(edges):
+            try:
+                source_step, source_port, target_step, target_port = edge
+            except (TypeError, ValueError):
+                errors.append("edge {}: not a (source step, source port, target step, target port) tuple"
+                              .format(index))
+                continue
+            n_errors = len(errors)
+            if source_step is None and target_step is None:
+                errors.append("edge {}: connects the workflow to itself".format(index))
+                continue
+            source = resolve(index, source_step, 'source')
+            target = resolve(index, target_step, 'target')
+            for port in (source_port, target_port):
+                if not isinstance(port, six.string_types):
+                    errors.append("edge {}: port {!r} is not a string".format(index, port))
+            if len(errors) > n_errors:
+                continue
+            if target is not None:
+                key = (id(target), target_port)
+                if key in claimed_inputs or _indexed(target, 'in_').by_id(target_port) is not None:
+                    errors.append("edge {}: step {} already has input with id: {}"
+                                  .format(index, target.id, target_port))
+                    continue
+                claimed_inputs.add(key)
+            else:
+                if target_port in claimed_outputs or \
+                        any(output.outputSource for output in outputs.all_by_id(target_port)):
+                    errors.append("edge {}: output parameter {} exists and is already connected"
+                                  .format(index, target_port))
+                    continue
+                claimed_outputs.add(target_port)
+            planned.append((source, source_port, target, target_port))
+
+        if errors:
+            raise ValidationException("Cannot connect edges:\n" + "\n".join(errors))
+        # As _connect_workflow_input and _connect_steps, without checking again
+        inputs = _indexed(self, 'inputs')
+        for source, source_port, target, target_port in planned:
+            if target is None:
+                _connect_workflow_output(self, target_port, source_port, source)
+                continue
+            workflow_step_input = WorkflowStepInput(target_port)
+            if source is None:
+                input_parameter = inputs.by_id(source_port)
+                if not input_parameter:
+                    input_parameter = InputParameter(source_port)
+                    inputs.append(input_parameter)
+                workflow_step_input.source = input_parameter
+            else:
+                source_outputs = _indexed(source, 'out')
+                if not source_outputs.by_id(source_port):
+                    source_outputs.append(WorkflowStepOutput(source_port))
+                workflow_step_input.source = '{}/{}'.format(source.id, source_port)
+            _indexed(target, 'in_').append(workflow_step_input)
+        return self
+
 
+@cwl_schema.cache_saves
 class WorkflowStep(cwl_schema.WorkflowStep):
 
+    __slots__ = cwl_schema.SAVE_CACHE_SLOTS + ('_graph_owners',)
+
     def __init__(self, id, run=None):
         super(WorkflowStep, self).__init__(TemplateDocs.WorkflowStep, id, LOADING_OPTIONS)
+        self.in_ = _IdIndexedList(self.in_, self)
+        self.out = _IdIndexedList(self.out, self)
         if run:
             self.set_run(run)
 
     def add_input(self, step_input):
         if not isinstance(step_input, cwl_schema.WorkflowStepInput):
             raise ValidationException("Not a WorkflowStepInput")
-        input_ids = [i.id for i in self.in_]
-        if step_input.id in input_ids:
+        if _indexed(self, 'in_').by_id(step_input.id) is not None:
             raise ValidationException("Step already has input with id: " + step_input.id)
-        self.in_.append(step_input)
+        _indexed(self, 'in_').append(step_input)
 
     def add_output(self, step_output):
         if not isinstance(step_output, cwl_schema.WorkflowStepOutput):
             raise ValidationException("Not a WorkflowStepOutput")
-        output_ids = [o.id for o in self.out]
-        if step_output.id in output_ids:
+        if _indexed(self, 'out').by_id(step_output.id) is not None:
             raise ValidationException("Step already has output with id: " + step_output.id)
-        self.out.append(step_output)
+        _indexed(self, 'out').append(step_output)
 
     def set_run(self, run):
         # Would like this to be a @property, but that's awkward with the codegen
-        allowed_types = [six.string_types, cwl_schema.CommandLineTool, cwl_schema.ExpressionTool, cwl_schema.Workflow]
+        allowed_types = [six.string_types, cwl_schema.CommandLineTool, cwl_schema.ExpressionTool, cwl_schema.Workflow,
+                         cwl_schema.LazyProcess]
         if not any([isinstance(run, allowed) for allowed in allowed_types]):
             raise ValidationException("Not an allowed type")
         self.run = run
 
+    def workflow_step_input_by_id(self, id):
+        return _indexed(self, 'in_').by_id(id)
+
     def workflow_step_output_by_id(self, id):
-        for workflow_step_output in self.out:
-            if workflow_step_output.id == id:
-                return workflow_step_output
-        return None
+        return _indexed(self, 'out').by_id(id)
 
 
+@cwl_schema.cache_saves
 class WorkflowStepInput(cwl_schema.WorkflowStepInput):
 
+    __slots__ = cwl_schema.SAVE_CACHE_SLOTS + ('_graph_owners',)
+
     def __init__(self, id):
         super(WorkflowStepInput, self).__init__(TemplateDocs.WorkflowStepInput, id, LOADING_OPTIONS)
 
@@ -156,22 +431,32 @@ class WorkflowStepInput(cwl_schema.WorkflowStepInput):
             raise ValidationException("Source must be a string or array of strings")
         # TODO: Inspect the link and make sure the type is valid
         self.source = source
+        _touch(self)
 
 
+@cwl_schema.cache_saves
 class WorkflowStepOutput(cwl_schema.WorkflowStepOutput):
 
+    __slots__ = cwl_schema.SAVE_CACHE_SLOTS
+
     def __init__(self, id):
         super(WorkflowStepOutput, self).__init__(TemplateDocs.WorkflowStepOutput, id, LOADING_OPTIONS)
 
 
+@cwl_schema.cache_saves
 class InputParameter(cwl_schema.InputParameter):
 
+    __slots__ = cwl_schema.SAVE_CACHE_SLOTS
+
     def __init__(self, id):
         super(InputParameter, self).__init__(TemplateDocs.InputParameter, id, LOADING_OPTIONS)
 
 
+@cwl_schema.cache_saves
 class WorkflowOutputParameter(cwl_schema.WorkflowOutputParameter):
 
+    __slots__ = cwl_schema.SAVE_CACHE_SLOTS
+
     def __init__(self, id):
         super(WorkflowOutputParameter, self).__init__(TemplateDocs.WorkflowOutputParameter, id, LOADING_OPTIONS)
 
@@ -195,25 +480,60 @@ class WorkflowStepConnectionBase(object):
         for step in steps:
             if not isinstance(step, cwl_schema.WorkflowStep):
                 raise ValidationException("step is not a WorkflowStep")
-            if step not in workflow.steps:
+            if step not in _indexed(workflow, 'steps'):
                 raise ValidationException("step is not a part of workflow")
         self.workflow = workflow
         self.steps = steps
 
 
+def _connect_workflow_input(workflow, workflow_input_id, step_input_id, step):
+    # If workflow has an input parameter, get it
+    input_parameter = _indexed(workflow, 'inputs').by_id(workflow_input_id)
+    if not input_parameter:
+        input_parameter = InputParameter(workflow_input_id)
+        workflow.add_input_parameter(input_parameter)
+    workflow_step_input = WorkflowStepInput(step_input_id)
+    # Now connect them
+    workflow_step_input.source = input_parameter
+    # This verifies the step is not already connected
+    step.add_input(workflow_step_input)
+
+
+def _connect_steps(output_step, step_output_id, input_step, step_input_id):
+    workflow_step_output = output_step.workflow_step_output_by_id(step_output_id)
+    if not workflow_step_output:
+        workflow_step_output = WorkflowStepOutput(step_output_id)
+        output_step.add_output(workflow_step_output)
+    workflow_step_input = WorkflowStepInput(step_input_id)
+    source = '{}/{}'.format(output_step.id, step_output_id)
+    workflow_step_input.set_source(source)
+    input_step.add_input(workflow_step_input)  # Should raise if already connected
+
+
+def _connect_workflow_output(workflow, workflow_output_id, step_output_id, step):
+    # If step has an output, get it
+    workflow_step_output = step.workflow_step_output_by_id(step_output_id)
+    if not workflow_step_output:
+        workflow_step_output = WorkflowStepOutput(step_output_id)
+        step.add_output(workflow_step_output)
+    # Check existing output parameters
+    output_parameters = _indexed(workflow, 'outputs').all_by_id(workflow_output_id)
+    for output_parameter in output_parameters:
+        if output_parameter.outputSource:
+            raise ValidationException('Output parameter exists and is already connected')
+    if not output_parameters:
+        output_parameters = [WorkflowOutputParameter(workflow_output_id)]
+
+    output_source = '{}/{}'.format(step.id, step_output_id)
+    for output_parameter in output_parameters:
+        output_parameter.set_outputSource(output_source)
+        workflow.add_output_parameter(output_parameter)
+
+
 class WorkflowInputConnection(WorkflowStepConnectionBase):
 
     def _connect_workflow_single_input(self, workflow_input_id, step_input_id, step):
-        # If workflow has an input parameter, get it
-        input_parameter = self.workflow.input_parameter_by_id(workflow_input_id)
-        if not input_parameter:
-            input_parameter = InputParameter(workflow_input_id)
-            self.workflow.add_input_parameter(input_parameter)
-        workflow_step_input = WorkflowStepInput(step_input_id)
-        # Now connect them
-        workflow_step_input.source = input_parameter
-        # This verifies the step is not already connected
-        step.add_input(workflow_step_input)
+        _connect_workflow_input(self.workflow, workflow_input_id, step_input_id, step)
 
     def connect(self, workflow_input_id, step_input_ids):
         """
@@ -235,36 +555,13 @@ class WorkflowStepConnection(WorkflowStepConnectionBase):
         if not len(self.steps) == 2:
             raise ValidationException("Can only connect with two steps")
         output_step, input_step = self.steps
-        workflow_step_output = output_step.workflow_step_output_by_id(step_output_id)
-        if not workflow_step_output:
-            workflow_step_output = WorkflowStepOutput(step_output_id)
-            output_step.add_output(workflow_step_output)
-        workflow_step_input = WorkflowStepInput(step_input_id)
-        source = '{}/{}'.format(output_step.id, step_output_id)
-        workflow_step_input.set_source(source)
-        input_step.add_input(workflow_step_input)  # Should raise if already connected
+        _connect_steps(output_step, step_output_id, input_step, step_input_id)
 
 
 class WorkflowOutputConnection(WorkflowStepConnectionBase):
 
     def _connect_workflow_single_output(self, workflow_output_id, step_output_id, step):
-        # If step has an output, get it
-        workflow_step_output = step.workflow_step_output_by_id(step_output_id)
-        if not workflow_step_output:
-            workflow_step_output = WorkflowStepOutput(step_output_id)
-            step.add_output(workflow_step_output)
-        # Check existing output parameters
-        output_parameters = [output for output in self.workflow.outputs if output.id == workflow_output_id]
-        for output_parameter in output_parameters:
-            if output_parameter.outputSource:
-                raise ValidationException('Output parameter exists and is already connected')
-        if not output_parameters:
-            output_parameters = [WorkflowOutputParameter(workflow_output_id)]
-
-        output_source = '{}/{}'.format(step.id, step_output_id)
-        for output_parameter in output_parameters:
-            output_parameter.set_outputSource(output_source)
-            self.workflow.add_output_parameter(output_parameter)
+        _connect_workflow_output(self.workflow, workflow_output_id, step_output_id, step)
 
     def connect(self, step_output_id, workflow_output_ids):
         """
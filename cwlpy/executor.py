@@ -0,0 +1,522 @@
+import itertools
+import os
+import re
+from collections import deque
+
+import six
+
+import cwl_schema
+from .cwlpy import ValidationException
+from .planner import DEFAULT_CORES, DEFAULT_RAM, _resources
+
+# CWL parameter references, $(inputs.name.path) and the like. Evaluating
+# JavaScript expressions would need a JavaScript engine, so they are refused.
+_PARAMETER_REFERENCE = re.compile(
+    r"\$\((inputs|self|runtime)((?:\.\w+|\['[^']*'\]|\[\"[^\"]*\"\]|\[\d+\])*)\)")
+_SEGMENT = re.compile(r"\.(\w+)|\['([^']*)'\]|\[\"([^\"]*)\"\]|\[(\d+)\]")
+
+# How much of a file loadContents reads, as in the CWL standard
+_CONTENTS_LIMIT = 64 * 1024
+
+
+class JobFailed(Exception):
+    pass
+
+
+def _shortname(id):
+    """The last part of an id: 'word' for both 'file:///wf.cwl#step/word' and 'word'."""
+    return id.split('#')[-1].split('/')[-1]
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _lookup(match, context):
+    value = context[match.group(1)]
+    for segment in _SEGMENT.finditer(match.group(2)):
+        index = segment.group(4)
+        if index is not None:
+            value = value[int(index)]
+            continue
+        key = segment.group(1) or segment.group(2) or segment.group(3)
+        if isinstance(value, list) and key == 'length':
+            value = len(value)
+        elif isinstance(value, dict):
+            value = value.get(key)
+        else:
+            raise ValidationException("Cannot evaluate {}: no {} in {!r}".format(match.group(0), key, value))
+    return value
+
+
+def _to_string(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (dict, list)):
+        import json
+        return json.dumps(value, sort_keys=True)
+    if value is None:
+        return 'null'
+    return six.text_type(value)
+
+
+def _evaluate(value, context):
+    """value with its parameter references replaced by what they refer to in context."""
+    if not isinstance(value, six.string_types) or ('$(' not in value and '${' not in value):
+        return value
+    remainder = _PARAMETER_REFERENCE.sub('', value)
+    if '$(' in remainder or '${' in remainder:
+        raise ValidationException("Only parameter references are supported, not JavaScript: " + value)
+    match = _PARAMETER_REFERENCE.match(value)
+    if match and match.end() == len(value):
+        return _lookup(match, context)
+    return _PARAMETER_REFERENCE.sub(lambda match: _to_string(_lookup(match, context)), value)
+
+
+def _file(path, load_contents=False):
+    path = os.path.abspath(path)
+    basename = os.path.basename(path)
+    if os.path.isdir(path):
+        return {'class': 'Directory', 'location': cwl_schema.file_uri(path), 'path': path,
+                'basename': basename}
+    nameroot, nameext = os.path.splitext(basename)
+    result = {'class': 'File', 'location': cwl_schema.file_uri(path), 'path': path,
+              'basename': basename, 'nameroot': nameroot, 'nameext': nameext,
+              'dirname': os.path.dirname(path), 'size': os.path.getsize(path)}
+    if load_contents:
+        with open(path, 'rb') as f:
+            result['contents'] = f.read(_CONTENTS_LIMIT).decode('utf-8', 'replace')
+    return result
+
+
+def _job_value(value, basedir):
+    """A job order value with Files and Directories given by path or file: location filled in."""
+    if isinstance(value, list):
+        return [_job_value(item, basedir) for item in value]
+    if isinstance(value, dict) and value.get('class') in ('File', 'Directory'):
+        path = value.get('path')
+        if path is None:
+            location = value.get('location', '')
+            if location.startswith('file://'):
+                path = six.moves.urllib.request.url2pathname(six.moves.urllib.parse.urlparse(location).path)
+            elif '://' in location:
+                raise ValidationException("Only local files can be used, not " + location)
+            else:
+                path = location
+        result = _file(os.path.join(basedir, path))
+        if 'contents' in value:
+            result['contents'] = value['contents']
+        return result
+    if isinstance(value, dict):
+        return dict((key, _job_value(item, basedir)) for key, item in six.iteritems(value))
+    return value
+
+
+def _array_schema(type_):
+    for alternative in _as_list(type_):
+        if getattr(alternative, 'type', None) == 'array':
+            return alternative
+    return None
+
+
+def _optional(type_):
+    return isinstance(type_, list) and 'null' in type_
+
+
+def _bind(binding, value, type_, context):
+    """The command line arguments for value bound by binding, an input binding."""
+    if binding.valueFrom is not None:
+        value = _evaluate(binding.valueFrom, dict(context, self=value))
+    if value is None or value is False:
+        return []
+    prefix = binding.prefix
+    separate = binding.separate is not False
+    if value is True:
+        return [prefix] if prefix else []
+    if isinstance(value, list):
+        if not value:
+            return []
+        array = _array_schema(type_)
+        if binding.itemSeparator is not None:
+            rendered = [binding.itemSeparator.join(_argument(item) for item in value)]
+        elif array is not None and array.inputBinding is not None:
+            rendered = []
+            for item in value:
+                rendered.extend(_bind(array.inputBinding, item, array.items, context))
+        else:
+            rendered = [_argument(item) for item in value]
+    else:
+        rendered = [_argument(value)]
+    if not prefix:
+        return rendered
+    if separate:
+        return [prefix] + rendered
+    return [prefix + rendered[0]] + rendered[1:]
+
+
+def _argument(value):
+    if isinstance(value, dict) and 'path' in value:
+        return value['path']
+    return _to_string(value)
+
+
+def _command_line(tool, context):
+    keyed = []
+    for index, argument in enumerate(tool.arguments or []):
+        if isinstance(argument, six.string_types):
+            keyed.append(((0, 0, index), [_to_string(_evaluate(argument, context))]))
+        else:
+            keyed.append(((argument.position or 0, 0, index), _bind(argument, None, None, context)))
+    for parameter in tool.inputs:
+        if parameter.inputBinding is None:
+            continue
+        name = _shortname(parameter.id)
+        value = context['inputs'].get(name)
+        keyed.append(((parameter.inputBinding.position or 0, 1, name),
+                      _bind(parameter.inputBinding, value, parameter.type, context)))
+    keyed.sort(key=lambda pair: pair[0])
+    command = [_to_string(part) for part in _as_list(tool.baseCommand)]
+    for _, arguments in keyed:
+        command.extend(arguments)
+    return command
+
+
+def _requirement(process, class_name):
+    for requirement in (process.requirements or []) + (process.hints or []):
+        if getattr(requirement, 'class_', None) == class_name or \
+                (isinstance(requirement, dict) and requirement.get('class') == class_name):
+            return requirement
+    return None
+
+
+def _environment(tool, context):
+    env = {'HOME': context['runtime']['outdir'], 'TMPDIR': context['runtime']['tmpdir'],
+           'PATH': os.environ.get('PATH', os.defpath)}
+    requirement = _requirement(tool, 'EnvVarRequirement')
+    if requirement is not None:
+        definitions = requirement.get('envDef') if isinstance(requirement, dict) else requirement.envDef
+        if isinstance(definitions, dict):
+            definitions = [{'envName': name, 'envValue': value} for name, value in six.iteritems(definitions)]
+        for definition in definitions or []:
+            if isinstance(definition, dict):
+                name, value = definition['envName'], definition['envValue']
+            else:
+                name, value = definition.envName, definition.envValue
+            env[name] = _to_string(_evaluate(value, context))
+    return env
+
+
+def _collect(tool, context, streams):
+    import glob
+    outdir = context['runtime']['outdir']
+    cwl_output = os.path.join(outdir, 'cwl.output.json')
+    if os.path.exists(cwl_output):
+        import json
+        with open(cwl_output) as f:
+            return _job_value(json.load(f), outdir)
+    outputs = {}
+    for parameter in tool.outputs:
+        name = _shortname(parameter.id)
+        binding = parameter.outputBinding
+        if parameter.type in ('stdout', 'stderr'):
+            value = _file(os.path.join(outdir, streams[parameter.type]))
+        elif binding is not None and binding.glob is not None:
+            paths = []
+            for pattern in _as_list(_evaluate(binding.glob, context)):
+                paths.extend(sorted(glob.glob(os.path.join(outdir, pattern))))
+            files = [_file(path, binding.loadContents) for path in paths]
+            if binding.outputEval is not None:
+                value = _evaluate(binding.outputEval, dict(context, self=files))
+            elif _array_schema(parameter.type) is not None:
+                value = files
+            else:
+                value = files[0] if files else None
+        else:
+            value = None
+        if value is None and not _optional(parameter.type):
+            raise JobFailed("{} produced no {} output".format(tool.id, name))
+        outputs[name] = value
+    return outputs
+
+
+def _shape_results(results, shape):
+    """results, in row major order, nested into lists of the given lengths."""
+    if len(shape) <= 1:
+        return list(results)
+    size = len(results) // shape[0] if shape[0] else 0
+    return [_shape_results(results[k * size:(k + 1) * size], shape[1:]) for k in range(shape[0])]
+
+
+def _default_ram():
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return float('inf')
+
+
+class _Job(object):
+
+    def __init__(self, step, tool, inputs, cores, ram):
+        self.step = step
+        self.tool = tool
+        self.inputs = inputs
+        self.cores = cores
+        self.ram = ram
+
+
+class _StepRun(object):
+    """The jobs a step fans out to, and their outputs as they finish."""
+
+    def __init__(self, name, step, tool, shape, n_jobs):
+        self.name = name
+        self.step = step
+        self.tool = tool
+        self.shape = shape
+        self.results = [None] * n_jobs
+        self.left = n_jobs
+
+
+class LocalExecutor(object):
+    """
+    Runs CommandLineTools, and Workflows of them, as local subprocesses.
+
+    The jobs of a workflow run as soon as the outputs they need are there,
+    as many at a time as the cores and ram (in MiB) allow: each job reserves
+    what its ResourceRequirement asks for, see planner.step_resources().
+    Scattered steps fan out to a job per element, or per combination of
+    elements, following scatterMethod. Parameter references such as
+    $(inputs.name) are evaluated; JavaScript expressions are not supported.
+
+    Each job runs in its own output directory under basedir, created if not
+    given and left in place, as the output Files are there. Relative run and
+    job order paths are taken from base_uri and the current directory.
+    """
+
+    def __init__(self, cores=None, ram=None, basedir=None, base_uri=None):
+        import multiprocessing
+        import tempfile
+        self.cores = cores if cores is not None else multiprocessing.cpu_count()
+        self.ram = ram if ram is not None else _default_ram()
+        self.basedir = basedir if basedir is not None else tempfile.mkdtemp(prefix='cwlpy-')
+        self.base_uri = base_uri if base_uri is not None else cwl_schema.file_uri(os.getcwd()) + '/'
+
+    def run(self, process, job_order):
+        """
+        Runs process, a CommandLineTool or Workflow or the URL of one, with
+        the inputs in job_order, and returns its outputs. Raises JobFailed
+        if a job fails, and ValidationException if the process cannot be run.
+        """
+        process = self._process(process)
+        inputs = self._inputs(process.inputs, job_order)
+        if isinstance(process, cwl_schema.CommandLineTool):
+            cores, ram = self._resources(None, process)
+            return self._run_tool(process, inputs, cores, ram)
+        if isinstance(process, cwl_schema.Workflow):
+            return self._run_workflow(process, inputs)
+        raise ValidationException("Cannot run a " + type(process).__name__)
+
+    def _process(self, process):
+        if isinstance(process, six.string_types):
+            process = cwl_schema.load_document(cwl_schema.LoadingOptions().urljoin(self.base_uri, process))
+        if isinstance(process, cwl_schema.LazyProcess):
+            process = process.resolve()
+        return process
+
+    def _inputs(self, parameters, job_order):
+        inputs = {}
+        for parameter in parameters:
+            name = _shortname(parameter.id)
+            value = job_order.get(name)
+            if value is None:
+                value = parameter.default
+            inputs[name] = _job_value(value, os.getcwd())
+        return inputs
+
+    def _resources(self, step, tool):
+        if step is None:
+            requirement_lists = [tool.requirements, tool.hints]
+        else:
+            requirement_lists = [step.requirements, tool.requirements, step.hints, tool.hints]
+        cores, ram = _resources(requirement_lists, DEFAULT_CORES, DEFAULT_RAM)
+        if cores > self.cores or ram > self.ram:
+            raise ValidationException("{} needs {} cores and {} MiB, more than the {} cores and {} MiB there are"
+                                      .format(step.id if step is not None else tool.id, cores, ram,
+                                              self.cores, self.ram))
+        return cores, ram
+
+    def _run_tool(self, tool, inputs, cores, ram):
+        import subprocess
+        import tempfile
+        import uuid
+        outdir = tempfile.mkdtemp(prefix='job-', dir=self.basedir)
+        tmpdir = tempfile.mkdtemp(prefix='tmp-', dir=self.basedir)
+        runtime = {'outdir': outdir, 'tmpdir': tmpdir, 'cores': cores, 'ram': ram}
+        context = {'inputs': inputs, 'runtime': runtime, 'self': None}
+        command = _command_line(tool, context)
+        streams = {}
+        for stream in ('stdout', 'stderr'):
+            name = _evaluate(getattr(tool, stream), context)
+            if name is None and any(output.type == stream for output in tool.outputs):
+                name = '{}-{}'.format(stream, uuid.uuid4().hex)
+            streams[stream] = name
+        stdin = _evaluate(tool.stdin, context)
+        handles = {}
+        try:
+            if stdin is not None:
+                handles['stdin'] = open(stdin['path'] if isinstance(stdin, dict) else stdin, 'rb')
+            for stream, name in six.iteritems(streams):
+                if name is not None:
+                    handles[stream] = open(os.path.join(outdir, name), 'wb')
+            try:
+                code = subprocess.call(command, cwd=outdir, env=_environment(tool, context), **handles)
+            except OSError as e:
+                raise JobFailed("Cannot run {}: {}".format(' '.join(command), e))
+        finally:
+            for handle in handles.values():
+                handle.close()
+        if code not in (tool.successCodes or [0]):
+            raise JobFailed("{} exited with {}".format(' '.join(command), code))
+        return _collect(tool, context, streams)
+
+    def _run_workflow(self, workflow, inputs):
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        steps = dict((_shortname(step.id), step) for step in workflow.steps)
+        values = dict(((None, name), value) for name, value in six.iteritems(inputs))
+
+        def source_key(source):
+            if not isinstance(source, six.string_types):
+                source = source.id
+            parts = source.split('#')[-1].split('/')
+            if len(parts) > 1 and parts[-2] in steps:
+                return parts[-2], parts[-1]
+            if (None, parts[-1]) in values:
+                return None, parts[-1]
+            raise ValidationException("Unknown source " + source)
+
+        def merge(sources, link_merge):
+            found = [values[source_key(source)] for source in _as_list(sources)]
+            if not isinstance(sources, list):
+                return found[0]
+            if link_merge is not None and _shortname(link_merge) == 'merge_flattened':
+                return [item for value in found for item in _as_list(value)]
+            return found
+
+        needs = {}
+        for name, step in six.iteritems(steps):
+            needs[name] = set(key for step_input in step.in_
+                              for key in map(source_key, _as_list(step_input.source))
+                              if key[0] is not None)
+        waiting = deque(_shortname(step.id) for step in workflow.steps)
+        queue = deque()
+        running = {}
+        free = [self.cores, self.ram]
+
+        def start_ready_steps():
+            # A step scattered over nothing finishes at once, and may make others ready
+            started = True
+            while started:
+                started = False
+                for _ in range(len(waiting)):
+                    name = waiting.popleft()
+                    if needs[name].issubset(values):
+                        queue.extend(self._step_jobs(name, steps[name], merge, values))
+                        started = True
+                    else:
+                        waiting.append(name)
+
+        with ThreadPoolExecutor(max_workers=max(1, int(self.cores))) as pool:
+            start_ready_steps()
+            while queue or running:
+                for _ in range(len(queue)):
+                    job = queue.popleft()
+                    if job.cores <= free[0] and job.ram <= free[1]:
+                        free[0] -= job.cores
+                        free[1] -= job.ram
+                        running[pool.submit(self._run_tool, job.tool, job.inputs, job.cores, job.ram)] = job
+                    else:
+                        queue.append(job)
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    free[0] += job.cores
+                    free[1] += job.ram
+                    try:
+                        result = future.result()
+                    except Exception:
+                        queue.clear()
+                        raise
+                    step_run, index = job.step
+                    step_run.results[index] = result
+                    step_run.left -= 1
+                    if not step_run.left:
+                        self._finish_step(step_run, values)
+                start_ready_steps()
+        if waiting:
+            raise ValidationException("Steps never got their inputs: " + ", ".join(sorted(waiting)))
+
+        outputs = {}
+        for parameter in workflow.outputs:
+            outputs[_shortname(parameter.id)] = merge(parameter.outputSource, parameter.linkMerge)
+        return outputs
+
+    def _step_jobs(self, name, step, merge, values):
+        tool = self._process(step.run)
+        if not isinstance(tool, cwl_schema.CommandLineTool):
+            raise ValidationException("Only CommandLineTool steps can be run, {} runs a {}"
+                                      .format(name, type(tool).__name__))
+        cores, ram = self._resources(step, tool)
+        step_inputs = {}
+        for step_input in step.in_:
+            value = None
+            if step_input.source is not None:
+                value = merge(step_input.source, step_input.linkMerge)
+            if value is None:
+                value = _job_value(step_input.default, os.getcwd())
+            step_inputs[_shortname(step_input.id)] = value
+        value_from = dict((_shortname(step_input.id), step_input.valueFrom)
+                          for step_input in step.in_ if step_input.valueFrom is not None)
+
+        scatter = [_shortname(item) for item in _as_list(step.scatter)]
+        method = _shortname(step.scatterMethod or 'dotproduct')
+        if not scatter:
+            shape, combinations = (), [()]
+        elif method == 'dotproduct' or len(scatter) == 1:
+            lengths = set(len(_as_list(step_inputs[item])) for item in scatter)
+            if len(lengths) > 1:
+                raise ValidationException("Scattered inputs of {} differ in length".format(name))
+            length = lengths.pop()
+            shape, combinations = (length,), [tuple([k] * len(scatter)) for k in range(length)]
+        else:
+            shape = tuple(len(_as_list(step_inputs[item])) for item in scatter)
+            combinations = list(itertools.product(*[range(length) for length in shape]))
+            if method == 'flat_crossproduct':
+                shape = (len(combinations),)
+
+        step_run = _StepRun(name, step, tool, shape, len(combinations))
+        jobs = []
+        for index, combination in enumerate(combinations):
+            job_inputs = dict(step_inputs)
+            for item, k in zip(scatter, combination):
+                job_inputs[item] = step_inputs[item][k]
+            for item, expression in six.iteritems(value_from):
+                job_inputs[item] = _evaluate(expression, {'inputs': job_inputs, 'self': job_inputs[item],
+                                                          'runtime': {}})
+            for parameter in tool.inputs:
+                if job_inputs.get(_shortname(parameter.id)) is None and parameter.default is not None:
+                    job_inputs[_shortname(parameter.id)] = _job_value(parameter.default, os.getcwd())
+            jobs.append(_Job((step_run, index), tool, job_inputs, cores, ram))
+        if not jobs:
+            self._finish_step(step_run, values)
+        return jobs
+
+    def _finish_step(self, step_run, values):
+        for output in step_run.step.out:
+            name = _shortname(output if isinstance(output, six.string_types) else output.id)
+            found = [result.get(name) for result in step_run.results]
+            if step_run.shape:
+                values[(step_run.name, name)] = _shape_results(found, step_run.shape)
+            else:
+                values[(step_run.name, name)] = found[0]
@@ -0,0 +1,221 @@
+from array import array
+
+import six
+
+from .cwlpy import ValidationException
+
+
+def _csr(n, heads, tails):
+    """
+    Compressed sparse rows of the edges heads[k] -> tails[k]: the neighbours
+    of node i are neighbours[offsets[i]:offsets[i + 1]], in edge order.
+    """
+    # Lists while filling in, as indexing them is faster than indexing arrays
+    offsets = [0] * (n + 1)
+    for head in heads:
+        offsets[head + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    fill = offsets[:-1]
+    neighbours = [0] * len(heads)
+    for head, tail in six.moves.zip(heads, tails):
+        neighbours[fill[head]] = tail
+        fill[head] += 1
+    return array('i', offsets), array('i', neighbours)
+
+
+def _source_strings(source):
+    if isinstance(source, six.string_types):
+        return (source,)
+    if isinstance(source, list):
+        return source
+    return ()
+
+
+class WorkflowGraph(object):
+    """
+    The steps of a workflow and the dependencies between them, as read from
+    the source of each step input: a source 'step/output' makes the step that
+    has the input depend on step. Sources that are workflow inputs add no
+    dependency, and a step depending on another in several ways has one edge.
+
+    Steps are numbered in the order of workflow.steps, and ids[i] is the id of
+    step i. Adjacency is kept as compressed sparse rows of int arrays: the
+    steps that step i depends on are
+    predecessor_targets[predecessor_offsets[i]:predecessor_offsets[i + 1]],
+    and those depending on it likewise in successor_offsets and
+    successor_targets. Every analysis takes time linear in the number of
+    steps and dependencies.
+    """
+
+    def __init__(self, workflow):
+        steps = workflow.steps or []
+        self.ids = [step.id for step in steps]
+        self.index = dict((id, i) for i, id in enumerate(self.ids))
+        n = len(self.ids)
+        heads = []
+        tails = []
+        last = [-1] * n
+        for j, step in enumerate(steps):
+            for step_input in step.in_ or ():
+                for source in _source_strings(step_input.source):
+                    step_id, slash, _ = source.rpartition('/')
+                    i = self.index.get(step_id) if slash else None
+                    if i is not None and last[i] != j:
+                        last[i] = j
+                        heads.append(i)
+                        tails.append(j)
+        self.edge_count = len(heads)
+        self.successor_offsets, self.successor_targets = _csr(n, heads, tails)
+        self.predecessor_offsets, self.predecessor_targets = _csr(n, tails, heads)
+        self._order = None
+        self._cycle = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def index_of(self, step_id):
+        return self.index[step_id]
+
+    def successors(self, i):
+        return self.successor_targets[self.successor_offsets[i]:self.successor_offsets[i + 1]]
+
+    def predecessors(self, i):
+        return self.predecessor_targets[self.predecessor_offsets[i]:self.predecessor_offsets[i + 1]]
+
+    def _sort(self):
+        n = len(self.ids)
+        offsets, targets = self.successor_offsets, self.successor_targets
+        indegree = array('i', [0]) * n
+        for target in targets:
+            indegree[target] += 1
+        order = array('i', (i for i in range(n) if not indegree[i]))
+        k = 0
+        while k < len(order):
+            i = order[k]
+            k += 1
+            for e in range(offsets[i], offsets[i + 1]):
+                target = targets[e]
+                indegree[target] -= 1
+                if not indegree[target]:
+                    order.append(target)
+        if len(order) == n:
+            self._order = order
+            self._cycle = []
+            return
+        # Every step left has a predecessor that is also left: walking back
+        # through them must come round to a step already walked through
+        offsets, sources = self.predecessor_offsets, self.predecessor_targets
+        walked = array('i', [-1]) * n
+        path = []
+        i = next(i for i in range(n) if indegree[i])
+        while walked[i] < 0:
+            walked[i] = len(path)
+            path.append(i)
+            i = next(sources[e] for e in range(offsets[i], offsets[i + 1]) if indegree[sources[e]])
+        cycle = path[walked[i]:]
+        cycle.reverse()
+        self._cycle = cycle
+
+    def find_cycle(self):
+        """The steps of a dependency cycle, each depending on the one before it, or None."""
+        if self._cycle is None:
+            self._sort()
+        return list(self._cycle) or None
+
+    def is_acyclic(self):
+        return self.find_cycle() is None
+
+    def topological_order(self):
+        """
+        The steps, each after every step it depends on, as an int array.
+        Raises ValidationException if the dependencies have a cycle.
+        """
+        cycle = self.find_cycle()
+        if cycle is not None:
+            raise ValidationException("Steps depend on each other: " +
+                                      " -> ".join(self.ids[i] for i in cycle + cycle[:1]))
+        return self._order
+
+    def components(self):
+        """
+        Returns (count, labels), labels[i] being the number of the connected
+        component of step i, ignoring the direction of dependencies. Components
+        are numbered in the order of their first step.
+        """
+        n = len(self.ids)
+        labels = array('i', [-1]) * n
+        count = 0
+        stack = array('i')
+        for start in range(n):
+            if labels[start] >= 0:
+                continue
+            labels[start] = count
+            stack.append(start)
+            while stack:
+                i = stack.pop()
+                for offsets, targets in ((self.successor_offsets, self.successor_targets),
+                                         (self.predecessor_offsets, self.predecessor_targets)):
+                    for e in range(offsets[i], offsets[i + 1]):
+                        target = targets[e]
+                        if labels[target] < 0:
+                            labels[target] = count
+                            stack.append(target)
+            count += 1
+        return count, labels
+
+    def _reachable(self, i, offsets, targets):
+        seen = bytearray(len(self.ids))
+        seen[i] = 1
+        found = array('i', [i])
+        k = 0
+        while k < len(found):
+            j = found[k]
+            k += 1
+            for e in range(offsets[j], offsets[j + 1]):
+                target = targets[e]
+                if not seen[target]:
+                    seen[target] = 1
+                    found.append(target)
+        return found[1:]
+
+    def ancestors(self, i):
+        """The steps that step i depends on, directly or not, nearest first."""
+        return self._reachable(i, self.predecessor_offsets, self.predecessor_targets)
+
+    def descendants(self, i):
+        """The steps that depend on step i, directly or not, nearest first."""
+        return self._reachable(i, self.successor_offsets, self.successor_targets)
+
+    def longest_path(self, weights=None):
+        """
+        Returns (length, steps) for the chain of dependent steps with the
+        largest total weight, weights[i] being that of step i, or 1 for every
+        step if not given. Raises ValidationException if the dependencies have
+        a cycle.
+        """
+        order = self.topological_order()
+        n = len(self.ids)
+        if not n:
+            return 0, []
+        if weights is None:
+            weights = array('i', [1]) * n
+        offsets, sources = self.predecessor_offsets, self.predecessor_targets
+        lengths = [0] * n
+        previous = array('i', [-1]) * n
+        for i in order:
+            best = 0
+            for e in range(offsets[i], offsets[i + 1]):
+                source = sources[e]
+                if previous[i] < 0 or lengths[source] > best:
+                    best = lengths[source]
+                    previous[i] = source
+            lengths[i] = best + weights[i]
+        end = max(range(n), key=lengths.__getitem__)
+        path = []
+        i = end
+        while i >= 0:
+            path.append(i)
+            i = previous[i]
+        path.reverse()
+        return lengths[end], path
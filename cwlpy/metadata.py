@@ -0,0 +1,212 @@
+import os
+import stat as stat_module
+
+import six
+
+import cwl_schema
+
+_FILE_CLASSES = (cwl_schema.File, cwl_schema.Directory)
+
+
+def _get(node, key):
+    if isinstance(node, dict):
+        return node.get(key)
+    return getattr(node, key, None)
+
+
+def _set(node, key, value):
+    if isinstance(node, dict):
+        node[key] = value
+    else:
+        setattr(node, key, value)
+
+
+def _path(node):
+    """The local path of a File or Directory, or None if it is not on the local filesystem."""
+    path = _get(node, 'path')
+    if path:
+        return path
+    location = _get(node, 'location')
+    if not location:
+        return None
+    if location.startswith('file://'):
+        return six.moves.urllib.request.url2pathname(six.moves.urllib.parse.urlparse(location).path)
+    if '://' in location or location.startswith('_:'):
+        return None
+    return location
+
+
+def _stamp(stat):
+    """What tells whether a file may have changed since it was hashed."""
+    mtime = getattr(stat, 'st_mtime_ns', None)
+    return [stat.st_size, stat.st_mtime if mtime is None else mtime, stat.st_ino]
+
+
+def _sha1(path, size):
+    import hashlib
+    import mmap
+    digest = hashlib.sha1()
+    if size:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # hashlib lets go of the GIL while hashing large buffers
+                digest.update(mapped)
+            finally:
+                mapped.close()
+    return 'sha1$' + digest.hexdigest()
+
+
+def _default_workers():
+    # As concurrent.futures does from Python 3.8: hashing waits on reads too
+    import multiprocessing
+    return min(32, multiprocessing.cpu_count() + 4)
+
+
+def _scandir(path):
+    """(name, is_dir) for each entry of the directory path, by name."""
+    scandir = getattr(os, 'scandir', None)
+    if scandir is None:
+        return sorted((name, os.path.isdir(os.path.join(path, name))) for name in os.listdir(path))
+    entries = scandir(path)
+    try:
+        return sorted((entry.name, entry.is_dir()) for entry in entries)
+    finally:
+        if hasattr(entries, 'close'):
+            entries.close()
+
+
+class ChecksumCache(object):
+    """
+    Checksums of files by path, kept for as long as the size, modification
+    time and inode of the file stay the same. Given a path, the cache is
+    read from that JSON file, and save() writes it back, so that unchanged
+    files are not hashed again in later runs.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.changed = False
+        if path is not None and os.path.exists(path):
+            import json
+            with open(path) as f:
+                self.entries = json.load(f)
+
+    def get(self, path, stat):
+        entry = self.entries.get(path)
+        if entry is not None and entry[:3] == _stamp(stat):
+            return entry[3]
+        return None
+
+    def put(self, path, stat, checksum):
+        self.entries[path] = _stamp(stat) + [checksum]
+        self.changed = True
+
+    def save(self):
+        if self.path is None or not self.changed:
+            return
+        import json
+        temporary = '{}.{}.tmp'.format(self.path, os.getpid())
+        with open(temporary, 'w') as f:
+            json.dump(self.entries, f)
+        getattr(os, 'replace', os.rename)(temporary, self.path)
+        self.changed = False
+
+
+def _listing_entry(parent, path, is_dir):
+    location = cwl_schema.file_uri(path)
+    class_name = 'Directory' if is_dir else 'File'
+    if isinstance(parent, dict):
+        return {'class': class_name, 'location': location}
+    cls = cwl_schema.Directory if is_dir else cwl_schema.File
+    return cls({'class': class_name, 'location': location}, location, parent.loadingOptions)
+
+
+def _find(value, found):
+    """Appends the Files and Directories in value to found, outermost first."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, _FILE_CLASSES) or (isinstance(value, dict) and
+                                                value.get('class') in ('File', 'Directory')):
+            found.append(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+def fill_metadata(value, checksums=True, listing=True, cache=None, max_workers=None):
+    """
+    Fills in the basename, nameroot, nameext, size and checksum of every
+    File in value, and the basename and listing of every Directory, and
+    returns value. value is a job order or outputs, with File and Directory
+    literals as dicts or as cwl_schema objects, anywhere in records and
+    arrays; secondaryFiles and listings already there are filled in too.
+
+    Fields already set are left as they are, and Files and Directories that
+    are not local, or do not exist, are skipped. Listings are read for
+    every Directory, nested ones included, unless listing is False.
+
+    Checksums are SHA-1, as 'sha1$<hex>', computed from memory mapped files
+    on a pool of max_workers threads, unless checksums is False. With a
+    ChecksumCache, files that have not changed since are not read again,
+    and the cache is saved if it has a path.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    nodes = []
+    _find(value, nodes)
+    # Each file is hashed once, however many Files refer to it
+    to_hash = {}
+    k = 0
+    while k < len(nodes):
+        node = nodes[k]
+        k += 1
+        path = _path(node)
+        if path is None:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        basename = _get(node, 'basename')
+        if basename is None:
+            basename = os.path.basename(path.rstrip(os.sep)) or path
+            _set(node, 'basename', basename)
+        if stat_module.S_ISDIR(stat.st_mode):
+            entries = _get(node, 'listing')
+            if entries is None and listing:
+                entries = [_listing_entry(node, os.path.join(path, name), is_dir)
+                           for name, is_dir in _scandir(path)]
+                _set(node, 'listing', entries)
+            nodes.extend(entries or ())
+            continue
+        nameroot, nameext = os.path.splitext(basename)
+        if _get(node, 'nameroot') is None:
+            _set(node, 'nameroot', nameroot)
+        if _get(node, 'nameext') is None:
+            _set(node, 'nameext', nameext)
+        nodes.extend(_get(node, 'secondaryFiles') or ())
+        if _get(node, 'size') is None:
+            _set(node, 'size', stat.st_size)
+        if checksums and _get(node, 'checksum') is None:
+            checksum = cache.get(path, stat) if cache is not None else None
+            if checksum is None:
+                to_hash.setdefault(path, (stat, []))[1].append(node)
+            else:
+                _set(node, 'checksum', checksum)
+
+    if to_hash:
+        items = list(to_hash.items())
+        with ThreadPoolExecutor(max_workers=max_workers or _default_workers()) as pool:
+            digests = pool.map(lambda item: _sha1(item[0], item[1][0].st_size), items)
+            for (path, (stat, hashed)), checksum in six.moves.zip(items, digests):
+                for node in hashed:
+                    _set(node, 'checksum', checksum)
+                if cache is not None:
+                    cache.put(path, stat, checksum)
+    if cache is not None:
+        cache.save()
+    return value
@@ -0,0 +1,202 @@
+import heapq
+import numbers
+
+import six
+
+import cwl_schema
+from .cwlpy import ValidationException
+from .graph import WorkflowGraph
+
+# What cwltool reserves for a step without a ResourceRequirement
+DEFAULT_CORES = 1
+DEFAULT_RAM = 1024
+
+
+def _resource_requirement(requirements):
+    for requirement in requirements or ():
+        if isinstance(requirement, cwl_schema.ResourceRequirement):
+            return requirement.coresMin, requirement.coresMax, requirement.ramMin, requirement.ramMax
+        if isinstance(requirement, dict) and requirement.get('class') == 'ResourceRequirement':
+            return (requirement.get('coresMin'), requirement.get('coresMax'),
+                    requirement.get('ramMin'), requirement.get('ramMax'))
+    return None
+
+
+def _amount(minimum, maximum):
+    # "If "max" is specified by "min" is not, then "min" == "max"". Expressions
+    # cannot be evaluated here, and count as not specified.
+    for value in (minimum, maximum):
+        if isinstance(value, numbers.Number) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def step_resources(step, default_cores=DEFAULT_CORES, default_ram=DEFAULT_RAM):
+    """
+    The (cores, ram) a step reserves, ram in MiB, from the first
+    ResourceRequirement in the step's requirements, its tool's requirements,
+    the step's hints and the tool's hints, in that order. Resources not given
+    there, or given as expressions, are the defaults.
+    """
+    run = step.run if not isinstance(step.run, six.string_types) else None
+    return _resources([step.requirements, getattr(run, 'requirements', None),
+                       step.hints, getattr(run, 'hints', None)], default_cores, default_ram)
+
+
+def _resources(requirement_lists, default_cores, default_ram):
+    cores = ram = None
+    for requirements in requirement_lists:
+        found = _resource_requirement(requirements)
+        if found is not None:
+            cores = _amount(found[0], found[1])
+            ram = _amount(found[2], found[3])
+            break
+    return (default_cores if cores is None else cores,
+            default_ram if ram is None else ram)
+
+
+def _runtime(step, runtimes, default_runtime):
+    if runtimes is None:
+        return default_runtime
+    if callable(runtimes):
+        runtime = runtimes(step)
+        return default_runtime if runtime is None else runtime
+    if step.id in runtimes:
+        return runtimes[step.id]
+    run = step.run if isinstance(step.run, six.string_types) else getattr(step.run, 'id', None)
+    return runtimes.get(run, default_runtime)
+
+
+class Plan(object):
+    """
+    Estimated schedule of a workflow on a pool of nodes. For step i, ids[i]
+    is its id, runtimes[i] its estimated runtime, resources[i] the (cores,
+    ram) it reserves, and it runs from start[i] on node node[i].
+    """
+
+    def __init__(self, ids, runtimes, resources, nodes):
+        self.ids = ids
+        self.runtimes = runtimes
+        self.resources = resources
+        self.nodes = nodes
+        self.start = [0.0] * len(ids)
+        self.node = [-1] * len(ids)
+        self.makespan = 0.0
+        self.critical_path = []
+        self.critical_path_length = 0.0
+
+    @property
+    def finish(self):
+        return [start + runtime for start, runtime in six.moves.zip(self.start, self.runtimes)]
+
+    def _utilization(self, k):
+        capacity = sum(node[k] for node in self.nodes) * self.makespan
+        if not capacity:
+            return 0.0
+        used = sum(runtime * resources[k] for runtime, resources in six.moves.zip(self.runtimes, self.resources))
+        return float(used) / capacity
+
+    @property
+    def core_utilization(self):
+        """Fraction of the pool's core time reserved by steps until the makespan."""
+        return self._utilization(0)
+
+    @property
+    def ram_utilization(self):
+        """Fraction of the pool's memory time reserved by steps until the makespan."""
+        return self._utilization(1)
+
+
+def plan(workflow, nodes, runtimes=None, default_runtime=1.0,
+         default_cores=DEFAULT_CORES, default_ram=DEFAULT_RAM):
+    """
+    Estimates how a workflow runs on nodes, a list of (cores, ram) pairs with
+    ram in MiB, or a single pair for one machine.
+
+    runtimes maps step ids, or the run of steps (a tool's URL or id), to their
+    estimated runtime, or is a function of the step returning it or None;
+    steps without an estimate take default_runtime. Resources are read with
+    step_resources().
+
+    Steps are list scheduled: whenever a step finishes, the steps whose
+    dependencies have all finished are started on the first node with room
+    for them, longest remaining chain of dependent steps first, and smaller
+    steps may start ahead of a larger one that does not fit yet. Returns a
+    Plan, with the critical path: the chain of dependent steps with the most
+    runtime, which no pool can run faster than. Raises ValidationException
+    if a step fits on no node or the steps depend on each other in a cycle.
+    """
+    if nodes and isinstance(nodes[0], numbers.Number):
+        nodes = [nodes]
+    nodes = [tuple(node) for node in nodes]
+    steps = list(workflow.steps or [])
+    graph = workflow.graph() if hasattr(workflow, 'graph') else WorkflowGraph(workflow)
+    n = len(steps)
+    times = [_runtime(step, runtimes, default_runtime) for step in steps]
+    resources = [step_resources(step, default_cores, default_ram) for step in steps]
+    result = Plan(graph.ids, times, resources, nodes)
+
+    too_large = [graph.ids[i] for i in range(n)
+                 if not any(cores >= resources[i][0] and ram >= resources[i][1] for cores, ram in nodes)]
+    if too_large:
+        raise ValidationException("Steps fit on no node: " + ", ".join(too_large))
+
+    order = graph.topological_order()
+    result.critical_path_length, path = graph.longest_path(times)
+    result.critical_path = [graph.ids[i] for i in path]
+
+    # Longest chain of runtimes from each step to the end, its priority
+    offsets, targets = graph.successor_offsets, graph.successor_targets
+    rank = [0.0] * n
+    for i in reversed(order):
+        tail = 0.0
+        for e in range(offsets[i], offsets[i + 1]):
+            tail = max(tail, rank[targets[e]])
+        rank[i] = times[i] + tail
+
+    # Ready steps, in a heap per (cores, ram) shape as there are few shapes
+    ready = {}
+    waiting = [graph.predecessor_offsets[i + 1] - graph.predecessor_offsets[i] for i in range(n)]
+
+    def make_ready(i):
+        heapq.heappush(ready.setdefault(resources[i], []), (-rank[i], i))
+
+    for i in range(n):
+        if not waiting[i]:
+            make_ready(i)
+    free = [list(node) for node in nodes]
+    running = []
+    now = 0.0
+    done = 0
+    while done < n:
+        while True:
+            best = None
+            for shape, queue in six.iteritems(ready):
+                if queue and (best is None or queue[0] < best[0]):
+                    node = next((k for k, (cores, ram) in enumerate(free)
+                                 if cores >= shape[0] and ram >= shape[1]), None)
+                    if node is not None:
+                        best = (queue[0], shape, node)
+            if best is None:
+                break
+            (_, i), shape, node = best
+            heapq.heappop(ready[shape])
+            free[node][0] -= shape[0]
+            free[node][1] -= shape[1]
+            result.start[i] = now
+            result.node[i] = node
+            heapq.heappush(running, (now + times[i], i))
+        now = running[0][0]
+        while running and running[0][0] == now:
+            _, i = heapq.heappop(running)
+            done += 1
+            node = result.node[i]
+            free[node][0] += resources[i][0]
+            free[node][1] += resources[i][1]
+            for e in range(offsets[i], offsets[i + 1]):
+                target = targets[e]
+                waiting[target] -= 1
+                if not waiting[target]:
+                    make_ready(target)
+    result.makespan = now
+    return result
@@ -0,0 +1,277 @@
+import six
+
+import cwl_schema
+
+# Text is handed to the stream in pieces of about this many characters
+_CHUNK = 64 * 1024
+
+
+class _Field(cwl_schema.Savable):
+
+    def __init__(self, name):
+        self.name = name
+
+    def save(self, top=False):
+        return self
+
+
+class _Probe(object):
+    """Stands in for a record, every field of it a _Field naming the attribute read."""
+
+    loadingOptions = None
+    extension_fields = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _Field(name)
+
+
+_layouts = {}
+
+
+def _layout(cls):
+    """
+    [(key, attribute, constant)] for the fields cls.save() writes, in order,
+    found by saving a _Probe: constant is the value of fields that do not
+    come from an attribute, as 'class', and attribute is None for them.
+    """
+    layout = _layouts.get(cls)
+    if layout is None:
+        save = six.get_unbound_function(cls.save)
+        # The generated save(), not the caching one of cwl_schema.cache_saves()
+        save = getattr(save, '__wrapped__', save)
+        saved = save(_Probe(), top=False)
+        layout = [(key, value.name, None) if isinstance(value, _Field) else (key, None, value)
+                  for key, value in saved.items()]
+        _layouts[cls] = layout
+    return layout
+
+
+def _saved_as(value, saved):
+    """
+    (value, saved) for a value of a record, as _items() gives them, with a
+    LazyProcess of a URL, which saves as that URL, in place of its value.
+    """
+    if not saved and isinstance(value, cwl_schema.LazyProcess) and value.url is not None:
+        return value.url, True
+    return value, saved
+
+
+def _items(obj, top):
+    """
+    The (key, value, saved) of what obj.save(top) returns, without saving the
+    values: saved is True for values the result holds as they are, and False
+    for values the result holds save(value) of.
+    """
+    if isinstance(obj, cwl_schema.LazyProcess):
+        # An inline process: one of a URL is saved as its URL, see _saved_as()
+        obj = obj.resolve()
+    items = []
+    index = {}
+
+    def put(key, value, saved):
+        if key in index:
+            items[index[key]] = (key, value, saved)
+        else:
+            index[key] = len(items)
+            items.append((key, value, saved))
+
+    for ef in obj.extension_fields:
+        put(cwl_schema.prefix_url(ef, obj.loadingOptions.vocab), obj.extension_fields[ef], True)
+    for key, attribute, constant in _layout(type(obj)):
+        if attribute is None:
+            put(key, constant, True)
+        else:
+            value = getattr(obj, attribute)
+            if value is not None:
+                put(key, value, False)
+    if top and obj.loadingOptions.namespaces:
+        put("$namespaces", obj.loadingOptions.namespaces, True)
+    return items
+
+
+class _Writer(object):
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.pieces = []
+        self.size = 0
+
+    def write(self, text):
+        self.pieces.append(text)
+        self.size += len(text)
+        if self.size >= _CHUNK:
+            self.flush()
+
+    def flush(self):
+        if self.pieces:
+            self.stream.write(self.pieces[0][:0].join(self.pieces))
+            self.pieces = []
+            self.size = 0
+
+
+class _Anchors(dict):
+    """The serializer's anchors, of the nodes that have one."""
+
+    def __missing__(self, node):
+        return None
+
+
+class _Serialized(dict):
+    """The serializer's written nodes, of those that later ones may be aliases of."""
+
+    def __init__(self, anchored):
+        dict.__init__(self)
+        self.anchored = anchored
+
+    def __setitem__(self, node, value):
+        if node in self.anchored:
+            dict.__setitem__(self, node, value)
+
+
+def dump_json(obj, stream, top=False, indent=None, separators=None, sort_keys=False, ensure_ascii=True):
+    """
+    Writes obj, a cwl_schema record such as a Workflow, to stream as the same
+    text as json.dump(save(obj, top), stream, ...) with the same arguments
+    would, but as it goes along, never holding save(obj, top) in memory.
+    """
+    import json
+    if separators is None:
+        separators = (',', ': ') if indent is not None else (', ', ': ')
+    item_separator, key_separator = separators
+    encoder = json.JSONEncoder(indent=indent, separators=separators, sort_keys=sort_keys,
+                               ensure_ascii=ensure_ascii)
+    if isinstance(indent, six.integer_types):
+        indent = ' ' * indent
+    writer = _Writer(stream)
+    write = writer.write
+
+    def newline(level):
+        if indent is not None:
+            write('\n' + indent * level)
+
+    def saved(value, level):
+        # As json would, re-indented to where it goes
+        text = encoder.encode(value)
+        if indent is not None and level and '\n' in text:
+            text = text.replace('\n', '\n' + indent * level)
+        write(text)
+
+    def value_of(value, level, is_saved, top=False):
+        value, is_saved = _saved_as(value, is_saved)
+        if is_saved or not (isinstance(value, (cwl_schema.Savable, list))):
+            saved(value, level)
+        elif isinstance(value, list):
+            if not value:
+                write('[]')
+                return
+            write('[')
+            for k, item in enumerate(value):
+                if k:
+                    write(item_separator)
+                newline(level + 1)
+                value_of(item, level + 1, False)
+            newline(level)
+            write(']')
+        else:
+            record(value, level, top)
+
+    def record(obj, level, top):
+        items = _items(obj, top)
+        if not items:
+            write('{}')
+            return
+        if sort_keys:
+            items.sort(key=lambda item: item[0])
+        write('{')
+        for k, (key, value, is_saved) in enumerate(items):
+            if k:
+                write(item_separator)
+            newline(level + 1)
+            write(encoder.encode(key))
+            write(key_separator)
+            value_of(value, level + 1, is_saved)
+        newline(level)
+        write('}')
+
+    value_of(obj, 0, False, top)
+    writer.flush()
+
+
+def dump_yaml(obj, stream, top=False, **kwargs):
+    """
+    Writes obj, a cwl_schema record such as a Workflow, to stream as the same
+    text as yaml.safe_dump(save(obj, top), stream, default_flow_style=False,
+    ...) with the same keyword arguments would, but as it goes along, never
+    holding save(obj, top) in memory. Events for the records and lists that
+    save() would create are handed to the emitter directly; everything else
+    goes through the representer, so that styles and anchors come out the
+    same.
+    """
+    from ruamel.yaml.dumper import SafeDumper
+    from ruamel.yaml.events import (DocumentStartEvent, DocumentEndEvent, MappingStartEvent,
+                                    MappingEndEvent, SequenceStartEvent, SequenceEndEvent)
+    from ruamel.yaml.nodes import MappingNode, SequenceNode
+
+    kwargs.setdefault('default_flow_style', False)
+    writer = _Writer(stream)
+    dumper = SafeDumper(writer, **kwargs)
+
+    def start_event(event_class, node_class, tag, length):
+        # As the serializer makes them for a node of a fresh record or list
+        node = node_class(tag, [], flow_style=dumper.default_flow_style)
+        tag = getattr(node, 'ctag', node.tag)
+        implicit = tag == dumper.resolve(node_class, node.value, True)
+        return event_class(None, tag, implicit, flow_style=node.flow_style, nr_items=length)
+
+    def walk(value, is_saved, top=False):
+        """The values held as they are in save(value, top), depth first."""
+        value, is_saved = _saved_as(value, is_saved)
+        if is_saved or not isinstance(value, (cwl_schema.Savable, list)):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                for found in walk(item, False):
+                    yield found
+        else:
+            for _, item, item_saved in items_of(value, top):
+                for found in walk(item, item_saved):
+                    yield found
+
+    def items_of(value, top):
+        return sorted(_items(value, top), key=lambda item: item[0])
+
+    def emit_value(value, is_saved, top=False):
+        value, is_saved = _saved_as(value, is_saved)
+        if is_saved or not isinstance(value, (cwl_schema.Savable, list)):
+            dumper.serialize_node(dumper.represent_data(value), None, None)
+        elif isinstance(value, list):
+            dumper.emit(start_event(SequenceStartEvent, SequenceNode, u'tag:yaml.org,2002:seq', len(value)))
+            for item in value:
+                emit_value(item, False)
+            dumper.emit(SequenceEndEvent())
+        else:
+            items = items_of(value, top)
+            dumper.emit(start_event(MappingStartEvent, MappingNode, u'tag:yaml.org,2002:map', len(items)))
+            for key, item, item_saved in items:
+                emit_value(key, True)
+                emit_value(item, item_saved)
+            dumper.emit(MappingEndEvent())
+
+    dumper.open()
+    dumper.emit(DocumentStartEvent(explicit=dumper.use_explicit_start, version=dumper.use_version,
+                                   tags=dumper.use_tags))
+    # Values held as they are may be shared, which the serializer writes as
+    # anchors and aliases: number those the way it would, in a first pass,
+    # and then remember only the nodes that have an anchor
+    for value in walk(obj, False, top):
+        if not dumper.ignore_aliases(value):
+            dumper.anchor_node(dumper.represent_data(value))
+    anchored = dict((node, anchor) for node, anchor in dumper.anchors.items() if anchor is not None)
+    dumper.anchors = _Anchors(anchored)
+    dumper.serialized_nodes = _Serialized(anchored)
+    emit_value(obj, False, top)
+    dumper.emit(DocumentEndEvent(explicit=dumper.use_explicit_end))
+    dumper.close()
+    writer.flush()
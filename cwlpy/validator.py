@@ -0,0 +1,332 @@
+import operator
+import re
+import weakref
+
+import six
+
+import cwl_schema
+from .cwlpy import ValidationException
+
+# Same as cwl_schema._TypeDSLLoader, for types given as 'File[]' or 'int?'
+_TYPE_DSL = re.compile(u"^([^[?]+)(\\[\\])?(\\?)?$")
+
+# How many problems a ValidationException lists before leaving out the rest
+MAX_ERRORS = 50
+
+_INTEGER_TYPES = six.integer_types
+_NUMBER_TYPES = (float,) + six.integer_types
+
+_validators = weakref.WeakKeyDictionary()
+
+
+def _shortname(id):
+    return id.split('#')[-1].split('/')[-1]
+
+
+def _describe(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, dict):
+        return value['class'] if isinstance(value.get('class'), six.string_types) else 'a record'
+    if isinstance(value, list):
+        return 'an array'
+    text = repr(value)
+    return text if len(text) <= 40 else text[:37] + '...'
+
+
+class _Type(object):
+    """
+    A compiled type: check(value) tells whether value is valid, as fast as
+    can be, and explain(value, path) lists (path, message) for what is wrong
+    with a value that is not. check_all(values), if not None, tells whether
+    every item of a list is valid with loops that run in C, and may answer
+    False for valid items it does not know about, as instances of subclasses.
+    """
+
+    def __init__(self, name, check, explain=None, check_all=None):
+        self.name = name
+        self.check = check
+        self.check_all = check_all
+        if explain is not None:
+            self.explain = explain
+
+    def explain(self, value, path):
+        return [(path, 'expected {}, got {}'.format(self.name, _describe(value)))]
+
+
+def _exact_types(types):
+    types = frozenset(types)
+
+    def check_all(values):
+        return set(map(type, values)) <= types
+    return check_all
+
+
+def _file_type(class_name, keys):
+    key_set = frozenset(keys)
+    dict_types = frozenset([dict])
+    get_class = operator.methodcaller('get', 'class')
+
+    def check(value):
+        return isinstance(value, dict) and value.get('class') == class_name and not key_set.isdisjoint(value)
+
+    def check_all(values):
+        return (set(map(type, values)) <= dict_types and
+                set(map(get_class, values)) <= {class_name} and
+                not any(map(key_set.isdisjoint, values)))
+
+    def explain(value, path):
+        if isinstance(value, dict) and value.get('class') == class_name:
+            return [(path, '{} has none of {}'.format(class_name, ', '.join(keys)))]
+        return [(path, 'expected {}, got {}'.format(class_name, _describe(value)))]
+
+    return _Type(class_name, check, explain, check_all)
+
+
+def _is_int(value):
+    return isinstance(value, _INTEGER_TYPES) and not isinstance(value, bool)
+
+
+def _is_number(value):
+    return isinstance(value, _NUMBER_TYPES) and not isinstance(value, bool)
+
+
+def _primitive_types():
+    int_type = _Type('int', _is_int, check_all=_exact_types(_INTEGER_TYPES))
+    number_type = _Type('float', _is_number, check_all=_exact_types(_NUMBER_TYPES))
+    return {
+        'null': _Type('null', lambda value: value is None, check_all=_exact_types([type(None)])),
+        'boolean': _Type('boolean', lambda value: isinstance(value, bool), check_all=_exact_types([bool])),
+        'int': int_type,
+        'long': int_type,
+        'float': number_type,
+        'double': number_type,
+        'string': _Type('string', lambda value: isinstance(value, six.string_types),
+                        check_all=_exact_types(six.string_types)),
+        'Any': _Type('Any', lambda value: value is not None),
+        'File': _file_type('File', ('location', 'path', 'contents')),
+        'Directory': _file_type('Directory', ('location', 'path', 'listing')),
+    }
+
+
+_PRIMITIVES = _primitive_types()
+
+# Parameters without a type, as built with cwlpy, take anything
+_UNTYPED = _Type('anything', lambda value: True)
+
+
+def _array_type(items):
+    item_check = items.check
+    check_all = items.check_all
+
+    if check_all is not None:
+        def check(value):
+            # One item at a time only if the loops in C are not sure
+            return isinstance(value, list) and (check_all(value) or all(map(item_check, value)))
+    else:
+        def check(value):
+            return isinstance(value, list) and all(map(item_check, value))
+
+    def explain(value, path):
+        if not isinstance(value, list):
+            return [(path, 'expected an array of {}, got {}'.format(items.name, _describe(value)))]
+        errors = []
+        for index, item in enumerate(value):
+            if not item_check(item):
+                errors.extend(items.explain(item, '{}[{}]'.format(path, index)))
+        return errors
+
+    return _Type('array of ' + items.name, check, explain)
+
+
+def _union_type(alternatives):
+    names = ' or '.join(alternative.name for alternative in alternatives)
+    others = [alternative for alternative in alternatives if alternative.name != 'null']
+    if len(others) == 1 and len(others) < len(alternatives):
+        # Optional types, by far the most common union
+        other_check = others[0].check
+
+        def check(value):
+            return value is None or other_check(value)
+    else:
+        checks = [alternative.check for alternative in alternatives]
+
+        def check(value):
+            for alternative_check in checks:
+                if alternative_check(value):
+                    return True
+            return False
+
+    def explain(value, path):
+        if len(others) == 1 and value is not None:
+            return others[0].explain(value, path)
+        return [(path, 'expected {}, got {}'.format(names, _describe(value)))]
+
+    return _Type(names, check, explain)
+
+
+def _enum_type(name, symbols):
+    symbols = frozenset(_shortname(symbol) for symbol in symbols)
+
+    def check(value):
+        return isinstance(value, six.string_types) and value in symbols
+
+    def explain(value, path):
+        return [(path, 'expected one of {}, got {}'.format(', '.join(sorted(symbols)), _describe(value)))]
+
+    return _Type(name, check, explain)
+
+
+def _record_type(name, fields):
+    field_checks = [(field_name, field_type.check) for field_name, field_type in fields]
+
+    def check(value):
+        if not isinstance(value, dict):
+            return False
+        for field_name, field_check in field_checks:
+            if not field_check(value.get(field_name)):
+                return False
+        return True
+
+    def explain(value, path):
+        if not isinstance(value, dict):
+            return [(path, 'expected {}, got {}'.format(name, _describe(value)))]
+        errors = []
+        for field_name, field_type in fields:
+            field_value = value.get(field_name)
+            if not field_type.check(field_value):
+                errors.extend(field_type.explain(field_value, '{}.{}'.format(path, field_name)))
+        return errors
+
+    return _Type(name, check, explain)
+
+
+def _field(schema, name):
+    if isinstance(schema, dict):
+        return schema.get(name)
+    return getattr(schema, name, None)
+
+
+class _Compiler(object):
+
+    def __init__(self, process):
+        self.schemas = {}
+        for requirement in list(process.requirements or []) + list(process.hints or []):
+            if isinstance(requirement, cwl_schema.SchemaDefRequirement):
+                types = requirement.types
+            elif isinstance(requirement, dict) and requirement.get('class') == 'SchemaDefRequirement':
+                types = requirement.get('types')
+            else:
+                continue
+            for schema in types or []:
+                name = _field(schema, 'name')
+                if name:
+                    self.schemas[name] = schema
+                    self.schemas.setdefault(_shortname(name), schema)
+        self.named = {}
+
+    def compile(self, type_):
+        if type_ is None:
+            return _UNTYPED
+        if isinstance(type_, list):
+            alternatives = [self.compile(alternative) for alternative in type_]
+            return alternatives[0] if len(alternatives) == 1 else _union_type(alternatives)
+        if isinstance(type_, six.string_types):
+            return self._named(type_)
+        kind = _field(type_, 'type')
+        if kind == 'array':
+            return _array_type(self.compile(_field(type_, 'items')))
+        if kind == 'enum':
+            return _enum_type(_shortname(_field(type_, 'name') or 'enum'), _field(type_, 'symbols') or [])
+        if kind == 'record':
+            name = _field(type_, 'name')
+            fields = [(_shortname(_field(field, 'name')), self.compile(_field(field, 'type')))
+                      for field in _field(type_, 'fields') or []]
+            return _record_type(_shortname(name) if name and not name.startswith('_:') else 'record', fields)
+        raise ValidationException("Cannot validate inputs of type {!r}".format(kind))
+
+    def _named(self, name):
+        if name in _PRIMITIVES:
+            return _PRIMITIVES[name]
+        if name in self.named:
+            compiled = self.named[name]
+            if compiled is None:
+                # A record containing itself: look it up when checking
+                named = self.named
+                return _Type(_shortname(name), lambda value: named[name].check(value),
+                             lambda value, path: named[name].explain(value, path))
+            return compiled
+        if name in self.schemas:
+            self.named[name] = None
+            self.named[name] = self.compile(self.schemas[name])
+            return self.named[name]
+        match = _TYPE_DSL.match(name)
+        if match and (match.group(2) or match.group(3)):
+            compiled = self._named(match.group(1))
+            if match.group(2):
+                compiled = _array_type(compiled)
+            if match.group(3):
+                compiled = _union_type([_PRIMITIVES['null'], compiled])
+            return compiled
+        raise ValidationException("Unknown type " + name)
+
+
+def _compile(process):
+    compiler = _Compiler(process)
+    parameters = [(_shortname(parameter.id), compiler.compile(parameter.type), parameter.default is not None)
+                  for parameter in process.inputs or []]
+    checks = [(name, compiled.check, has_default) for name, compiled, has_default in parameters]
+
+    def validate(job_order):
+        if not isinstance(job_order, dict):
+            raise ValidationException("The job order must be a record, not " + _describe(job_order))
+        for name, check, has_default in checks:
+            value = job_order.get(name)
+            if not check(value) and not (value is None and has_default):
+                break
+        else:
+            return
+        errors = []
+        for name, compiled, has_default in parameters:
+            value = job_order.get(name)
+            if value is None and has_default or compiled.check(value):
+                continue
+            if value is None and name not in job_order:
+                errors.append((name, 'missing, expected {}'.format(compiled.name)))
+            else:
+                errors.extend(compiled.explain(value, name))
+        lines = ['{}: {}'.format(path, message) for path, message in errors[:MAX_ERRORS]]
+        if len(errors) > MAX_ERRORS:
+            lines.append('and {} more'.format(len(errors) - MAX_ERRORS))
+        raise ValidationException("Invalid job order:\n" + "\n".join(lines))
+
+    return validate
+
+
+def _signature(process):
+    return [(parameter, parameter.id, parameter.type, parameter.default) for parameter in process.inputs or []]
+
+
+def job_order_validator(process):
+    """
+    A function validating job orders for process, a CommandLineTool, Workflow
+    or other process with inputs, that raises ValidationException listing
+    every invalid or missing input with its path, as in files[3] or
+    sample.reads[0]. The input types are compiled once to plain functions,
+    cached for as long as process lives and its inputs do not change.
+    """
+    signature = _signature(process)
+    cached = _validators.get(process)
+    if cached is not None and len(cached[0]) == len(signature) and \
+            all(a is b or a == b for old, new in zip(cached[0], signature) for a, b in zip(old, new)):
+        return cached[1]
+    validate = _compile(process)
+    _validators[process] = (signature, validate)
+    return validate
+
+
+def validate_job_order(process, job_order):
+    """Raises ValidationException if job_order is not valid input for process, see job_order_validator()."""
+    job_order_validator(process)(job_order)
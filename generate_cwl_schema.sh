@@ -1,3 +1,36 @@
 #!/bin/bash
+#
+#   ./generate_cwl_schema.sh --specialized
+#   ./generate_cwl_schema.sh --regenerate
+#
+# cwl_schema.py started out as the output of schema-salad-tool
+# --codegen=python, but its loaders, LoadingOptions and record classes have
+# since been changed by hand (dispatching unions, caches, __slots__, save()
+# caching, ...). Regenerating it discards all of that.
+#
+# --specialized rewrites the committed cwl_schema.py in place with
+# specialize_cwl_schema.py, so that records load with code specialized to
+# each of their fields instead of the generic loaders; `git checkout
+# cwl_schema.py` undoes it.
+#
+# --regenerate overwrites cwl_schema.py with plain schema-salad output, as
+# the starting point for porting the changes by hand to a new schema.
 
-schema-salad-tool --codegen=python common-workflow-language/v1.0/CommonWorkflowLanguage.yml > cwl_schema.py
+set -e
+
+case "$1" in
+    --specialized)
+        python specialize_cwl_schema.py cwl_schema.py > cwl_schema.py.specialized \
+            || { rm -f cwl_schema.py.specialized; exit 1; }
+        mv cwl_schema.py.specialized cwl_schema.py
+        ;;
+    --regenerate)
+        echo "Warning: discarding the changes made by hand to cwl_schema.py" >&2
+        schema-salad-tool --codegen=python common-workflow-language/v1.0/CommonWorkflowLanguage.yml > cwl_schema.py
+        ;;
+    *)
+        echo "Usage: $0 --specialized | --regenerate" >&2
+        echo "cwl_schema.py is maintained by hand: plain regeneration discards those changes (see the script header)" >&2
+        exit 2
+        ;;
+esac
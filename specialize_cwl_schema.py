@@ -0,0 +1,568 @@
+"""
+Rewrites cwl_schema.py, as generated by schema-salad-tool --codegen=python,
+so that its record classes load their fields with code specialized to the
+loader of each field, instead of interpreting the generic _Loader
+combinators for every value.
+
+For every loader a record field uses, a function is generated that does
+what that loader's load() does, with the union checks, id-map expansion,
+URI expansion and array loops of the loaders it is made of written out
+inline, down to the record classes they load. Common values, as strings
+and absent optional fields, are loaded inline by the record constructors.
+Loading gives the same objects, and the same errors, as before.
+
+    python specialize_cwl_schema.py cwl_schema.py > specialized.py
+
+Used by generate_cwl_schema.sh --specialized. It works on the cwl_schema.py
+of this repository only, which has been changed by hand since it was
+generated, and not on plain schema-salad output.
+"""
+from __future__ import print_function
+
+import io
+import os
+import re
+import sys
+
+import six
+
+MARKER = '# Loaders specialized by specialize_cwl_schema.py'
+
+# Field loads in the generated constructors
+_FIELD_LOAD = re.compile(
+    r"^(?P<indent> +)self\.(?P<attr>\w+) = load_field\(doc\.get\((?P<key>'\w+')\), (?P<loader>\w+), baseuri, loadingOptions\)$",
+    re.MULTILINE)
+
+_STRING_TYPES = tuple(set((str, six.text_type) + six.string_types))
+
+
+def _load_module(path, name='_cwl_schema_to_specialize'):
+    try:
+        import importlib.util
+    except ImportError:
+        import imp
+        return imp.load_source(name, path)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _type_name(tp):
+    if tp is type(None):
+        return 'type(None)'
+    if tp is six.text_type and tp is not str:
+        return 'six.text_type'
+    if tp in (str, int, float, bool, dict, list):
+        return tp.__name__
+    return None
+
+
+def _types(types):
+    """The source of a tuple of types, None if one of them has no name."""
+    names = []
+    for tp in types:
+        name = _type_name(tp)
+        if name is None:
+            return None
+        if name not in names:
+            names.append(name)
+    return '(%s,)' % ', '.join(names)
+
+
+def _check_module(module):
+    """
+    Raises ValueError unless module is the hand-maintained cwl_schema.py of
+    this repository: plain schema-salad output lacks what the generated code
+    relies on.
+    """
+    needed = [
+        ('_Loader.accepts()', lambda m: hasattr(m._Loader, 'accepts')),
+        ('_RecordLoader discriminators', lambda m: hasattr(m._RecordLoader(dict), 'discriminator')),
+        ('_ArrayLoader.nested', lambda m: hasattr(m._ArrayLoader(m._AnyLoader()), 'nested')),
+        ('_TypeDSLLoader.resolve_all()', lambda m: hasattr(m._TypeDSLLoader, 'resolve_all')),
+        ('LoadingOptions.owns_documents', lambda m: hasattr(m.LoadingOptions(), 'owns_documents')),
+        ('deferred errors', lambda m: all(hasattr(m, name) for name in
+                                          ('_Message', '_SourceError', '_ArrayError', '_UnionError'))),
+    ]
+    missing = []
+    for name, present in needed:
+        try:
+            if present(module):
+                continue
+        except AttributeError:
+            pass
+        missing.append(name)
+    if missing:
+        raise ValueError('%s is not the cwl_schema.py of this repository, it lacks: %s'
+                         % (getattr(module, '__file__', module.__name__), ', '.join(missing)))
+
+
+class _Specializer(object):
+
+    def __init__(self, module):
+        _check_module(module)
+        self.m = module
+        self.names = {}
+        for name, value in vars(module).items():
+            if isinstance(value, module._Loader) and id(value) not in self.names:
+                self.names[id(value)] = name
+        for name in sorted(vars(module)):
+            self._name_parts(getattr(module, name), name)
+        self.functions = {}  # id(loader) -> function name
+        self.pending = []
+        self.lines = []
+
+    def _name_parts(self, loader, ref):
+        """Names the loaders loader is made of that are not module globals."""
+        m = self.m
+        if not isinstance(loader, m._Loader):
+            return
+        parts = []
+        for attr in ('inner', 'items', 'process', 'document'):
+            if isinstance(getattr(loader, attr, None), m._Loader):
+                parts.append(('%s.%s' % (ref, attr), getattr(loader, attr)))
+        if isinstance(loader, m._UnionLoader):
+            parts.extend(('%s.alternates[%d]' % (ref, i), alternate)
+                         for i, alternate in enumerate(loader.alternates))
+        for part_ref, part in parts:
+            if id(part) not in self.names:
+                self.names[id(part)] = part_ref
+                self._name_parts(part, part_ref)
+
+    def ref(self, loader):
+        return self.names[id(loader)]
+
+    def function(self, loader):
+        """The name of the function loading with loader, generating it if needed."""
+        name = self.functions.get(id(loader))
+        if name is None:
+            name = '_load_%d' % len(self.functions)
+            self.functions[id(loader)] = name
+            self.pending.append((name, loader))
+        return name
+
+    # Kinds of loader
+
+    def is_(self, loader, kind):
+        return type(loader) is getattr(self.m, kind)
+
+    def string_only(self, loader):
+        """Whether loader is a primitive loading strings."""
+        return self.is_(loader, '_PrimitiveLoader') and self._tp(loader) is not None and \
+            set(self._tp_types(loader)) <= set(_STRING_TYPES)
+
+    def _tp_types(self, loader):
+        return loader.tp if isinstance(loader.tp, tuple) else (loader.tp,)
+
+    def _tp(self, loader):
+        return _types(self._tp_types(loader))
+
+    def accepts(self, loader):
+        """Source of the tuple of types loader can possibly succeed on, None if unknown."""
+        accepted = loader.accepts()
+        return None if accepted is None else _types(accepted)
+
+    # Inline loading
+
+    def total(self, loader, var):
+        """
+        (condition, value) such that loader loads var as value whenever
+        condition holds, without calling anything that may fail, or None.
+        """
+        if self.is_(loader, '_PrimitiveLoader'):
+            if loader.tp is type(None):
+                return '%s is None' % var, 'None'
+            tp = self._tp(loader)
+            if tp is not None:
+                return 'isinstance(%s, %s)' % (var, tp), var
+        elif self.is_(loader, '_EnumLoader'):
+            if all(isinstance(symbol, six.string_types) for symbol in loader.symbols):
+                return '%s in %r' % (var, tuple(loader.symbols)), var
+        elif self.is_(loader, '_AnyLoader'):
+            return '%s is not None' % var, var
+        return None
+
+    def field_value(self, loader, var):
+        """
+        (condition, value) for loading the value var of a field inline, as
+        load_field(var, loader, ...) would, when condition holds, or None.
+        """
+        if self.is_(loader, '_UnionLoader'):
+            # The leading alternates that load values as they are
+            conditions = []
+            for alternate in loader.alternates:
+                total = self.total(alternate, var)
+                if total is None or self.is_(alternate, '_AnyLoader'):
+                    break
+                conditions.append(total[0])
+            if conditions:
+                return ' or '.join(conditions), var
+        elif self.is_(loader, '_URILoader'):
+            if self.loads_strings(loader.inner):
+                return 'isinstance(%s, %s)' % (var, _types(_STRING_TYPES)), \
+                    self.expand(loader, var)
+        elif not self.is_(loader, '_AnyLoader'):
+            return self.total(loader, var)
+        return None
+
+    def loads_strings(self, loader):
+        """Whether loader loads every string as it is."""
+        if self.is_(loader, '_UnionLoader'):
+            for alternate in loader.alternates:
+                if self.string_only(alternate):
+                    return True
+                if not (self.is_(alternate, '_PrimitiveLoader') and alternate.tp is type(None)):
+                    return False
+            return False
+        return self.string_only(loader)
+
+    def expand(self, loader, var):
+        """Source of expand_url(var, ...) as the _URILoader loader calls it."""
+        if not loader.vocab_term:
+            if loader.scoped_id and loader.scoped_ref is None:
+                return '_expand_name(%s, baseuri, loadingOptions)' % var
+            if not loader.scoped_id and loader.scoped_ref is not None:
+                return '_expand_name(%s, baseuri, loadingOptions, %r)' % (var, loader.scoped_ref)
+        return 'expand_url(%s, baseuri, loadingOptions, %r, %r, %r)' % (
+            var, loader.scoped_id, loader.vocab_term, loader.scoped_ref)
+
+    # Generated functions
+
+    def emit(self, *lines):
+        self.lines.extend(lines)
+
+    def generate(self, name, loader):
+        self.emit('def %s(doc, baseuri, loadingOptions, docRoot=None):' % name,
+                  '    # %s' % self.ref(loader))
+        kind = type(loader).__name__
+        getattr(self, 'body' + kind)(loader)
+        self.emit('', '')
+
+    def call(self, loader, var, root='None'):
+        """Source loading var with loader, inline for records."""
+        if self.is_(loader, '_RecordLoader'):
+            return '%s(%s, baseuri, loadingOptions, docRoot=%s) if isinstance(%s, dict) else %s.load(%s, baseuri, loadingOptions)' % (
+                loader.classtype.__name__, var, root, var, self.ref(loader), var)
+        return '%s(%s, baseuri, loadingOptions%s)' % (
+            self.function(loader), var, '' if root == 'None' else ', ' + root)
+
+    def body_PrimitiveLoader(self, loader):
+        total = self.total(loader, 'doc')
+        if total is None:
+            self.emit('    return %s.load(doc, baseuri, loadingOptions)' % self.ref(loader))
+            return
+        self.emit('    if %s:' % total[0],
+                  '        return doc',
+                  '    raise ValidationException(_Message("Expected a %%s but got %%s", %s.tp, type(doc)))'
+                  % self.ref(loader))
+
+    def body_AnyLoader(self, loader):
+        self.emit('    if doc is not None:',
+                  '        return doc',
+                  '    raise ValidationException("Expected non-null")')
+
+    def body_EnumLoader(self, loader):
+        self.emit('    if doc in %s.symbols:' % self.ref(loader),
+                  '        return doc',
+                  '    raise ValidationException(_Message("Expected one of %%s", %s.symbols))' % self.ref(loader))
+
+    def body_RecordLoader(self, loader):
+        self.emit('    if not isinstance(doc, dict):',
+                  '        raise ValidationException("Expected a dict")',
+                  '    return %s(doc, baseuri, loadingOptions, docRoot=docRoot)' % loader.classtype.__name__)
+
+    def body_LazyProcessLoader(self, loader):
+        self.emit('    if loadingOptions.lazy_run:',
+                  '        return %s.load(doc, baseuri, loadingOptions, docRoot=docRoot)' % self.ref(loader),
+                  '    return %s(doc, baseuri, loadingOptions, docRoot)' % self.function(loader.inner))
+
+    def body_URILoader(self, loader):
+        self.emit('    if isinstance(doc, list):',
+                  '        doc = [%s for i in doc]' % self.expand(loader, 'i'),
+                  '    elif isinstance(doc, %s):' % _types(_STRING_TYPES),
+                  '        doc = %s' % self.expand(loader, 'doc'),
+                  '    return %s' % self.call(loader.inner, 'doc'))
+
+    def body_TypeDSLLoader(self, loader):
+        ref = self.ref(loader)
+        self.emit('    if isinstance(doc, list):',
+                  '        doc = %s.resolve_all(doc, baseuri, loadingOptions)' % ref,
+                  '    elif isinstance(doc, six.string_types):',
+                  '        doc = %s.resolve(doc, baseuri, loadingOptions)' % ref,
+                  '    return %s' % self.call(loader.inner, 'doc'))
+
+    def body_IdMapLoader(self, loader):
+        self.emit('    if isinstance(doc, dict):',
+                  '        r = []',
+                  '        for k in sorted(doc.keys()):',
+                  '            val = doc[k]',
+                  '            if isinstance(val, dict):',
+                  '                if loadingOptions.owns_documents:',
+                  '                    v = val',
+                  '                else:',
+                  '                    v = copy.copy(val)',
+                  "                    if hasattr(val, 'lc'):",
+                  '                        v.lc.data = val.lc.data',
+                  '                        v.lc.filename = val.lc.filename')
+        if loader.mapPredicate:
+            self.emit('            else:',
+                      '                v = {%r: val}' % loader.mapPredicate)
+        else:
+            self.emit('            else:',
+                      '                raise ValidationException("No mapPredicate")')
+        self.emit('            v[%r] = k' % loader.mapSubject,
+                  '            r.append(v)',
+                  '        doc = r',
+                  '    return %s' % self.call(loader.inner, 'doc'))
+
+    def body_ArrayLoader(self, loader):
+        items = loader.items
+        self.emit('    if not isinstance(doc, list):',
+                  '        raise ValidationException("Expected a list")',
+                  '    r = []',
+                  '    errors = []',
+                  '    for i, item in enumerate(doc):',
+                  '        if isinstance(item, list) or isinstance(item, dict) and ("$import" in item or "$include" in item):',
+                  '            # Nested lists are flattened',
+                  '            try:',
+                  '                lf = load_field(item, %s.nested, baseuri, loadingOptions)' % self.ref(loader),
+                  '            except ValidationException as e:',
+                  '                errors.append(_SourceError(doc, i, u"", e))',
+                  '                continue',
+                  '        else:',
+                  '            try:')
+        total = self.total(items, 'item')
+        if total is not None:
+            self.emit('                lf = item if %s else %s.load(item, baseuri, loadingOptions)'
+                      % (total[0], self.ref(items)))
+        else:
+            self.emit('                lf = %s' % self.call(items, 'item'))
+        self.emit('            except ValidationException as e:',
+                  '                errors.append(_SourceError(doc, i, u"", _array_item_error(%s, e)))'
+                  % self.ref(loader),
+                  '                continue',
+                  '        if isinstance(lf, list):',
+                  '            r.extend(lf)',
+                  '        else:',
+                  '            r.append(lf)',
+                  '    if errors:',
+                  '        raise ValidationException(_ArrayError(errors))',
+                  '    return r')
+
+    def body_UnionLoader(self, loader):
+        known = {}
+        for alternate in loader.alternates:
+            d = getattr(alternate, 'discriminator', None)
+            if d is not None:
+                known.setdefault(d[0], set()).add(d[1])
+        fallible = False
+        uses_class = any(self.strict_class(alternate) for alternate in loader.alternates)
+        lines = []
+        for i, alternate in enumerate(loader.alternates):
+            total = self.total(alternate, 'doc')
+            if total is not None:
+                lines.extend(['    if %s:' % total[0],
+                              '        return doc'])
+                continue
+            fallible = True
+            if self.is_(alternate, '_RecordLoader'):
+                d = alternate.discriminator
+                if self.strict_class(alternate):
+                    condition = 'klass == %r' % d[1]
+                elif d is not None and len(known[d[0]]) > 1:
+                    condition = 'isinstance(doc, dict) and doc.get(%r) not in %r' % (
+                        d[0], tuple(sorted(known[d[0]] - set([d[1]]))))
+                else:
+                    condition = 'isinstance(doc, dict)'
+                attempt = '%s(doc, baseuri, loadingOptions, docRoot=docRoot)' % alternate.classtype.__name__
+            else:
+                condition = None
+                accepted = self.accepts(alternate)
+                if accepted is not None:
+                    condition = 'isinstance(doc, %s)' % accepted
+                attempt = '%s(doc, baseuri, loadingOptions, docRoot)' % self.function(alternate)
+            if condition is None:
+                lines.extend(['    try:',
+                              '        return %s' % attempt,
+                              '    except ValidationException as e:',
+                              '        tried[%d] = e' % i])
+            else:
+                lines.extend(['    if %s:' % condition,
+                              '        try:',
+                              '            return %s' % attempt,
+                              '        except ValidationException as e:',
+                              '            tried[%d] = e' % i])
+        if fallible:
+            self.emit('    tried = {}')
+        if uses_class:
+            self.emit("    klass = doc.get('class') if isinstance(doc, dict) else None")
+        self.emit(*lines)
+        self.emit('    return _union_failed(%s, %s, doc, baseuri, loadingOptions, docRoot)'
+                  % (self.ref(loader), 'tried' if fallible else '{}'))
+
+    def strict_class(self, loader):
+        """Whether loader is of a record that checks its class field is exactly that of its discriminator."""
+        if not self.is_(loader, '_RecordLoader') or loader.discriminator is None or \
+                loader.discriminator[0] != 'class':
+            return False
+        return ("if doc.get('class') != %r:" % loader.discriminator[1]) in self.sources.get(
+            loader.classtype.__name__, '')
+
+    # The module
+
+    def specialize(self, source):
+        if MARKER in source:
+            raise ValueError('Already specialized')
+        self.sources = {}
+        for match in re.finditer(r'^class (\w+)\(.*?(?=^class |\Z)', source, re.MULTILINE | re.DOTALL):
+            self.sources[match.group(1)] = match.group(0)
+
+        def field(match):
+            loader = getattr(self.m, match.group('loader'))
+            indent = match.group('indent')
+            name = self.function(loader)
+            load = '_field%s(val, baseuri, loadingOptions)' % name[len('_load'):]
+            inline = self.field_value(loader, 'val')
+            if inline is None:
+                value = load
+            else:
+                value = '%s if %s else %s' % (inline[1], inline[0], load)
+            self.fields.add(id(loader))
+            return '%sval = doc.get(%s)\n%sself.%s = %s' % (indent, match.group('key'), indent,
+                                                           match.group('attr'), value)
+
+        self.fields = set()
+        source = _FIELD_LOAD.sub(field, source)
+        while self.pending:
+            name, loader = self.pending.pop(0)
+            self.generate(name, loader)
+            if id(loader) in self.fields:
+                self.emit('def _field%s(doc, baseuri, loadingOptions):' % name[len('_load'):],
+                          '    if isinstance(doc, dict) and ("$import" in doc or "$include" in doc):',
+                          '        return load_field(doc, %s, baseuri, loadingOptions)' % self.ref(loader),
+                          '    return %s(doc, baseuri, loadingOptions)' % name,
+                          '', '')
+        return source.rstrip('\n') + '\n\n\n' + _PREAMBLE + '\n'.join(self.lines).rstrip('\n') + '\n'
+
+
+_PREAMBLE = MARKER + r'''. Each _load_N() does what
+# the load() of the loader named in its comment does, and each _field_N() what
+# load_field() does with that loader.
+
+def _union_failed(loader, tried, doc, baseuri, loadingOptions, docRoot):
+    # As loader.load() ends when no alternate loads doc: tried holds the
+    # errors of the alternates that were tried, by index
+    errors = []
+    for i, t in enumerate(loader.alternates):
+        e = tried.get(i)
+        if e is None:
+            try:
+                return t.load(doc, baseuri, loadingOptions, docRoot=docRoot)
+            except ValidationException as e2:
+                e = e2
+        errors.append(e)
+    raise ValidationException(_UnionError(loader.alternates, errors))
+
+
+# Names that expand_url() joins to the fragment of the base URI as they are
+_plain_name = re.compile(r"[\w.\-][\w.\-/]*\Z", re.UNICODE).match
+# Fragments that urlsplit() returns as they are
+_plain_fragment = re.compile(r"[\w.\-/]*\Z", re.UNICODE).match
+_heads = {}  # type: Dict[Tuple[Text, bool], Text]
+
+
+def _head(splitbase, scoped_id):
+    # The base URI up to its fragment, with the "#", as expand_url() writes it
+    pt = splitbase.path if splitbase.path != '' or not scoped_id else "/"
+    return urllib.parse.urlunsplit(
+        (splitbase.scheme, splitbase.netloc, pt, splitbase.query, u"x"))[:-1]
+
+
+def _name_prefix(baseuri, scoped_ref):
+    # What expand_url(name, baseuri, ..., scoped_id=scoped_ref is None,
+    # scoped_ref=scoped_ref) puts before a _plain_name(). Base URIs mostly
+    # differ in their fragment only, so the rest is worked out once.
+    scoped_id = scoped_ref is None
+    document, _, fragment = baseuri.partition(u"#")
+    if _plain_fragment(fragment):
+        head = _heads.get((document, scoped_id))
+        if head is None:
+            head = _head(urllib.parse.urlsplit(document), scoped_id)
+            if len(_heads) >= 4096:
+                _heads.clear()
+            _heads[(document, scoped_id)] = head
+    else:
+        splitbase = urllib.parse.urlsplit(baseuri)
+        head = _head(splitbase, scoped_id)
+        fragment = splitbase.fragment
+    if scoped_id:
+        return head + fragment + u"/" if fragment else head
+    sp = fragment.split(u"/")
+    del sp[max(len(sp) - scoped_ref, 0):]
+    return head + u"/".join(sp) + u"/" if sp else head
+
+
+def _expand_name(url, baseuri, loadingOptions, scoped_ref=None):
+    # expand_url(url, baseuri, loadingOptions, scoped_id=scoped_ref is None,
+    # scoped_ref=scoped_ref)
+    if isinstance(url, six.string_types) and _plain_name(url) and url not in (u"@id", u"@type"):
+        return _name_prefix(baseuri, scoped_ref) + url
+    return expand_url(url, baseuri, loadingOptions, scoped_ref is None, False, scoped_ref)
+
+
+def _array_item_error(loader, e):
+    # The error of loader.nested.load(item, ...) for an item that is not a
+    # list, failing with e
+    return ValidationException(_UnionError(loader.nested.alternates, [ValidationException("Expected a list"), e]))
+
+
+'''
+
+
+def specialize(source, module):
+    """source of a generated cwl_schema module, rewritten to load with specialized code."""
+    return _Specializer(module).specialize(source)
+
+
+def load_specialized(path, name='cwl_schema_specialized'):
+    """
+    Specializes the cwl_schema module at path and imports the result as a
+    module named name, without writing it next to path.
+    """
+    import shutil
+    import tempfile
+    with io.open(path, encoding='utf-8') as f:
+        source = f.read()
+    specialized = specialize(source, _load_module(os.path.abspath(path)))
+    directory = tempfile.mkdtemp()
+    try:
+        specialized_path = os.path.join(directory, name + '.py')
+        with io.open(specialized_path, 'w', encoding='utf-8') as f:
+            f.write(specialized)
+        module = _load_module(specialized_path, name)
+    finally:
+        shutil.rmtree(directory)
+    sys.modules[name] = module
+    return module
+
+
+def main():
+    if len(sys.argv) != 2:
+        print('Usage: %s cwl_schema.py > specialized.py' % sys.argv[0], file=sys.stderr)
+        sys.exit(2)
+    path = sys.argv[1]
+    with io.open(path, encoding='utf-8') as f:
+        source = f.read()
+    try:
+        specialized = specialize(source, _load_module(os.path.abspath(path)))
+    except ValueError as e:
+        print('%s: %s' % (sys.argv[0], e), file=sys.stderr)
+        sys.exit(1)
+    if six.PY2:
+        specialized = specialized.encode('utf-8')
+    sys.stdout.write(specialized)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import cwl_schema
+
+
+def load_each(loader, doc, baseuri='file:///test/main.cwl'):
+    """What _ArrayLoader.load() did before it had a fast path: load_field() every element."""
+    options = cwl_schema.LoadingOptions()
+    r = []
+    errors = []
+    for i in range(0, len(doc)):
+        try:
+            lf = cwl_schema.load_field(doc[i], cwl_schema._UnionLoader((loader, loader.items)), baseuri, options)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+        except cwl_schema.ValidationException as e:
+            errors.append(cwl_schema._SourceError(doc, i, u"", e))
+    if errors:
+        raise cwl_schema.ValidationException(cwl_schema._ArrayError(errors))
+    return r
+
+
+def error(load, *args):
+    try:
+        load(*args)
+    except cwl_schema.ValidationException as e:
+        return str(e)
+    raise AssertionError('loaded without error')
+
+
+class ArrayLoaderTestCase(TestCase):
+
+    def load(self, loader, doc):
+        return loader.load(doc, 'file:///test/main.cwl', cwl_schema.LoadingOptions())
+
+    def test_nested_union_built_once(self):
+        loader = cwl_schema.array_of_strtype
+        self.assertEqual(loader.nested.alternates, (loader, loader.items))
+        self.assertIs(loader.nested, loader.nested)
+
+    def test_flattens_nested_lists(self):
+        loader = cwl_schema.array_of_strtype
+        doc = ['a', ['b', ['c']], 'd']
+        self.assertEqual(self.load(loader, doc), ['a', 'b', 'c', 'd'])
+        self.assertEqual(self.load(loader, doc), load_each(loader, doc))
+
+    def test_records(self):
+        loader = cwl_schema.array_of_WorkflowStepInputLoader
+        doc = [{'id': 'in-%d' % i} for i in range(3)]
+        loaded = self.load(loader, doc)
+        self.assertEqual([i.save() for i in loaded], [i.save() for i in load_each(loader, doc)])
+
+    def test_same_errors(self):
+        loader = cwl_schema.array_of_strtype
+        for doc in ([1], ['a', 2, ['b', 3]], [None]):
+            self.assertEqual(error(self.load, loader, doc), error(load_each, loader, doc))
+        loader = cwl_schema.array_of_WorkflowStepInputLoader
+        doc = [{'id': 'in'}, 'in', {'id': 'other', 'extra': 1}]
+        self.assertEqual(error(self.load, loader, doc), error(load_each, loader, doc))
+
+    def test_imported_element(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'input.yml')
+            with open(path, 'w') as f:
+                f.write('id: imported\n')
+            options = cwl_schema.LoadingOptions(fileuri=cwl_schema.file_uri(os.path.join(tmpdir, 'main.cwl')))
+            loaded = cwl_schema.array_of_WorkflowStepInputLoader.load(
+                [{'id': 'in'}, {'$import': 'input.yml'}], options.fileuri, options)
+            self.assertEqual([i.id.split('#')[-1] for i in loaded], ['in', 'imported'])
+        finally:
+            shutil.rmtree(tmpdir)
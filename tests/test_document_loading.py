@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import cwl_schema
+
+
+TOOL = """class: CommandLineTool
+cwlVersion: v1.0
+id: echo
+baseCommand: echo
+inputs:
+  message:
+    type: string
+    inputBinding:
+      position: 1
+outputs: []
+"""
+
+
+class DocumentLoadingTestCase(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return cwl_schema.file_uri(path)
+
+    def load(self, url, **kwargs):
+        return cwl_schema.load_document(url, loadingOptions=cwl_schema.LoadingOptions(**kwargs))
+
+    def packed(self):
+        tool = {
+            'class': 'CommandLineTool',
+            'id': '#echo',
+            'baseCommand': 'echo',
+            'inputs': [{'id': '#echo/message', 'type': 'string'}],
+            'outputs': [],
+        }
+        workflow = {
+            'class': 'Workflow',
+            'id': '#main',
+            'inputs': [],
+            'outputs': [],
+            'steps': [{'id': '#main/step', 'run': '#echo', 'in': [], 'out': []}],
+        }
+        return {'cwlVersion': 'v1.0', '$graph': [tool, workflow]}
+
+    def test_json_graph(self):
+        url = self.write('packed.cwl', json.dumps(self.packed(), indent=2))
+        options = cwl_schema.LoadingOptions(track_lines=False)
+        loaded = cwl_schema.load_document(url, loadingOptions=options)
+        self.assertIs(type(options.idx[url]), dict)
+        self.assertEqual([p.save() for p in loaded],
+                         [p.save() for p in self.load(url)])
+        self.assertEqual(loaded[1].steps[0].run, url + '#echo')
+
+    def test_json_by_extension(self):
+        url = self.write('packed.json', '\n' * 100 + json.dumps(self.packed()))
+        options = cwl_schema.LoadingOptions(track_lines=False)
+        cwl_schema.load_document(url, loadingOptions=options)
+        self.assertIs(type(options.idx[url]), dict)
+
+    def test_json_keeps_line_tracking_by_default(self):
+        url = self.write('packed.cwl', json.dumps(self.packed()))
+        options = cwl_schema.LoadingOptions()
+        cwl_schema.load_document(url, loadingOptions=options)
+        self.assertTrue(hasattr(options.idx[url], 'lc'))
+
+    def test_json_errors_have_positions_by_default(self):
+        tool = self.packed()['$graph'][0]
+        tool['inputs'][0]['type'] = 3
+        url = self.write('echo.json', json.dumps(tool, indent=2))
+        with self.assertRaises(cwl_schema.ValidationException) as cm:
+            self.load(url)
+        self.assertIn('echo.json:', str(cm.exception))
+
+    def test_yaml_flow_mapping_is_not_json(self):
+        url = self.write('flow.cwl', '{class: CommandLineTool, baseCommand: echo, inputs: [], outputs: []}')
+        options = cwl_schema.LoadingOptions()
+        self.assertEqual(cwl_schema.load_document(url, loadingOptions=options).baseCommand, 'echo')
+        self.assertTrue(hasattr(options.idx[url], 'lc'))
+
+    def test_without_line_tracking(self):
+        url = self.write('echo.cwl', TOOL)
+        options = cwl_schema.LoadingOptions(track_lines=False)
+        tool = cwl_schema.load_document(url, loadingOptions=options)
+        self.assertEqual(tool.save(), self.load(url).save())
+        self.assertIs(type(options.idx[url]), dict)
+        self.assertIs(type(options.idx[url]['inputs']), dict)
+
+    def test_without_line_tracking_errors_have_no_position(self):
+        url = self.write('echo.cwl', TOOL.replace('type: string', 'type: 3'))
+        with self.assertRaises(cwl_schema.ValidationException) as cm:
+            self.load(url, track_lines=False)
+        self.assertIn('the `type` field is not valid', str(cm.exception))
+        self.assertNotIn('echo.cwl:', str(cm.exception))
+
+    def test_extension_fields_in_document_order(self):
+        url = self.write('echo.cwl', TOOL + 'ex:second: 2\nex:first: 1\n$namespaces:\n  ex: http://example.com/\n')
+        tool = self.load(url)
+        self.assertEqual(list(tool.extension_fields), ['http://example.com/second', 'http://example.com/first'])
+        self.assertEqual(list(tool.save(top=True))[:2], ['ex:second', 'ex:first'])
+
+    def test_invalid_field_reported_with_its_line(self):
+        url = self.write('echo.cwl', TOOL + 'unknown: 1\nother: 2\n')
+        with self.assertRaises(cwl_schema.ValidationException) as cm:
+            self.load(url)
+        self.assertIn('echo.cwl:11:1:     invalid field `unknown`', str(cm.exception))
+        self.assertNotIn('`other`', str(cm.exception))
@@ -0,0 +1,210 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest import TestCase, skipIf
+
+import cwl_schema
+from cwlpy import Workflow, WorkflowStep, ValidationException
+from cwlpy.executor import LocalExecutor, JobFailed, _evaluate
+
+SCATTER_WORKFLOW = """
+class: Workflow
+cwlVersion: v1.0
+requirements:
+  - class: ScatterFeatureRequirement
+inputs:
+  words: string[]
+  numbers: string[]
+outputs:
+  out:
+    type: File[]
+    outputSource: echo/out
+steps:
+  echo:
+    run:
+      class: CommandLineTool
+      baseCommand: echo
+      inputs:
+        word:
+          type: string
+          inputBinding: {position: 1}
+        number:
+          type: string
+          inputBinding: {position: 2, prefix: -n, separate: false}
+      outputs:
+        out:
+          type: stdout
+      stdout: $(inputs.word)-$(inputs.number).txt
+    scatter: [word, number]
+    scatterMethod: %s
+    in:
+      word: words
+      number: numbers
+    out: [out]
+"""
+
+SLEEP_WORKFLOW = """
+class: Workflow
+cwlVersion: v1.0
+inputs: []
+outputs:
+  times:
+    type: File[]
+    outputSource: [a/out, b/out, c/out]
+    linkMerge: merge_flattened
+steps:
+""" + "".join("""
+  %s:
+    run:
+      class: CommandLineTool
+      requirements:
+        - class: ResourceRequirement
+          coresMin: 2
+      baseCommand: [%s, -c, "import time; s = time.time(); time.sleep(0.3); print(s, time.time())"]
+      inputs: []
+      outputs:
+        out: stdout
+    in: []
+    out: [out]
+""" % (name, json.dumps(sys.executable)) for name in ('a', 'b', 'c'))
+
+REV_TOOL = """
+class: CommandLineTool
+cwlVersion: v1.0
+baseCommand: rev
+stdin: $(inputs.input.path)
+inputs:
+  input: File
+outputs:
+  output:
+    type: File
+    outputBinding:
+      glob: output.txt
+stdout: output.txt
+"""
+
+SORT_TOOL = """
+class: CommandLineTool
+cwlVersion: v1.0
+baseCommand: sort
+inputs:
+  reverse:
+    type: boolean
+    default: true
+    inputBinding: {position: 1, prefix: -r}
+  input:
+    type: File
+    inputBinding: {position: 2}
+outputs:
+  output:
+    type: File
+    outputBinding:
+      glob: output.txt
+      loadContents: true
+stdout: output.txt
+"""
+
+
+@skipIf(os.name == 'nt', 'runs POSIX commands')
+class LocalExecutorTestCase(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.executor = LocalExecutor(cores=4, ram=4096, basedir=os.path.join(self.dir, 'jobs'),
+                                      base_uri=cwl_schema.file_uri(self.dir) + '/')
+        os.mkdir(self.executor.basedir)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, text):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def contents(self, value):
+        if isinstance(value, list):
+            return [self.contents(item) for item in value]
+        with open(value['path']) as f:
+            return f.read()
+
+    def test_runs_tool(self):
+        self.write('in.txt', 'abc\ndef\n')
+        outputs = self.executor.run(self.write('rev.cwl', REV_TOOL), {'input': {'class': 'File', 'path': os.path.join(self.dir, 'in.txt')}})
+        self.assertEqual(self.contents(outputs['output']), 'cba\nfed\n')
+        self.assertEqual(outputs['output']['basename'], 'output.txt')
+
+    def test_dotproduct_scatter(self):
+        workflow = self.write('wf.cwl', SCATTER_WORKFLOW % 'dotproduct')
+        outputs = self.executor.run(workflow, {'words': ['a', 'b'], 'numbers': ['1', '2']})
+        self.assertEqual(self.contents(outputs['out']), ['a -n1\n', 'b -n2\n'])
+        self.assertEqual([f['basename'] for f in outputs['out']], ['a-1.txt', 'b-2.txt'])
+
+    def test_crossproduct_scatter(self):
+        workflow = self.write('wf.cwl', SCATTER_WORKFLOW % 'nested_crossproduct')
+        outputs = self.executor.run(workflow, {'words': ['a', 'b'], 'numbers': ['1', '2', '3']})
+        self.assertEqual([[f['basename'] for f in row] for row in outputs['out']],
+                         [['a-1.txt', 'a-2.txt', 'a-3.txt'], ['b-1.txt', 'b-2.txt', 'b-3.txt']])
+        workflow = self.write('wf.cwl', SCATTER_WORKFLOW % 'flat_crossproduct')
+        outputs = self.executor.run(workflow, {'words': ['a', 'b'], 'numbers': ['1', '2']})
+        self.assertEqual([f['basename'] for f in outputs['out']], ['a-1.txt', 'a-2.txt', 'b-1.txt', 'b-2.txt'])
+
+    def test_scatter_over_nothing(self):
+        workflow = self.write('wf.cwl', SCATTER_WORKFLOW % 'dotproduct')
+        self.assertEqual(self.executor.run(workflow, {'words': [], 'numbers': []}), {'out': []})
+
+    def test_jobs_share_cores(self):
+        # Three jobs of 2 cores each on 4 cores: two at a time, never three
+        outputs = self.executor.run(self.write('wf.cwl', SLEEP_WORKFLOW), {})
+        spans = [tuple(map(float, self.contents(f).split())) for f in outputs['times']]
+        self.assertEqual(len(spans), 3)
+        for start, _ in spans:
+            self.assertLess(sum(1 for other_start, other_end in spans if other_start <= start < other_end), 3)
+        overlapping = [(a, b) for a in spans for b in spans if a < b and a[0] < b[1] and b[0] < a[1]]
+        self.assertTrue(overlapping)
+
+    def test_job_larger_than_budget(self):
+        executor = LocalExecutor(cores=1, ram=4096, basedir=self.executor.basedir)
+        with self.assertRaises(ValidationException):
+            executor.run(self.write('wf.cwl', SLEEP_WORKFLOW), {})
+
+    def test_runs_built_workflow(self):
+        self.write('revtool.cwl', REV_TOOL)
+        self.write('sorttool.cwl', SORT_TOOL)
+        self.write('in.txt', 'abc\nxyz\nfoo\n')
+        workflow = Workflow('revsort')
+        rev_step = WorkflowStep('rev', run='revtool.cwl')
+        sort_step = WorkflowStep('sorted', run='sorttool.cwl')
+        workflow.step(rev_step).step(sort_step)
+        workflow.connect_input(rev_step, 'input', 'input')
+        workflow.connect_steps(rev_step, sort_step, 'output', 'input')
+        workflow.connect_output(sort_step, 'output', 'output')
+        outputs = self.executor.run(workflow, {'input': {'class': 'File', 'path': os.path.join(self.dir, 'in.txt')}})
+        self.assertEqual(outputs['output']['contents'], 'zyx\noof\ncba\n')
+
+    def test_failing_job(self):
+        tool = REV_TOOL.replace('baseCommand: rev', 'baseCommand: "false"')
+        self.write('in.txt', '')
+        with self.assertRaises(JobFailed):
+            self.executor.run(self.write('false.cwl', tool), {'input': {'class': 'File', 'path': os.path.join(self.dir, 'in.txt')}})
+
+
+class EvaluateTestCase(TestCase):
+
+    def test_parameter_references(self):
+        context = {'inputs': {'file': {'path': '/tmp/a.txt'}, 'n': 3, 'list': [1, 2]}, 'self': None, 'runtime': {}}
+        self.assertEqual(_evaluate('$(inputs.n)', context), 3)
+        self.assertEqual(_evaluate("$(inputs['file'].path)", context), '/tmp/a.txt')
+        self.assertEqual(_evaluate('x$(inputs.list[1])-$(inputs.list.length)', context), 'x2-2')
+        self.assertEqual(_evaluate('$(inputs.list)!', context), '[1, 2]!')
+        self.assertEqual(_evaluate('plain', context), 'plain')
+
+    def test_refuses_javascript(self):
+        context = {'inputs': {'n': 3}, 'self': None, 'runtime': {}}
+        with self.assertRaises(ValidationException):
+            _evaluate('$(inputs.n + 1)', context)
+        with self.assertRaises(ValidationException):
+            _evaluate('${ return 1; }', context)
@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+import cwl_schema
+from cwl_schema import LoadingOptions, expand_url
+
+
+BASE = 'file:///tmp/main.cwl#step'
+
+
+class ExpandUrlCacheTestCase(TestCase):
+
+    def test_repeated_expansion_hits(self):
+        options = LoadingOptions()
+        first = expand_url('input', BASE, options, scoped_id=True)
+        second = expand_url('input', BASE, options, scoped_id=True)
+        self.assertEqual(first, 'file:///tmp/main.cwl#step/input')
+        self.assertEqual(second, first)
+        self.assertEqual((options.url_cache.hits, options.url_cache.misses), (1, 1))
+        self.assertEqual(options.url_cache.hit_rate, 0.5)
+
+    def test_arguments_are_part_of_the_key(self):
+        options = LoadingOptions()
+        self.assertEqual(expand_url('a/b', BASE, options, scoped_id=True),
+                         'file:///tmp/main.cwl#step/a/b')
+        self.assertEqual(expand_url('a/b', BASE, options, scoped_ref=1),
+                         'file:///tmp/main.cwl#a/b')
+        self.assertEqual(expand_url('a/b', BASE, options), 'file:///tmp/a/b')
+        self.assertEqual(options.url_cache.hits, 0)
+
+    def test_copies_share_the_memo(self):
+        options = LoadingOptions()
+        copy = LoadingOptions(copyfrom=options, fileuri='file:///tmp/other.cwl')
+        self.assertIs(copy.url_cache, options.url_cache)
+        expand_url('input', BASE, options, scoped_id=True)
+        expand_url('input', BASE, copy, scoped_id=True)
+        self.assertEqual(options.url_cache.hits, 1)
+
+    def test_namespaces_get_their_own_memo(self):
+        options = LoadingOptions()
+        self.assertEqual(expand_url('edam:format_1929', BASE, options),
+                         'edam:format_1929')
+        copy = LoadingOptions(copyfrom=options,
+                              namespaces={'edam': 'http://edamontology.org/'})
+        self.assertIsNot(copy.url_cache, options.url_cache)
+        self.assertEqual(expand_url('edam:format_1929', BASE, copy),
+                         'http://edamontology.org/format_1929')
+
+    def test_own_fetcher_gets_own_memo(self):
+        options = LoadingOptions()
+        copy = LoadingOptions(copyfrom=options, fetcher=options.fetcher)
+        self.assertIsNot(copy.url_cache, options.url_cache)
+
+    def test_bounded(self):
+        options = LoadingOptions()
+        options.url_cache.max_entries = 2
+        for name in ('a', 'b', 'c'):
+            expand_url(name, BASE, options, scoped_id=True)
+        self.assertEqual(len(options.url_cache.results), 1)
+        self.assertLessEqual(len(options.url_cache.bases), 2)
+
+    def test_disabled(self):
+        options = LoadingOptions()
+        options.url_cache.max_entries = 0
+        for _ in range(2):
+            self.assertEqual(expand_url('input', BASE, options, scoped_id=True),
+                             'file:///tmp/main.cwl#step/input')
+        self.assertEqual(options.url_cache.results, {})
+        self.assertEqual(options.url_cache.hits + options.url_cache.misses, 0)
+
+    def test_vocabulary_terms_bypass_the_memo(self):
+        options = LoadingOptions()
+        self.assertEqual(expand_url('File', BASE, options, vocab_term=True, scoped_ref=2), 'File')
+        self.assertEqual(options.url_cache.misses, 0)
+
+    def test_unknown_term_still_raises(self):
+        options = LoadingOptions()
+        for _ in range(2):
+            with self.assertRaises(cwl_schema.ValidationException):
+                expand_url('NoSuchType', 'noscheme', options, vocab_term=True)
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import cwl_schema
+from cwlpy import fill_metadata, ChecksumCache
+
+
+def sha1(data):
+    return 'sha1$' + hashlib.sha1(data).hexdigest()
+
+
+class FillMetadataTestCase(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, data):
+        path = os.path.join(self.dir, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_fills_file_fields(self):
+        path = self.write('reads.fastq', b'ACGT\n')
+        empty = self.write('empty.txt', b'')
+        job_order = {
+            'reads': {'class': 'File', 'location': cwl_schema.file_uri(path)},
+            'more': [{'sample': {'class': 'File', 'path': empty}}],
+        }
+        self.assertIs(fill_metadata(job_order), job_order)
+        reads = job_order['reads']
+        self.assertEqual(reads['basename'], 'reads.fastq')
+        self.assertEqual(reads['nameroot'], 'reads')
+        self.assertEqual(reads['nameext'], '.fastq')
+        self.assertEqual(reads['size'], 5)
+        self.assertEqual(reads['checksum'], sha1(b'ACGT\n'))
+        self.assertEqual(job_order['more'][0]['sample']['checksum'], sha1(b''))
+
+    def test_keeps_given_fields_and_skips_missing_files(self):
+        path = self.write('a.txt', b'a')
+        given = {'class': 'File', 'path': path, 'basename': 'b.txt', 'checksum': 'sha1$given'}
+        missing = {'class': 'File', 'location': 'file:///no/such/file'}
+        remote = {'class': 'File', 'location': 'http://example.com/a.txt'}
+        fill_metadata([given, missing, remote])
+        self.assertEqual(given['basename'], 'b.txt')
+        self.assertEqual(given['nameroot'], 'b')
+        self.assertEqual(given['checksum'], 'sha1$given')
+        self.assertEqual(given['size'], 1)
+        self.assertEqual(missing, {'class': 'File', 'location': 'file:///no/such/file'})
+        self.assertEqual(remote, {'class': 'File', 'location': 'http://example.com/a.txt'})
+
+    def test_without_checksums(self):
+        value = {'class': 'File', 'path': self.write('a.txt', b'a')}
+        fill_metadata(value, checksums=False)
+        self.assertEqual(value['size'], 1)
+        self.assertNotIn('checksum', value)
+
+    def test_secondary_files(self):
+        value = {'class': 'File', 'path': self.write('a.bam', b'bam'),
+                 'secondaryFiles': [{'class': 'File', 'path': self.write('a.bam.bai', b'bai')}]}
+        fill_metadata(value)
+        self.assertEqual(value['secondaryFiles'][0]['checksum'], sha1(b'bai'))
+
+    def test_directory_listing(self):
+        self.write('data/b.txt', b'b')
+        self.write('data/a.txt', b'a')
+        self.write('data/sub/c.txt', b'cc')
+        value = {'class': 'Directory', 'location': cwl_schema.file_uri(os.path.join(self.dir, 'data'))}
+        fill_metadata(value)
+        self.assertEqual(value['basename'], 'data')
+        listing = value['listing']
+        self.assertEqual([(entry['class'], entry['basename']) for entry in listing],
+                         [('File', 'a.txt'), ('File', 'b.txt'), ('Directory', 'sub')])
+        self.assertEqual(listing[1]['checksum'], sha1(b'b'))
+        self.assertEqual(listing[2]['listing'][0]['size'], 2)
+
+        value = {'class': 'Directory', 'path': os.path.join(self.dir, 'data')}
+        fill_metadata(value, listing=False)
+        self.assertNotIn('listing', value)
+
+    def test_schema_objects(self):
+        path = self.write('data/a.txt', b'a')
+        options = cwl_schema.LoadingOptions()
+        location = cwl_schema.file_uri(os.path.dirname(path))
+        directory = cwl_schema.Directory({'class': 'Directory', 'location': location}, location, options)
+        fill_metadata({'input': directory})
+        self.assertEqual(directory.basename, 'data')
+        entry = directory.listing[0]
+        self.assertIsInstance(entry, cwl_schema.File)
+        self.assertEqual((entry.basename, entry.size, entry.checksum), ('a.txt', 1, sha1(b'a')))
+
+    def test_cache_avoids_hashing_unchanged_files(self):
+        path = self.write('a.txt', b'a')
+        cache_path = os.path.join(self.dir, 'checksums.json')
+        fill_metadata({'class': 'File', 'path': path}, cache=ChecksumCache(cache_path))
+        self.assertTrue(os.path.exists(cache_path))
+
+        cache = ChecksumCache(cache_path)
+        stat = os.stat(path)
+        cache.entries[path][3] = 'sha1$cached'
+        value = {'class': 'File', 'path': path}
+        fill_metadata(value, cache=cache)
+        self.assertEqual(value['checksum'], 'sha1$cached')
+
+        self.write('a.txt', b'changed')
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        value = {'class': 'File', 'path': path}
+        fill_metadata(value, cache=cache)
+        self.assertEqual(value['checksum'], sha1(b'changed'))
+        self.assertEqual(ChecksumCache(cache_path).entries[path][3], sha1(b'changed'))
@@ -0,0 +1,110 @@
+import copy
+import pickle
+from unittest import TestCase
+
+from cwlpy import Workflow, WorkflowStep, WorkflowStepOutput, InputParameter
+from cwlpy.cwlpy import _IdIndexedList
+
+
+class Item(object):
+
+    def __init__(self, id):
+        self.id = id
+
+
+class IdIndexedListTestCase(TestCase):
+
+    def setUp(self):
+        self.a, self.b, self.c = Item('a'), Item('b'), Item('c')
+        self.items = _IdIndexedList([self.a, self.b])
+
+    def test_by_id(self):
+        self.assertIs(self.items.by_id('a'), self.a)
+        self.assertIsNone(self.items.by_id('c'))
+
+    def test_all_by_id_in_order(self):
+        other_a = Item('a')
+        self.items.append(other_a)
+        self.assertEqual(self.items.all_by_id('a'), [self.a, other_a])
+        self.assertIs(self.items.by_id('a'), self.a)
+
+    def test_contains_by_identity(self):
+        self.assertIn(self.a, self.items)
+        self.assertNotIn(Item('a'), self.items)
+
+    def test_contains_ignores_equality(self):
+        class Equal(Item):
+            def __eq__(self, other):
+                return True
+            __hash__ = Item.__hash__
+        equal = Equal('a')
+        items = _IdIndexedList([equal])
+        self.assertIn(equal, items)
+        self.assertNotIn(Equal('a'), items)
+        self.assertNotIn(self.a, items)
+
+    def test_append_and_extend(self):
+        self.items.by_id('a')
+        self.items.append(self.c)
+        self.assertIs(self.items.by_id('c'), self.c)
+        self.items += [Item('d')]
+        self.assertIsNotNone(self.items.by_id('d'))
+        self.items.extend(Item(i) for i in 'ef')
+        self.assertEqual(self.items.by_id('f').id, 'f')
+
+    def test_other_changes_reindex(self):
+        self.items.by_id('a')
+        self.items.remove(self.a)
+        self.assertIsNone(self.items.by_id('a'))
+        self.assertNotIn(self.a, self.items)
+        self.items.insert(0, self.c)
+        self.assertIs(self.items.by_id('c'), self.c)
+        self.items[0] = self.a
+        self.assertIsNone(self.items.by_id('c'))
+        self.assertIs(self.items.by_id('a'), self.a)
+        del self.items[:]
+        self.assertIsNone(self.items.by_id('a'))
+        self.items.append(self.b)
+        self.assertIs(self.items.pop(), self.b)
+        self.assertNotIn(self.b, self.items)
+
+    def test_copy_and_pickle(self):
+        self.items.by_id('a')
+        copied = copy.copy(self.items)
+        self.assertIs(copied.by_id('b'), self.b)
+        unpickled = pickle.loads(pickle.dumps(self.items))
+        self.assertEqual([item.id for item in unpickled], ['a', 'b'])
+        self.assertIs(unpickled.by_id('b'), unpickled[1])
+
+    def test_still_a_list(self):
+        self.assertEqual(self.items, [self.a, self.b])
+        self.assertIsInstance(self.items, list)
+
+
+class IndexedBuilderTestCase(TestCase):
+
+    def test_replaced_lists_are_indexed(self):
+        workflow = Workflow('wf')
+        parameter = InputParameter('x')
+        workflow.inputs = [parameter]
+        self.assertIs(workflow.input_parameter_by_id('x'), parameter)
+        step = WorkflowStep('step')
+        workflow.steps = [step]
+        workflow.connect_input(step, 'x')
+        self.assertIs(workflow.step_by_id('step'), step)
+        self.assertEqual(len(workflow.inputs), 1)
+
+    def test_direct_list_changes_are_seen(self):
+        step = WorkflowStep('step')
+        output = WorkflowStepOutput('out')
+        step.out.append(output)
+        self.assertIs(step.workflow_step_output_by_id('out'), output)
+        step.out.remove(output)
+        self.assertIsNone(step.workflow_step_output_by_id('out'))
+
+    def test_save_gives_plain_lists(self):
+        workflow = Workflow('wf')
+        workflow.add_step(WorkflowStep('step', run='tool.cwl'))
+        saved = workflow.save()
+        self.assertIs(type(saved['steps']), list)
+        self.assertIs(type(saved['steps'][0]['in']), list)
@@ -0,0 +1,88 @@
+import copy
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from ruamel import yaml
+
+import cwl_schema
+
+
+WORKFLOW = """class: Workflow
+cwlVersion: v1.0
+id: main
+inputs:
+  message: string
+  count:
+    type: int
+    default: 1
+outputs: {}
+steps:
+  echo:
+    run: echo.cwl
+    in:
+      message: message
+    out: [output]
+"""
+
+ALIASED = """class: CommandLineTool
+cwlVersion: v1.0
+baseCommand: echo
+inputs:
+  first: &input
+    type: string
+  second: *input
+outputs: []
+"""
+
+
+def parse(text, url):
+    doc = yaml.round_trip_load(text)
+    cwl_schema.add_lc_filename(doc, url)
+    return doc
+
+
+class IdMapLoaderTestCase(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return cwl_schema.file_uri(path)
+
+    def test_own_documents_are_not_copied(self):
+        url = self.write('main.cwl', WORKFLOW)
+        options = cwl_schema.LoadingOptions()
+        loaded = cwl_schema.load_document(url, loadingOptions=options)
+        self.assertIn(url, options.owned)
+        self.assertTrue(loaded.loadingOptions.owns_documents)
+        parsed = options.idx[url]
+        self.assertEqual(parsed['inputs']['count']['id'], 'count')
+        self.assertEqual(parsed['steps']['echo']['id'], 'echo')
+        expected = cwl_schema.load_document(parse(WORKFLOW, url), url)
+        self.assertEqual(loaded.save(), expected.save())
+        # Loading it again gives the same
+        self.assertEqual(cwl_schema.load_document(url, loadingOptions=options).save(), expected.save())
+
+    def test_given_documents_are_not_changed(self):
+        url = self.write('main.cwl', WORKFLOW)
+        doc = parse(WORKFLOW, url)
+        before = copy.deepcopy(doc)
+        options = cwl_schema.load_document(url).loadingOptions
+        loaded = cwl_schema.load_document(doc, url, loadingOptions=options)
+        self.assertFalse(loaded.loadingOptions.owns_documents)
+        self.assertEqual(doc, before)
+
+    def test_documents_with_aliases_are_copied(self):
+        url = self.write('tool.cwl', ALIASED)
+        options = cwl_schema.LoadingOptions()
+        tool = cwl_schema.load_document(url, loadingOptions=options)
+        self.assertNotIn(url, options.owned)
+        self.assertEqual([i.id for i in tool.inputs], [url + '#first', url + '#second'])
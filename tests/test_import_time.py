@@ -0,0 +1,57 @@
+import os
+import re
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_TIME = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)\s*$')
+
+# Imported on first use only: the network stack by the fetcher, the rest by
+# file_uri(), JSON parsing and ParseCache
+DEFERRED_MODULES = ('requests', 'cachecontrol', 'schema_salad', 'urllib.request',
+                    'http.client', 'json', 'orjson', 'hashlib')
+
+# Imported by the first use of one of the names cwlpy gives for them
+LAZY_SUBMODULES = ('cwlpy.graph', 'cwlpy.planner', 'cwlpy.executor', 'cwlpy.validator',
+                   'cwlpy.metadata', 'cwlpy.serialize')
+
+
+def run_import(*args):
+    process = subprocess.Popen([sys.executable] + list(args), cwd=ROOT,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = process.communicate()
+    if process.returncode:
+        raise AssertionError(err.decode())
+    return out.decode(), err.decode()
+
+
+@skipIf(sys.version_info < (3, 7), '-X importtime needs Python 3.7')
+class ImportTimeTestCase(TestCase):
+
+    def test_import_defers_modules(self):
+        out, _ = run_import('-c', 'import sys, cwlpy; print(" ".join(sorted(sys.modules)))')
+        imported = set(out.split())
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, imported)
+
+    def test_import_defers_submodules(self):
+        out, _ = run_import('-c', 'import sys, cwlpy; print(" ".join(sorted(sys.modules)))')
+        imported = set(out.split())
+        for module in LAZY_SUBMODULES:
+            self.assertNotIn(module, imported)
+        out, _ = run_import('-c', 'import sys; from cwlpy import plan, dump_json; print(" ".join(sorted(sys.modules)))')
+        imported = set(out.split())
+        self.assertIn('cwlpy.planner', imported)
+        self.assertIn('cwlpy.serialize', imported)
+        self.assertNotIn('cwlpy.executor', imported)
+
+    def test_import_time(self):
+        _, err = run_import('-X', 'importtime', '-c', 'import cwlpy')
+        times = dict((m.group(2), int(m.group(1)))
+                     for m in map(IMPORT_TIME.match, err.splitlines()) if m)
+        # Generous, this is about catching an accidental heavy import rather
+        # than measuring; see benchmarks/bench_import_time.py
+        self.assertLess(times['cwlpy'], 2 * 1000 * 1000)
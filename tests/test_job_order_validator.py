@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import cwl_schema
+from cwlpy import Workflow, WorkflowStep, ValidationException
+from cwlpy.validator import job_order_validator, validate_job_order, MAX_ERRORS
+
+TOOL = """
+class: CommandLineTool
+cwlVersion: v1.0
+requirements:
+  - class: SchemaDefRequirement
+    types:
+      - name: Pair
+        type: record
+        fields:
+          - {name: left, type: int}
+          - {name: right, type: string?}
+baseCommand: echo
+inputs:
+  files: File[]
+  maybe: int?
+  color:
+    type:
+      type: enum
+      symbols: [red, green]
+  sample:
+    type:
+      type: record
+      fields:
+        - {name: size, type: long}
+        - {name: reads, type: {type: array, items: string}}
+  pair: Pair
+  matrix: {type: {type: array, items: {type: array, items: double}}}
+  anything: Any
+  named:
+    type: string
+    default: x
+outputs: []
+"""
+
+
+def valid_job_order():
+    return {
+        'files': [{'class': 'File', 'path': '/data/%d.bam' % i} for i in range(3)],
+        'color': 'red',
+        'sample': {'size': 10, 'reads': ['a', 'b']},
+        'pair': {'left': 2},
+        'matrix': [[1.0, 2], [3.5]],
+        'anything': 0,
+    }
+
+
+class JobOrderValidatorTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.mkdtemp()
+        path = os.path.join(cls.dir, 'tool.cwl')
+        with open(path, 'w') as f:
+            f.write(TOOL)
+        cls.tool = cwl_schema.load_document(cwl_schema.file_uri(path))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.dir)
+
+    def errors(self, job_order):
+        with self.assertRaises(ValidationException) as context:
+            validate_job_order(self.tool, job_order)
+        return str(context.exception).splitlines()[1:]
+
+    def test_valid_job_order(self):
+        validate_job_order(self.tool, valid_job_order())
+        job_order = valid_job_order()
+        job_order.update(maybe=3, named='y', anything={'a': 1}, pair={'left': 1, 'right': 'r'})
+        validate_job_order(self.tool, job_order)
+
+    def test_validator_is_cached(self):
+        self.assertIs(job_order_validator(self.tool), job_order_validator(self.tool))
+
+    def test_error_paths(self):
+        job_order = valid_job_order()
+        job_order['files'][1] = {'class': 'Directory', 'path': '/data'}
+        job_order['files'][2] = {'class': 'File'}
+        job_order['sample']['reads'][1] = 5
+        job_order['matrix'][1][0] = 'x'
+        job_order['pair'] = {'right': 3}
+        job_order['maybe'] = 1.5
+        job_order['color'] = 'blue'
+        del job_order['anything']
+        self.assertEqual(self.errors(job_order), [
+            "anything: missing, expected Any",
+            "color: expected one of green, red, got 'blue'",
+            "files[1]: expected File, got Directory",
+            "files[2]: File has none of location, path, contents",
+            "matrix[1][0]: expected float, got 'x'",
+            "maybe: expected int, got 1.5",
+            "pair.left: expected int, got null",
+            "pair.right: expected string, got 3",
+            "sample.reads[1]: expected string, got 5",
+        ])
+
+    def test_booleans_are_not_numbers(self):
+        job_order = valid_job_order()
+        job_order['sample']['size'] = True
+        self.assertEqual(self.errors(job_order), ["sample.size: expected int, got true"])
+
+    def test_array_of_subclassed_values(self):
+        class Text(str):
+            pass
+
+        job_order = valid_job_order()
+        job_order['sample']['reads'] = [Text('a'), 'b']
+        validate_job_order(self.tool, job_order)
+
+    def test_errors_are_capped(self):
+        job_order = valid_job_order()
+        job_order['files'] = [None] * (MAX_ERRORS + 5)
+        errors = self.errors(job_order)
+        self.assertEqual(len(errors), MAX_ERRORS + 1)
+        self.assertEqual(errors[-1], 'and 5 more')
+
+    def test_built_workflow(self):
+        workflow = Workflow('wf')
+        step = WorkflowStep('step', run='tool.cwl')
+        workflow.step(step)
+        workflow.connect_input(step, 'reads', 'reads')
+        validator = job_order_validator(workflow)
+        validator({'reads': 'anything'})
+        workflow.inputs[0].type = 'File[]'
+        validator = job_order_validator(workflow)
+        validator({'reads': [{'class': 'File', 'location': 'a.bam'}]})
+        with self.assertRaises(ValidationException):
+            validator({'reads': 'a.bam'})
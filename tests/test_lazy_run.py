@@ -0,0 +1,104 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import cwl_schema
+
+
+WORKFLOW = """class: Workflow
+cwlVersion: v1.0
+inputs: []
+outputs: []
+steps:
+  by_url:
+    run: echo.cwl
+    in: []
+    out: []
+  again_by_url:
+    run: echo.cwl
+    in: []
+    out: []
+  inline:
+    run:
+      class: ExpressionTool
+      id: inline-tool
+      expression: "$({})"
+      inputs: []
+      outputs: []
+    in: []
+    out: []
+"""
+
+TOOL = """class: CommandLineTool
+id: echo
+baseCommand: echo
+inputs: []
+outputs: []
+"""
+
+
+class LazyRunTestCase(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        for name, text in (('main.cwl', WORKFLOW), ('echo.cwl', TOOL)):
+            with open(os.path.join(self.tmpdir, name), 'w') as f:
+                f.write(text)
+        self.url = cwl_schema.file_uri(os.path.join(self.tmpdir, 'main.cwl'))
+        self.tool_url = cwl_schema.file_uri(os.path.join(self.tmpdir, 'echo.cwl'))
+        self.options = cwl_schema.LoadingOptions(lazy_run=True)
+        self.workflow = cwl_schema.load_document(self.url, loadingOptions=self.options)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def steps(self):
+        return dict((step.id.split('#')[-1], step) for step in self.workflow.steps)
+
+    def test_not_loaded_until_accessed(self):
+        run = self.steps()['by_url'].run
+        self.assertIsInstance(run, cwl_schema.LazyProcess)
+        self.assertFalse(run.loaded)
+        self.assertNotIn(self.tool_url, self.options.idx)
+        self.assertEqual(run.baseCommand, 'echo')
+        self.assertTrue(run.loaded)
+        self.assertIsInstance(run.resolve(), cwl_schema.CommandLineTool)
+
+    def test_same_url_loads_once(self):
+        steps = self.steps()
+        self.assertIs(steps['by_url'].run.resolve(), steps['again_by_url'].run.resolve())
+
+    def test_inline(self):
+        run = self.steps()['inline'].run
+        self.assertFalse(run.loaded)
+        self.assertEqual(run.expression, '$({})')
+        self.assertIsInstance(run.resolve(), cwl_schema.ExpressionTool)
+
+    def test_save_matches_eager_load(self):
+        eager = cwl_schema.load_document(self.url)
+        self.assertEqual(json.dumps(self.workflow.save()), json.dumps(eager.save()))
+
+    def test_validation_is_deferred(self):
+        with open(os.path.join(self.tmpdir, 'echo.cwl'), 'w') as f:
+            f.write(TOOL.replace('baseCommand', 'baseCommandd'))
+        workflow = cwl_schema.load_document(self.url, loadingOptions=cwl_schema.LoadingOptions(lazy_run=True))
+        with self.assertRaises(cwl_schema.ValidationException) as cm:
+            workflow.steps[0].run.resolve()
+        self.assertIn('invalid field `baseCommandd`', str(cm.exception))
+
+    def test_graph_fragment(self):
+        packed = {'$graph': [
+            dict(json.loads(json.dumps(cwl_schema.load_document(self.tool_url).save())), id='#echo'),
+            {'class': 'Workflow', 'id': '#main', 'inputs': [], 'outputs': [],
+             'steps': [{'id': '#main/step', 'run': '#echo', 'in': [], 'out': []}]},
+        ]}
+        path = os.path.join(self.tmpdir, 'packed.cwl')
+        with open(path, 'w') as f:
+            json.dump(packed, f)
+        options = cwl_schema.LoadingOptions(lazy_run=True)
+        processes = cwl_schema.load_document(cwl_schema.file_uri(path), loadingOptions=options)
+        run = processes[1].steps[0].run
+        self.assertEqual(run.id, cwl_schema.file_uri(path) + '#echo')
+        self.assertEqual(run.baseCommand, 'echo')
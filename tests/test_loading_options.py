@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import cwl_schema
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUILD_WORKFLOW = """
+import sys
+from cwlpy import Workflow, WorkflowStep
+workflow = Workflow('revsort')
+rev_step = WorkflowStep('rev', run='revtool.cwl')
+sort_step = WorkflowStep('sorted', run='sorttool.cwl')
+workflow.step(rev_step).step(sort_step)
+workflow.connect_input(rev_step, 'wf-input', 'revstep-input')
+workflow.connect_steps(rev_step, sort_step, 'revstep-output', 'sortstep-input')
+workflow.connect_output(sort_step, 'sortstep-output', 'wf-output')
+workflow.save()
+print(' '.join(m for m in ('requests', 'cachecontrol', 'schema_salad') if m in sys.modules))
+"""
+
+
+class CountingFetcher(object):
+
+    def __init__(self):
+        self.joins = 0
+
+    def urljoin(self, base_url, url):
+        self.joins += 1
+        return cwl_schema._default_urljoin(base_url, url)
+
+
+class LoadingOptionsFetcherTestCase(TestCase):
+
+    def test_fetcher_is_created_on_first_use(self):
+        options = cwl_schema.LoadingOptions()
+        self.assertIsNone(options._fetcher)
+        fetcher = options.fetcher
+        self.assertIsNotNone(fetcher)
+        self.assertIs(options.fetcher, fetcher)
+
+    def test_copies_share_the_fetcher(self):
+        options = cwl_schema.LoadingOptions()
+        copy = cwl_schema.LoadingOptions(copyfrom=options, fileuri='file:///tmp/x.cwl')
+        self.assertIs(copy.fetcher, options.fetcher)
+        # created through the copy, still shared with the original
+        options = cwl_schema.LoadingOptions()
+        copy = cwl_schema.LoadingOptions(copyfrom=options)
+        self.assertIs(options.fetcher, copy.fetcher)
+
+    def test_urljoin_uses_given_fetcher(self):
+        fetcher = CountingFetcher()
+        options = cwl_schema.LoadingOptions(fetcher=fetcher)
+        copy = cwl_schema.LoadingOptions(copyfrom=options)
+        self.assertEqual(copy.urljoin('file:///tmp/a/b.cwl', 'c.cwl'), 'file:///tmp/a/c.cwl')
+        self.assertEqual(fetcher.joins, 1)
+
+    def test_urljoin_matches_default_fetcher(self):
+        cases = [
+            ('file:///tmp/a/b.cwl', 'c.cwl'),
+            ('file:///tmp/a/b.cwl', '../c.cwl#main'),
+            ('file:///tmp/a/b.cwl', '#step'),
+            ('file:///tmp/a/b.cwl', 'http://example.com/c.cwl'),
+            ('http://example.com/a/b.cwl', 'c.cwl'),
+            ('http://example.com/a/b.cwl', '_:b0'),
+        ]
+        fetcher = cwl_schema.LoadingOptions().fetcher
+        for base_url, url in cases:
+            options = cwl_schema.LoadingOptions()
+            self.assertEqual(options.urljoin(base_url, url), fetcher.urljoin(base_url, url))
+            self.assertIsNone(options._fetcher)
+
+    def test_urljoin_refuses_file_url_from_remote_base(self):
+        options = cwl_schema.LoadingOptions()
+        with self.assertRaises(cwl_schema.ValidationException):
+            options.urljoin('http://example.com/a.cwl', 'file:///etc/passwd')
+
+    def test_building_workflow_does_not_import_fetcher_dependencies(self):
+        output = subprocess.check_output([sys.executable, '-c', BUILD_WORKFLOW], cwd=ROOT)
+        self.assertEqual(output.decode().strip(), '')
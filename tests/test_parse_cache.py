@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import cwl_schema
+
+
+TOOL = """class: CommandLineTool
+cwlVersion: v1.0
+id: echo
+baseCommand: echo
+inputs:
+  message: string
+outputs: []
+"""
+
+
+class ParseCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'echo.cwl')
+        self.write(TOOL)
+        self.url = cwl_schema.file_uri(self.path)
+        self.cache_dir = os.path.join(self.tmpdir, 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def load(self, cache):
+        return cwl_schema.load_document(self.url, loadingOptions=cwl_schema.LoadingOptions(parse_cache=cache))
+
+    def test_second_load_hits(self):
+        first = cwl_schema.ParseCache(self.cache_dir)
+        saved = self.load(first).save()
+        self.assertEqual((first.hits, first.misses), (0, 1))
+        # A new cache object stands in for another process
+        second = cwl_schema.ParseCache(self.cache_dir)
+        self.assertEqual(self.load(second).save(), saved)
+        self.assertEqual((second.hits, second.misses), (1, 0))
+
+    def test_keeps_line_numbers(self):
+        cache = cwl_schema.ParseCache(self.cache_dir)
+        self.load(cache)
+        doc = cache.get(self.url, TOOL)
+        self.assertEqual(doc.lc.data['inputs'][0], 4)
+        self.assertEqual(doc.lc.filename, cwl_schema.relname(self.url))
+
+    def test_changed_content_misses(self):
+        cache = cwl_schema.ParseCache(self.cache_dir)
+        self.load(cache)
+        self.write(TOOL.replace('echo', 'printf'))
+        self.assertEqual(self.load(cache).baseCommand, 'printf')
+        self.assertEqual(cache.misses, 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = cwl_schema.ParseCache(self.cache_dir)
+        cache.put('file:///a.cwl', 'a', {'a': 1})
+        size = os.path.getsize(cache.path('file:///a.cwl', 'a'))
+        cache.max_bytes = 2 * size
+        os.utime(cache.path('file:///a.cwl', 'a'), (0, 0))
+        cache.put('file:///b.cwl', 'b', {'b': 1})
+        cache.put('file:///c.cwl', 'c', {'c': 1})
+        self.assertIsNone(cache.get('file:///a.cwl', 'a'))
+        self.assertEqual(cache.get('file:///c.cwl', 'c'), {'c': 1})
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
@@ -0,0 +1,123 @@
+import os
+from unittest import TestCase
+
+import cwl_schema
+from cwlpy import Workflow, WorkflowStep, ValidationException, plan, step_resources
+
+
+def resource_hint(cores=None, ram=None):
+    hint = {'class': 'ResourceRequirement'}
+    if cores is not None:
+        hint['coresMin'] = cores
+    if ram is not None:
+        hint['ramMin'] = ram
+    return [hint]
+
+
+def fork_join(width, cores=1):
+    """start -> width parallel steps -> end."""
+    workflow = Workflow('fork-join')
+    start = WorkflowStep('start', run='start.cwl')
+    end = WorkflowStep('end', run='end.cwl')
+    workflow.add_step(start)
+    middle = []
+    for i in range(width):
+        step = WorkflowStep('middle-%d' % i, run='middle.cwl')
+        step.hints = resource_hint(cores)
+        workflow.add_step(step)
+        workflow.connect_steps(start, step, 'output', 'input')
+        middle.append(step)
+    workflow.add_step(end)
+    for i, step in enumerate(middle):
+        workflow.connect_steps(step, end, 'output', 'input-%d' % i)
+    return workflow
+
+
+class StepResourcesTestCase(TestCase):
+
+    def test_defaults(self):
+        self.assertEqual(step_resources(WorkflowStep('step')), (1, 1024))
+
+    def test_hints(self):
+        step = WorkflowStep('step')
+        step.hints = resource_hint(4, 2048)
+        self.assertEqual(step_resources(step), (4, 2048))
+
+    def test_max_when_no_min_and_expressions_ignored(self):
+        step = WorkflowStep('step')
+        step.hints = [{'class': 'ResourceRequirement', 'coresMax': 3, 'ramMin': '$(inputs.size)'}]
+        self.assertEqual(step_resources(step), (3, 1024))
+
+    def test_requirements_before_tool_before_hints(self):
+        doc = {
+            'class': 'Workflow',
+            'cwlVersion': 'v1.0',
+            'inputs': [],
+            'outputs': [],
+            'steps': [{
+                'id': 'step',
+                'in': [],
+                'out': [],
+                'hints': [{'class': 'ResourceRequirement', 'coresMin': 8}],
+                'run': {
+                    'class': 'CommandLineTool',
+                    'inputs': [],
+                    'outputs': [],
+                    'requirements': [{'class': 'ResourceRequirement', 'coresMin': 2, 'ramMin': 512}],
+                },
+            }],
+        }
+        workflow = cwl_schema.load_document(doc, cwl_schema.file_uri(os.getcwd()) + '/main.cwl')
+        step = workflow.steps[0]
+        self.assertEqual(step_resources(step), (2, 512))
+        step.requirements = [step.run.requirements[0]]
+        step.run.requirements = None
+        step.requirements[0].coresMin = 6
+        self.assertEqual(step_resources(step), (6, 512))
+
+
+class PlanTestCase(TestCase):
+
+    def test_critical_path(self):
+        workflow = fork_join(3)
+        runtimes = {'start.cwl': 10, 'middle-1': 30, 'middle.cwl': 20, 'end': 5}
+        result = plan(workflow, (8, 16384), runtimes)
+        self.assertEqual(result.critical_path, ['start', 'middle-1', 'end'])
+        self.assertEqual(result.critical_path_length, 45)
+        self.assertEqual(result.makespan, 45)
+
+    def test_limited_cores(self):
+        result = plan(fork_join(4, cores=2), (4, 16384), default_runtime=1.0)
+        # start, then two middle steps at a time, then end
+        self.assertEqual(result.makespan, 4.0)
+        self.assertEqual(result.critical_path_length, 3.0)
+        self.assertAlmostEqual(result.core_utilization, (1 + 4 * 2 + 1) / (4.0 * 4))
+        self.assertEqual(sorted(result.start[1:5]), [1.0, 1.0, 2.0, 2.0])
+        self.assertEqual(result.finish[-1], 4.0)
+
+    def test_several_nodes(self):
+        result = plan(fork_join(4, cores=2), [(2, 4096), (2, 4096)])
+        self.assertEqual(result.makespan, 4.0)
+        self.assertEqual(sorted(result.node[1:5]), [0, 0, 1, 1])
+        result = plan(fork_join(4, cores=2), [(4, 4096), (4, 4096)])
+        self.assertEqual(result.makespan, 3.0)
+
+    def test_memory_limits(self):
+        workflow = fork_join(2)
+        for step in workflow.steps[1:3]:
+            step.hints = resource_hint(1, 3000)
+        self.assertEqual(plan(workflow, (8, 4096)).makespan, 4.0)
+        self.assertEqual(plan(workflow, (8, 8192)).makespan, 3.0)
+
+    def test_step_too_large(self):
+        with self.assertRaises(ValidationException) as cm:
+            plan(fork_join(2, cores=16), [(8, 4096), (8, 4096)])
+        self.assertIn('middle-0, middle-1', str(cm.exception))
+
+    def test_runtime_function(self):
+        result = plan(fork_join(2), (8, 4096), lambda step: 2.0 if step.id == 'end' else None)
+        self.assertEqual(result.makespan, 4.0)
+
+    def test_empty(self):
+        result = plan(Workflow('empty'), (1, 1024))
+        self.assertEqual((result.makespan, result.critical_path, result.core_utilization), (0.0, [], 0.0))
@@ -0,0 +1,179 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+from six.moves import BaseHTTPServer, SimpleHTTPServer
+
+import cwl_schema
+
+
+WORKFLOW = """class: Workflow
+cwlVersion: v1.0
+inputs: []
+outputs: []
+requirements:
+  - $import: requirements.yml
+steps:
+%s
+"""
+
+STEP = """  step%d:
+    run: tools/tool%d.cwl
+    in: []
+    out: []
+"""
+
+TOOL = """class: CommandLineTool
+baseCommand: [tool, "%d"]
+doc: {$include: ../README.txt}
+inputs: []
+outputs: []
+"""
+
+
+def write_tree(root, n_tools):
+    os.makedirs(os.path.join(root, 'tools'))
+    files = {
+        'main.cwl': WORKFLOW % ''.join(STEP % (i, i) for i in range(n_tools)),
+        'requirements.yml': 'class: ScatterFeatureRequirement\n',
+        'README.txt': 'A tool.',
+    }
+    for i in range(n_tools):
+        files['tools/tool%d.cwl' % i] = TOOL % i
+    for name, text in files.items():
+        with open(os.path.join(root, name), 'w') as f:
+            f.write(text)
+
+
+class CountingFetcher(object):
+    """Wraps a fetcher, recording the fetched urls and peak concurrency."""
+
+    def __init__(self, fetcher, delay=0.02):
+        self.fetcher = fetcher
+        self.delay = delay
+        self.fetched = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def fetch_text(self, url):
+        with self.lock:
+            self.fetched.append(url)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        try:
+            return self.fetcher.fetch_text(url)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def urljoin(self, base, url):
+        return self.fetcher.urljoin(base, url)
+
+
+class PrefetchTestBase(object):
+
+    n_tools = 6
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        write_tree(self.tmpdir, self.n_tools)
+        self.fetcher = CountingFetcher(cwl_schema.LoadingOptions().fetcher)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def base_url(self):
+        return cwl_schema.file_uri(self.tmpdir) + '/'
+
+    def check_prefetch(self):
+        url = self.base_url() + 'main.cwl'
+        options = cwl_schema.LoadingOptions(fetcher=self.fetcher)
+        cwl_schema.prefetch(url, loadingOptions=options, max_workers=4, follow_runs=True)
+        # main.cwl, requirements.yml, README.txt and the tools
+        self.assertEqual(len(self.fetcher.fetched), self.n_tools + 3)
+        self.assertGreater(self.fetcher.peak, 1)
+        self.assertLessEqual(self.fetcher.peak, 4)
+        for i in range(self.n_tools):
+            self.assertIn(self.base_url() + 'tools/tool%d.cwl' % i, options.idx)
+        self.assertEqual(options.includes[self.base_url() + 'README.txt'], 'A tool.')
+
+        del self.fetcher.fetched[:]
+        workflow = cwl_schema.load_document(url, loadingOptions=options)
+        self.assertEqual(self.fetcher.fetched, [])
+        self.assertEqual(workflow.requirements[0].save(), {'class': 'ScatterFeatureRequirement'})
+        self.assertEqual(workflow.steps[0].run, self.base_url() + 'tools/tool0.cwl')
+
+    def test_prefetch(self):
+        self.check_prefetch()
+
+
+class FilePrefetchTestCase(PrefetchTestBase, TestCase):
+
+    def test_runs_are_not_followed_by_default(self):
+        url = self.base_url() + 'main.cwl'
+        options = cwl_schema.prefetch(url, loadingOptions=cwl_schema.LoadingOptions(fetcher=self.fetcher))
+        self.assertEqual(sorted(self.fetcher.fetched), [url, self.base_url() + 'requirements.yml'])
+        del self.fetcher.fetched[:]
+        workflow = cwl_schema.load_document(url, loadingOptions=options)
+        self.assertEqual(self.fetcher.fetched, [])
+        self.assertEqual(workflow.steps[0].run, self.base_url() + 'tools/tool0.cwl')
+
+    def test_runs_are_followed_when_lazy(self):
+        url = self.base_url() + 'main.cwl'
+        options = cwl_schema.LoadingOptions(fetcher=self.fetcher, lazy_run=True)
+        cwl_schema.prefetch(url, loadingOptions=options)
+        self.assertEqual(len(self.fetcher.fetched), self.n_tools + 3)
+        del self.fetcher.fetched[:]
+        workflow = cwl_schema.load_document(url, loadingOptions=options)
+        self.assertEqual(workflow.steps[0].run.resolve().doc, 'A tool.')
+        self.assertEqual(self.fetcher.fetched, [])
+
+    def test_include_is_used_by_load(self):
+        url = self.base_url() + 'tools/tool1.cwl'
+        options = cwl_schema.LoadingOptions(fetcher=self.fetcher)
+        cwl_schema.prefetch(url, loadingOptions=options)
+        del self.fetcher.fetched[:]
+        self.assertEqual(cwl_schema.load_document(url, loadingOptions=options).doc, 'A tool.')
+        self.assertEqual(self.fetcher.fetched, [])
+
+    def test_missing_reference_is_left_to_load(self):
+        os.remove(os.path.join(self.tmpdir, 'requirements.yml'))
+        url = self.base_url() + 'main.cwl'
+        options = cwl_schema.prefetch(url, loadingOptions=cwl_schema.LoadingOptions(fetcher=self.fetcher))
+        with self.assertRaises(Exception):
+            cwl_schema.load_document(url, loadingOptions=options)
+
+
+class QuietHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+
+class HTTPPrefetchTestCase(PrefetchTestBase, TestCase):
+
+    def setUp(self):
+        super(HTTPPrefetchTestCase, self).setUp()
+        root = self.tmpdir
+
+        class Handler(QuietHandler):
+            def translate_path(self, path):
+                return os.path.join(root, path.lstrip('/'))
+
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super(HTTPPrefetchTestCase, self).tearDown()
+
+    def base_url(self):
+        return 'http://127.0.0.1:%d/' % self.server.server_address[1]
@@ -0,0 +1,175 @@
+import json
+import threading
+from unittest import TestCase
+
+from ruamel import yaml
+
+import cwl_schema
+from cwlpy import Workflow, WorkflowStep, WorkflowStepInput, WorkflowStepOutput, InputParameter, \
+    WorkflowOutputParameter
+
+TOOL = {
+    'class': 'CommandLineTool',
+    'baseCommand': 'echo',
+    'inputs': [{'id': 'input', 'type': 'string', 'inputBinding': {'position': 1}}],
+    'outputs': [{'id': 'output', 'type': 'stdout'}],
+}
+
+
+def build(n_steps=3):
+    workflow = Workflow('main')
+    steps = [WorkflowStep('step-%d' % i, run='tool.cwl') for i in range(n_steps)]
+    for step in steps:
+        workflow.add_step(step)
+    workflow.connect_input(steps[0], 'input')
+    for source, target in zip(steps, steps[1:]):
+        workflow.connect_steps(source, target, 'output', 'input')
+    workflow.connect_output(steps[-1], 'output')
+    return workflow
+
+
+def cached(obj):
+    """The result of obj.save() that obj keeps."""
+    return obj._saved[1]
+
+
+def fresh(obj):
+    """A copy of what obj.save() returns, sharing nothing with it."""
+    return json.loads(json.dumps(obj.save()))
+
+
+class SaveCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.workflow = build()
+        self.saved = self.workflow.save()
+        self.cached = cached(self.workflow)
+
+    def test_unchanged_workflow_is_not_saved_again(self):
+        self.assertEqual(self.workflow.save(), self.saved)
+        self.assertIs(cached(self.workflow), self.cached)
+
+    def test_changed_step_is_saved_again(self):
+        steps = self.workflow.steps
+        steps[1].set_run('other.cwl')
+        saved = self.workflow.save()
+        self.assertEqual(saved['steps'][1]['run'], 'other.cwl')
+        self.assertIsNot(cached(self.workflow), self.cached)
+        self.assertIs(cached(self.workflow)['steps'][0], self.cached['steps'][0])
+        self.assertIs(cached(self.workflow)['steps'][2], self.cached['steps'][2])
+        self.assertIsNot(cached(self.workflow)['steps'][1], self.cached['steps'][1])
+
+    def test_same_as_without_cache(self):
+        self.workflow.steps[2].label = 'last'
+        self.workflow.connect_input(self.workflow.steps[2], 'extra')
+        expected = build()
+        expected.steps[2].label = 'last'
+        expected.connect_input(expected.steps[2], 'extra')
+        self.assertEqual(self.workflow.save(), fresh(expected))
+
+    def test_list_changes(self):
+        self.workflow.steps[0].in_[0].source = 'other'
+        self.assertEqual(self.workflow.save()['steps'][0]['in'][0]['source'], 'other')
+        self.workflow.steps[0].add_input(WorkflowStepInput('added'))
+        self.assertEqual([i['id'] for i in self.workflow.save()['steps'][0]['in']], ['input', 'added'])
+        self.workflow.steps.pop()
+        self.assertEqual(len(self.workflow.save()['steps']), 2)
+
+    def test_in_place_changes_need_mark_dirty(self):
+        step = self.workflow.steps[0]
+        step.set_run(cwl_schema.load_document(dict(TOOL), 'file:///tmp/tool.cwl'))
+        self.assertEqual(self.workflow.save()['steps'][0]['run']['baseCommand'], 'echo')
+        step.run.baseCommand = 'printf'
+        self.assertEqual(self.workflow.save()['steps'][0]['run']['baseCommand'], 'echo')
+        step.mark_dirty()
+        self.assertEqual(self.workflow.save()['steps'][0]['run']['baseCommand'], 'printf')
+
+    def test_shared_objects_are_not_aliased(self):
+        # The workflow input is also the source of the first step's input
+        self.assertIs(self.workflow.steps[0].in_[0].source, self.workflow.inputs[0])
+        for _ in range(2):
+            text = yaml.safe_dump(self.workflow.save(), default_flow_style=False)
+            self.assertNotIn('&id', text)
+            self.workflow.steps[1].label = 'changed'
+
+        step = WorkflowStep('twice', run='tool.cwl')
+        self.workflow.steps.append(step)
+        self.workflow.steps.append(step)
+        self.assertNotIn('&id', yaml.safe_dump(self.workflow.save(), default_flow_style=False))
+
+    def test_results_can_be_changed(self):
+        self.saved['steps'][0]['label'] = 'changed'
+        self.saved['steps'][1]['in'].append({'id': 'added'})
+        self.saved['outputs'] = []
+        self.assertEqual(self.workflow.save(), fresh(build()))
+        step = self.workflow.steps[0]
+        step.save()['out'].append('added')
+        self.assertEqual(step.save(), fresh(build().steps[0]))
+
+    def test_values_are_shared_as_before(self):
+        shared = {'class': 'ResourceRequirement', 'coresMin': 2}
+        self.workflow.steps[0].hints = [shared]
+        self.workflow.steps[1].hints = [shared]
+        for _ in range(2):
+            saved = self.workflow.save()
+            self.assertIs(saved['steps'][0]['hints'][0], shared)
+            self.assertIs(saved['steps'][1]['hints'][0], shared)
+
+    def test_top(self):
+        tool = cwl_schema.load_document(dict(TOOL, **{'$namespaces': {'edam': 'http://edamontology.org/'}}),
+                                        'file:///tmp/tool.cwl')
+        workflow = build(1)
+        workflow.steps[0].set_run(tool)
+        workflow.loadingOptions = tool.loadingOptions
+        self.assertNotIn('$namespaces', workflow.save())
+        self.assertEqual(workflow.save(top=True)['$namespaces'], {'edam': 'http://edamontology.org/'})
+        self.assertNotIn('$namespaces', workflow.save(top=False))
+
+    def test_concurrent_saves(self):
+        workflows = [build(60) for _ in range(4)]
+        expected = [fresh(build(60)) for _ in range(4)]
+        errors = []
+
+        def save_repeatedly(workflow, expected):
+            try:
+                for i in range(5):
+                    workflow.steps[i].mark_dirty()
+                    saved = workflow.save()
+                    self.assertEqual(saved, expected)
+                    saved['steps'][0]['label'] = 'changed'
+                    saved['steps'][1]['in'].append({'id': 'added'})
+                    self.assertEqual(workflow.save(), expected)
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=save_repeatedly, args=args) for args in zip(workflows, expected)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(cwl_schema._saving(), [])
+
+    def test_mark_dirty_with_cyclic_parents(self):
+        step = self.workflow.steps[0]
+        self.workflow._save_parents = [step]
+        step.mark_dirty()
+        self.assertIsNone(self.workflow._saved)
+        self.assertEqual(self.workflow.save(), fresh(build()))
+
+    def test_builders_on_replaced_lists(self):
+        workflow = Workflow('main')
+        workflow.steps, workflow.inputs, workflow.outputs = [], [], []
+        step = WorkflowStep('step', run='tool.cwl')
+        step.in_, step.out = [], []
+        workflow.save()
+        step.save()
+        step.add_input(WorkflowStepInput('input'))
+        step.add_output(WorkflowStepOutput('output'))
+        self.assertEqual((len(step.save()['in']), len(step.save()['out'])), (1, 1))
+        workflow.add_step(step)
+        workflow.add_input_parameter(InputParameter('input'))
+        workflow.add_output_parameter(WorkflowOutputParameter('output'))
+        saved = workflow.save()
+        self.assertEqual((len(saved['steps']), len(saved['inputs']), len(saved['outputs'])), (1, 1, 1))
+        self.assertIs(workflow.step_by_id('step'), step)
@@ -0,0 +1,120 @@
+import io
+import json
+from unittest import TestCase
+
+from ruamel import yaml
+
+import cwl_schema
+from cwlpy import Workflow, WorkflowStep, dump_yaml, dump_json
+
+
+def loaded_workflow():
+    shared = {'class': 'ResourceRequirement', 'coresMin': 2}
+    steps = []
+    for i in range(5):
+        steps.append({
+            'id': 'step-%d' % i,
+            'run': {
+                'class': 'CommandLineTool',
+                'baseCommand': ['tool', str(i)],
+                'inputs': [{'id': 'input', 'type': 'File', 'inputBinding': {'position': 1}},
+                           {'id': 'flags', 'type': 'string[]?'}],
+                'outputs': [{'id': 'output', 'type': 'File', 'outputBinding': {'glob': 'out.txt'}}],
+            },
+            'in': [{'id': 'input', 'source': 'wf-input' if i == 0 else 'step-%d/output' % (i - 1)}],
+            'out': ['output'],
+            'hints': [shared, {'class': 'Other', 'values': [1, 2.5, True, None, 'yes']}],
+            'doc': 'A long description of this step that wraps over the line width of the emitter, '
+                   'with: a colon\nand a second line',
+        })
+    doc = {
+        'class': 'Workflow',
+        'cwlVersion': 'v1.0',
+        'id': 'main',
+        '$namespaces': {'edam': 'http://edamontology.org/'},
+        'edam:note': u'unicode é',
+        'inputs': [{'id': 'wf-input', 'type': 'File'}],
+        'outputs': [{'id': 'wf-output', 'type': 'File', 'outputSource': 'step-4/output'}],
+        'steps': steps,
+    }
+    return cwl_schema.load_document(doc, 'file:///tmp/wf.cwl')
+
+
+def built_workflow():
+    workflow = Workflow('revsort')
+    rev_step = WorkflowStep('rev', run='revtool.cwl')
+    sort_step = WorkflowStep('sorted', run='sorttool.cwl')
+    workflow.step(rev_step).step(sort_step)
+    workflow.connect_input(rev_step, 'input')
+    workflow.connect_input(sort_step, 'reverse_sort', 'reverse')
+    workflow.connect_steps(rev_step, sort_step, 'output', 'input')
+    workflow.connect_output(sort_step, 'output')
+    return workflow
+
+
+class DumpTestCase(TestCase):
+
+    def assertSameYaml(self, obj, top=False, **kwargs):
+        expected = yaml.safe_dump(cwl_schema.save(obj, top=top), default_flow_style=False, **kwargs)
+        stream = io.StringIO()
+        dump_yaml(obj, stream, top=top, **kwargs)
+        self.assertEqual(stream.getvalue(), expected)
+
+    def assertSameJson(self, obj, top=False, **kwargs):
+        expected = json.dumps(cwl_schema.save(obj, top=top), **kwargs)
+        stream = io.StringIO()
+        dump_json(obj, stream, top=top, **kwargs)
+        self.assertEqual(stream.getvalue(), expected)
+
+    def test_yaml_of_loaded_workflow(self):
+        workflow = loaded_workflow()
+        self.assertSameYaml(workflow)
+        self.assertSameYaml(workflow, top=True)
+        self.assertSameYaml(workflow, width=60, indent=4, explicit_start=True)
+        self.assertSameYaml(workflow, allow_unicode=True)
+
+    def test_yaml_of_built_workflow(self):
+        workflow = built_workflow()
+        self.assertSameYaml(workflow)
+        self.assertSameYaml(workflow.steps[0])
+
+    def test_yaml_aliases_shared_values(self):
+        workflow = built_workflow()
+        shared = {'class': 'ResourceRequirement', 'coresMin': 2}
+        workflow.steps[0].hints = [shared, {'nested': [shared]}]
+        workflow.steps[1].hints = [shared]
+        self.assertIn('*id001', yaml.safe_dump(workflow.save(), default_flow_style=False))
+        self.assertSameYaml(workflow)
+
+    def test_json(self):
+        for workflow in (loaded_workflow(), built_workflow()):
+            self.assertSameJson(workflow)
+            self.assertSameJson(workflow, top=True)
+            self.assertSameJson(workflow, indent=2)
+            self.assertSameJson(workflow, indent=4, sort_keys=True)
+            self.assertSameJson(workflow, separators=(',', ':'), ensure_ascii=False)
+
+    def test_writes_in_pieces(self):
+        class Stream(object):
+            def __init__(self):
+                self.writes = []
+
+            def write(self, text):
+                self.writes.append(text)
+
+        workflow = loaded_workflow()
+        stream = Stream()
+        dump_yaml(workflow, stream)
+        self.assertEqual(''.join(stream.writes), yaml.safe_dump(workflow.save(), default_flow_style=False))
+
+    def test_lazy_runs(self):
+        doc = loaded_workflow().save(top=True)
+        # Never fetched: there is no such file
+        doc['steps'][1]['run'] = 'missing-tool.cwl'
+        options = cwl_schema.LoadingOptions(lazy_run=True)
+        workflow = cwl_schema.load_document(doc, 'file:///tmp/wf.cwl', options)
+        self.assertSameYaml(workflow)
+        self.assertSameYaml(workflow, top=True)
+        self.assertSameJson(workflow, indent=2)
+        self.assertFalse(workflow.steps[1].run.loaded)
+        self.assertIn('run: file:///tmp/missing-tool.cwl', yaml.safe_dump(workflow.save(), default_flow_style=False))
@@ -0,0 +1,95 @@
+import copy
+import pickle
+from unittest import TestCase
+
+import cwl_schema
+from cwlpy import Workflow, WorkflowStep, WorkflowStepInput
+
+DOC = {
+    'class': 'Workflow',
+    'cwlVersion': 'v1.0',
+    'id': 'main',
+    'inputs': [{'id': 'wf-input', 'type': 'File'}],
+    'outputs': [],
+    'steps': [{
+        'id': 'step',
+        'run': {
+            'class': 'CommandLineTool',
+            'baseCommand': 'cat',
+            'inputs': [{'id': 'input', 'type': 'File', 'inputBinding': {'position': 1}}],
+            'outputs': [],
+        },
+        'in': [{'id': 'input', 'source': 'wf-input', 'http://example.com/note': 'extended'}],
+        'out': [],
+    }],
+}
+
+
+def records(value):
+    """Every cwl_schema record in value, depth first."""
+    if isinstance(value, list):
+        for item in value:
+            for found in records(item):
+                yield found
+    elif isinstance(value, cwl_schema.Savable):
+        yield value
+        for cls in type(value).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if not name.startswith('_'):
+                    for found in records(getattr(value, name, None)):
+                        yield found
+
+
+def build():
+    workflow = Workflow('main')
+    first, second = WorkflowStep('first', run='tool.cwl'), WorkflowStep('second', run='tool.cwl')
+    workflow.step(first).step(second)
+    workflow.connect_input(first, 'input')
+    workflow.connect_steps(first, second, 'output', 'input')
+    return workflow
+
+
+class SlotsTestCase(TestCase):
+
+    def test_loaded_records_have_no_dict(self):
+        loaded = list(records(cwl_schema.load_document(DOC, 'file:///tmp/main.cwl')))
+        self.assertGreater(len(loaded), 5)
+        for record in loaded:
+            self.assertFalse(hasattr(record, '__dict__'), type(record).__name__)
+
+    def test_built_records_have_no_dict(self):
+        built = list(records(build()))
+        self.assertGreater(len(built), 5)
+        for record in built:
+            self.assertFalse(hasattr(record, '__dict__'), type(record).__name__)
+
+    def test_empty_extension_fields_are_shared(self):
+        workflow = cwl_schema.load_document(DOC, 'file:///tmp/main.cwl')
+        step_input = workflow.steps[0].in_[0]
+        self.assertEqual(step_input.extension_fields, {'http://example.com/note': 'extended'})
+        self.assertEqual(workflow.save()['steps'][0]['in'][0]['http://example.com/note'], 'extended')
+        self.assertEqual(workflow.extension_fields, {})
+        self.assertIs(workflow.extension_fields, workflow.steps[0].extension_fields)
+        with self.assertRaises(TypeError):
+            workflow.extension_fields['http://example.com/note'] = 'changed'
+        self.assertEqual(workflow.steps[0].extension_fields, {})
+        workflow.extension_fields = {'http://example.com/note': 'changed'}
+        self.assertEqual(workflow.save()['http://example.com/note'], 'changed')
+
+    def test_copy_and_pickle(self):
+        workflow = build()
+        saved = workflow.save()
+        for copied in (pickle.loads(pickle.dumps(workflow)), copy.deepcopy(workflow)):
+            self.assertEqual(copied.save(), saved)
+            copied.steps[0].label = 'copied'
+            self.assertEqual(copied.save()['steps'][0]['label'], 'copied')
+        self.assertNotIn('label', workflow.save()['steps'][0])
+
+    def test_graph_of_loaded_steps(self):
+        workflow = Workflow('main')
+        step = cwl_schema.load_document(DOC, 'file:///tmp/main.cwl').steps[0]
+        workflow.add_step(step)
+        graph = workflow.graph()
+        self.assertIs(workflow.graph(), graph)
+        step.in_.append(WorkflowStepInput('other'))
+        self.assertIsNot(workflow.graph(), graph)
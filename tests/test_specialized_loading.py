@@ -0,0 +1,127 @@
+import io
+import os
+import re
+import types
+from unittest import TestCase
+
+import cwl_schema
+import specialize_cwl_schema
+
+SCHEMA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cwl_schema.py')
+
+TOOL = {
+    'class': 'CommandLineTool',
+    'id': 'echo',
+    'baseCommand': ['echo', '-n'],
+    'requirements': [{'class': 'DockerRequirement', 'dockerPull': 'debian'},
+                     {'class': 'InlineJavascriptRequirement'}],
+    'hints': {'ResourceRequirement': {'coresMin': 2}},
+    'inputs': {
+        'message': {'type': 'string', 'inputBinding': {'position': 1}},
+        'count': 'int?',
+        'names': {'type': 'string[]?', 'default': ['a', 'b']},
+        'mode': {'type': {'type': 'enum', 'name': 'Mode', 'symbols': ['fast', 'slow']}},
+        'pair': {'type': {'type': 'record', 'name': 'Pair', 'fields': {'left': 'File', 'right': 'Directory?'}}},
+    },
+    'outputs': {'out': 'stdout'},
+    'stdout': 'out.txt',
+}
+
+WORKFLOW = {
+    'class': 'Workflow',
+    'cwlVersion': 'v1.0',
+    'id': 'main',
+    '$namespaces': {'edam': 'http://edamontology.org/'},
+    'edam:note': 'kept',
+    'inputs': [{'id': 'message', 'type': 'string'}, {'id': 'files', 'type': 'File[]'}],
+    'outputs': [{'id': 'result', 'type': 'File', 'outputSource': 'second/out'}],
+    'requirements': [{'class': 'ScatterFeatureRequirement'}],
+    'steps': {
+        'first': {'run': TOOL, 'in': {'message': 'message'}, 'out': ['out']},
+        'second': {
+            'run': 'echo.cwl',
+            'in': [{'id': 'message', 'source': ['first/out', '#main/message']}],
+            'out': [{'id': 'out'}],
+            'scatter': 'message',
+        },
+    },
+}
+
+INVALID = [
+    dict(TOOL, inputs={'message': {'type': 12}}),
+    dict(TOOL, requirements=[{'class': 'NoSuchRequirement'}]),
+    dict(TOOL, baseCommand=3),
+    dict(WORKFLOW, steps=[{'id': 'step', 'in': 'wrong', 'out': []}]),
+    dict(WORKFLOW, inputs=[{'id': 'message'}, 7]),
+    {'class': 'Unknown'},
+]
+
+
+class SpecializedLoadingTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.specialized = specialize_cwl_schema.load_specialized(SCHEMA)
+
+    def assertLoadsSame(self, doc, baseuri='file:///tmp/main.cwl'):
+        expected = cwl_schema.load_document(doc, baseuri)
+        loaded = self.specialized.load_document(doc, baseuri)
+        if isinstance(expected, list):
+            self.assertEqual(len(loaded), len(expected))
+        else:
+            loaded, expected = [loaded], [expected]
+        for obj, expected_obj in zip(loaded, expected):
+            self.assertEqual(type(obj).__name__, type(expected_obj).__name__)
+            self.assertEqual(obj.save(top=True), expected_obj.save(top=True))
+
+    def message(self, e):
+        # Records are named by their module, and loaders by their address
+        return re.sub(r' at 0x[0-9a-f]+', '', str(e)).replace('cwl_schema_specialized.', 'cwl_schema.')
+
+    def test_tool(self):
+        self.assertLoadsSame(TOOL)
+
+    def test_workflow(self):
+        self.assertLoadsSame(WORKFLOW)
+        self.assertLoadsSame(WORKFLOW, 'http://example.com/cwl/main.cwl?version=2')
+
+    def test_graph(self):
+        workflow = dict((key, value) for key, value in WORKFLOW.items() if not key.startswith(('$', 'edam:')))
+        workflow['id'] = '#main'
+        workflow['steps'] = [{'id': '#main/step', 'run': '#echo', 'in': {'message': 'message'}, 'out': []}]
+        self.assertLoadsSame({'cwlVersion': 'v1.0', '$graph': [dict(TOOL, id='#echo'), workflow]})
+
+    def test_same_errors(self):
+        for doc in INVALID:
+            with self.assertRaises(cwl_schema.ValidationException) as expected:
+                cwl_schema.load_document(doc, 'file:///tmp/main.cwl')
+            with self.assertRaises(self.specialized.ValidationException) as raised:
+                self.specialized.load_document(doc, 'file:///tmp/main.cwl')
+            self.assertEqual(self.message(raised.exception), self.message(expected.exception))
+
+    def test_names_expand_as_expand_url_does(self):
+        options = cwl_schema.LoadingOptions()
+        for baseuri in ('file:///tmp/main.cwl', 'file:///tmp/main.cwl#main', 'file:///tmp/main.cwl#main/step',
+                        'http://example.com/main.cwl?x=1#main', 'http://example.com', 'main.cwl', '#main',
+                        'file:///tmp/main.cwl#a b'):
+            for name in ('input', 'step-1/output', 'a.b_c'):
+                self.assertEqual(self.specialized._expand_name(name, baseuri, options),
+                                 cwl_schema.expand_url(name, baseuri, options, scoped_id=True))
+                for n in (1, 2):
+                    self.assertEqual(self.specialized._expand_name(name, baseuri, options, n),
+                                     cwl_schema.expand_url(name, baseuri, options, scoped_ref=n))
+
+    def test_specialized_once(self):
+        with io.open(SCHEMA, encoding='utf-8') as f:
+            source = specialize_cwl_schema.specialize(f.read(), cwl_schema)
+        self.assertIn(specialize_cwl_schema.MARKER, source)
+        with self.assertRaises(ValueError):
+            specialize_cwl_schema.specialize(source, cwl_schema)
+
+    def test_plain_schema_salad_output_is_refused(self):
+        plain = types.ModuleType('cwl_schema')
+        exec('class _Loader(object):\n    pass\n', plain.__dict__)
+        with self.assertRaises(ValueError) as cm:
+            specialize_cwl_schema.specialize('', plain)
+        self.assertIn('_Loader.accepts()', str(cm.exception))
+        self.assertIn('_TypeDSLLoader.resolve_all()', str(cm.exception))
@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+import six
+
+import cwl_schema
+
+BASEURI = 'file:///test/tool.cwl#input'
+LOADER = cwl_schema.typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2
+
+
+def resolve_uncached(doc, options):
+    """What _TypeDSLLoader.resolve() did before it had a cache."""
+    m = LOADER.typeDSLregex.match(doc)
+    if m:
+        first = cwl_schema.expand_url(m.group(1), BASEURI, options, False, True, LOADER.refScope)
+        second = third = None
+        if bool(m.group(2)):
+            second = {"type": "array", "items": first}
+        if bool(m.group(3)):
+            third = [u"null", second or first]
+        doc = third or second or first
+    return doc
+
+
+def resolve_all_uncached(doc, options):
+    r = []
+    for d in doc:
+        if isinstance(d, six.string_types):
+            resolved = resolve_uncached(d, options)
+            for i in (resolved if isinstance(resolved, list) else [resolved]):
+                if i not in r:
+                    r.append(i)
+        else:
+            r.append(d)
+    return r
+
+
+class TypeDSLTestCase(TestCase):
+
+    def setUp(self):
+        self.options = cwl_schema.LoadingOptions()
+
+    def test_same_resolutions(self):
+        for doc in ('File', 'File[]', 'File?', 'string[]?', 'Custom', 'Custom[]?', '[]', 'int??'):
+            for _ in range(2):
+                self.assertEqual(LOADER.resolve(doc, BASEURI, self.options), resolve_uncached(doc, self.options))
+
+    def test_cached_per_loading_options(self):
+        LOADER.resolve('File[]?', BASEURI, self.options)
+        self.assertEqual(self.options.url_cache.types['File[]?'], ('File', True, True))
+        copy = cwl_schema.LoadingOptions(copyfrom=self.options)
+        self.assertIs(copy.url_cache.types, self.options.url_cache.types)
+        other = cwl_schema.LoadingOptions(namespaces={'edam': 'http://edamontology.org/'})
+        self.assertEqual(other.url_cache.types, {})
+
+    def test_resolutions_are_not_shared(self):
+        first = LOADER.resolve('File[]?', BASEURI, self.options)
+        first[1]['items'] = 'changed'
+        first.append('changed')
+        self.assertEqual(LOADER.resolve('File[]?', BASEURI, self.options), resolve_uncached('File[]?', self.options))
+
+    def test_cache_disabled(self):
+        self.options.url_cache.max_entries = 0
+        self.assertEqual(LOADER.resolve('File[]', BASEURI, self.options), resolve_uncached('File[]', self.options))
+        self.assertEqual(self.options.url_cache.types, {})
+
+    def test_resolve_all_leaves_out_duplicates(self):
+        array = {'type': 'array', 'items': 'File'}
+        for doc in (['File', 'File?', 'null', 'File'],
+                    ['null', 'File[]?', 'File[]', 'string?'],
+                    [{'type': 'array', 'items': cwl_schema.expand_url('File', BASEURI, self.options, False, True, 2)},
+                     'File[]', 'File[]'],
+                    [array, array, 'string', 3]):
+            self.assertEqual(LOADER.resolve_all(doc, BASEURI, self.options), resolve_all_uncached(doc, self.options))
@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+import cwl_schema
+
+
+TOOL = {
+    'class': 'CommandLineTool',
+    'id': 'file:///test/tool.cwl',
+    'baseCommand': 'echo',
+    'requirements': [{'class': 'ResourceRequirement', 'coresMin': 2}],
+    'inputs': [{'id': 'message', 'type': 'string[]?'}],
+    'outputs': [],
+}
+
+
+def load(doc, union_dispatch):
+    options = cwl_schema.LoadingOptions(union_dispatch=union_dispatch)
+    return cwl_schema.load_document(doc, 'file:///test/tool.cwl', options)
+
+
+def load_error(doc, union_dispatch):
+    try:
+        load(doc, union_dispatch)
+    except cwl_schema.ValidationException as e:
+        return str(e)
+    raise AssertionError('document loaded without error')
+
+
+class UnionLoaderCandidatesTestCase(TestCase):
+
+    def test_dispatches_on_class(self):
+        loader = cwl_schema.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader
+        self.assertEqual(loader.candidates({'class': 'Workflow'}), (cwl_schema.WorkflowLoader,))
+
+    def test_dispatches_on_type(self):
+        loader = cwl_schema.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype
+        self.assertEqual(loader.candidates({'type': 'enum'}), (cwl_schema.EnumSchemaLoader,))
+        self.assertEqual(loader.candidates('string'), (cwl_schema.PrimitiveTypeLoader, cwl_schema.strtype))
+
+    def test_unknown_discriminator_keeps_all_records(self):
+        loader = cwl_schema.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader
+        self.assertIs(loader.candidates({'class': 'Unknown'}), loader.alternates)
+        self.assertEqual(loader.candidates('tool.cwl'), ())
+
+    def test_bool_is_accepted_as_int(self):
+        loader = cwl_schema.union_of_None_type_or_inttype
+        self.assertEqual(loader.candidates(True), (cwl_schema.inttype,))
+
+
+class UnionLoaderDispatchTestCase(TestCase):
+
+    def test_same_result(self):
+        self.assertEqual(load(TOOL, True).save(top=True), load(TOOL, False).save(top=True))
+
+    def test_same_error_for_unknown_class(self):
+        doc = dict(TOOL, **{'class': 'CommandLineToo'})
+        self.assertEqual(load_error(doc, True), load_error(doc, False))
+
+    def test_same_error_for_invalid_field(self):
+        doc = dict(TOOL, requirements=[{'class': 'ResourceRequirement', 'coresMin': [1]}])
+        message = load_error(doc, True)
+        self.assertIn('coresMin', message)
+        self.assertEqual(message, load_error(doc, False))
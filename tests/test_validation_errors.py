@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from ruamel import yaml
+
+import cwl_schema
+
+
+BAD_TOOL = """class: CommandLineTool
+inputs:
+  message:
+    type: 3
+outputs: []
+"""
+
+
+class DeferredErrorTestCase(TestCase):
+
+    def test_message_is_rendered_on_str(self):
+        e = cwl_schema.ValidationException(cwl_schema._Message("Expected one of %s", ('a', 'b')))
+        self.assertIsInstance(e.args[0], cwl_schema._DeferredError)
+        self.assertEqual(str(e), "Expected one of ('a', 'b')")
+        self.assertEqual(e.args, ("Expected one of ('a', 'b')",))
+
+    def test_default_render(self):
+        class Failure(cwl_schema._DeferredError):
+            message = 'Something failed'
+        self.assertEqual(str(cwl_schema.ValidationException(Failure())), 'Something failed')
+        self.assertEqual(cwl_schema._DeferredError().render(), '')
+
+    def test_plain_message(self):
+        self.assertEqual(str(cwl_schema.ValidationException('Not a Workflow')), 'Not a Workflow')
+
+    def test_union_failure_is_structured(self):
+        loader = cwl_schema.union_of_None_type_or_inttype
+        with self.assertRaises(cwl_schema.ValidationException) as cm:
+            loader.load('three', '', cwl_schema.LoadingOptions(union_dispatch=False))
+        error = cm.exception.args[0]
+        self.assertIsInstance(error, cwl_schema._UnionError)
+        self.assertEqual(list(error.alternates), [cwl_schema.None_type, cwl_schema.inttype])
+        self.assertIn('tried', str(cm.exception))
+
+    def test_source_error_position(self):
+        doc = yaml.round_trip_load(BAD_TOOL)
+        cwl_schema.add_lc_filename(doc, 'tool.cwl')
+        error = cwl_schema._SourceError(doc, 'inputs', 'bad inputs')
+        self.assertEqual(error.position(), ('tool.cwl', 2, 1))
+        self.assertEqual(str(error), 'tool.cwl:2:1: bad inputs')
+
+    def test_load_document_renders_message(self):
+        doc = yaml.round_trip_load(BAD_TOOL)
+        cwl_schema.add_lc_filename(doc, 'tool.cwl')
+        with self.assertRaises(cwl_schema.ValidationException) as cm:
+            cwl_schema.load_document(doc, 'file:///test/tool.cwl')
+        self.assertIsInstance(cm.exception.args[0], str)
+        self.assertIn("tool.cwl:4:5:", cm.exception.args[0])
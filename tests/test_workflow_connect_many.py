@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from cwlpy import Workflow, WorkflowStep, ValidationException
+
+
+class WorkflowConnectManyTestCase(TestCase):
+
+    def setUp(self):
+        self.workflow = Workflow('my-workflow')
+        self.step1 = WorkflowStep('my-step-1')
+        self.step2 = WorkflowStep('my-step-2')
+        self.workflow.step(self.step1).step(self.step2)
+
+    def build_one_by_one(self):
+        workflow = Workflow('my-workflow')
+        step1 = WorkflowStep('my-step-1')
+        step2 = WorkflowStep('my-step-2')
+        workflow.step(step1).step(step2)
+        workflow.connect_input(step1, 'wf-input', 'step-1-input')
+        workflow.connect_steps(step1, step2, 'step-1-output', 'step-2-input')
+        workflow.connect_output(step2, 'step-2-output', 'wf-output')
+        return workflow
+
+    def test_same_as_one_by_one(self):
+        retval = self.workflow.connect_many([
+            (None, 'wf-input', self.step1, 'step-1-input'),
+            (self.step1, 'step-1-output', 'my-step-2', 'step-2-input'),
+            ('my-step-2', 'step-2-output', None, 'wf-output'),
+        ])
+        self.assertIs(retval, self.workflow)
+        self.assertEqual(self.workflow.save(), self.build_one_by_one().save())
+
+    def test_columns(self):
+        self.workflow.connect_many(
+            source_steps=[None, self.step1, self.step2],
+            source_ports=['wf-input', 'step-1-output', 'step-2-output'],
+            target_steps=[self.step1, self.step2, None],
+            target_ports=['step-1-input', 'step-2-input', 'wf-output'])
+        self.assertEqual(self.workflow.save(), self.build_one_by_one().save())
+
+    def test_columns_must_be_complete(self):
+        with self.assertRaises(ValidationException) as cm:
+            self.workflow.connect_many(source_steps=[None], source_ports=['x'], target_steps=[self.step1])
+        self.assertIn('all four columns', repr(cm.exception))
+        with self.assertRaises(ValidationException) as cm:
+            self.workflow.connect_many(source_steps=[None], source_ports=['x'], target_steps=[self.step1],
+                                       target_ports=['a', 'b'])
+        self.assertIn('same length', repr(cm.exception))
+
+    def test_shared_workflow_input(self):
+        self.workflow.connect_many([
+            (None, 'wf-input', self.step1, 'input'),
+            (None, 'wf-input', self.step2, 'input'),
+        ])
+        self.assertEqual(len(self.workflow.inputs), 1)
+        self.assertIs(self.step2.in_[0].source, self.workflow.inputs[0])
+
+    def test_reports_all_conflicts_and_changes_nothing(self):
+        self.workflow.connect_input(self.step1, 'wf-input', 'taken')
+        self.workflow.connect_output(self.step1, 'out', 'wf-output')
+        before = self.workflow.save()
+        with self.assertRaises(ValidationException) as cm:
+            self.workflow.connect_many([
+                (None, 'wf-input-2', self.step2, 'fine'),
+                (None, 'wf-input', self.step1, 'taken'),
+                (self.step1, 'out', 'no-such-step', 'input'),
+                (self.step1, 'out', self.step2, 'twice'),
+                (self.step1, 'out', self.step2, 'twice'),
+                (self.step2, 'out', None, 'wf-output'),
+                (self.step2, 'out', None, 'wf-output-2'),
+                (self.step2, 'out', None, 'wf-output-2'),
+                (WorkflowStep('elsewhere'), 'out', self.step2, 'other'),
+                (None, 'x', None, 'y'),
+                (self.step1, 1, self.step2, 'port'),
+                ('not an edge',),
+            ])
+        message = str(cm.exception)
+        self.assertNotIn('edge 0:', message)
+        self.assertIn('edge 1: step my-step-1 already has input with id: taken', message)
+        self.assertIn('edge 2: no target step with id no-such-step', message)
+        self.assertNotIn('edge 3:', message)
+        self.assertIn('edge 4: step my-step-2 already has input with id: twice', message)
+        self.assertIn('edge 5: output parameter wf-output exists and is already connected', message)
+        self.assertNotIn('edge 6:', message)
+        self.assertIn('edge 7: output parameter wf-output-2 exists and is already connected', message)
+        self.assertIn('edge 8: source step elsewhere is not a part of workflow', message)
+        self.assertIn('edge 9: connects the workflow to itself', message)
+        self.assertIn('edge 10: port 1 is not a string', message)
+        self.assertIn('edge 11: not a (source step', message)
+        self.assertEqual(self.workflow.save(), before)
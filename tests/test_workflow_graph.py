@@ -0,0 +1,146 @@
+import os
+from unittest import TestCase
+
+import cwl_schema
+from cwlpy import Workflow, WorkflowStep, WorkflowStepInput, WorkflowGraph, ValidationException
+
+
+def diamond():
+    """a -> b, a -> c, b -> d, c -> d, and e on its own."""
+    workflow = Workflow('diamond')
+    steps = dict((name, WorkflowStep(name)) for name in 'abcde')
+    for name in 'abcde':
+        workflow.add_step(steps[name])
+    workflow.connect_input(steps['a'], 'wf-input', 'input')
+    workflow.connect_steps(steps['a'], steps['b'], 'output', 'input')
+    workflow.connect_steps(steps['a'], steps['c'], 'output', 'input')
+    workflow.connect_steps(steps['b'], steps['d'], 'output', 'left')
+    workflow.connect_steps(steps['c'], steps['d'], 'output', 'right')
+    workflow.connect_steps(steps['c'], steps['d'], 'other', 'right-again')
+    return workflow, steps
+
+
+class WorkflowGraphTestCase(TestCase):
+
+    def setUp(self):
+        self.workflow, self.steps = diamond()
+        self.graph = self.workflow.graph()
+
+    def names(self, indices):
+        return [self.graph.ids[i] for i in indices]
+
+    def test_adjacency(self):
+        graph = self.graph
+        self.assertEqual(graph.ids, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(len(graph), 5)
+        self.assertEqual(graph.edge_count, 4)
+        self.assertEqual(self.names(graph.successors(graph.index_of('a'))), ['b', 'c'])
+        self.assertEqual(self.names(graph.predecessors(graph.index_of('d'))), ['b', 'c'])
+        self.assertEqual(list(graph.predecessors(graph.index_of('a'))), [])
+
+    def test_topological_order(self):
+        order = self.names(self.graph.topological_order())
+        self.assertEqual(sorted(order), ['a', 'b', 'c', 'd', 'e'])
+        for before, after in [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd')]:
+            self.assertLess(order.index(before), order.index(after))
+        self.assertTrue(self.graph.is_acyclic())
+        self.assertIsNone(self.graph.find_cycle())
+
+    def test_cycle(self):
+        self.workflow.connect_steps(self.steps['d'], self.steps['a'], 'output', 'loop')
+        graph = self.workflow.graph()
+        self.assertIsNot(graph, self.graph)
+        cycle = self.names(graph.find_cycle())
+        self.assertEqual(len(cycle), 3)
+        self.assertIn(cycle[cycle.index('a'):] + cycle[:cycle.index('a')],
+                      (['a', 'b', 'd'], ['a', 'c', 'd']))
+        self.assertFalse(graph.is_acyclic())
+        with self.assertRaises(ValidationException) as cm:
+            graph.topological_order()
+        self.assertIn('Steps depend on each other', repr(cm.exception))
+        with self.assertRaises(ValidationException):
+            graph.longest_path()
+
+    def test_components(self):
+        count, labels = self.graph.components()
+        self.assertEqual(count, 2)
+        self.assertEqual(list(labels), [0, 0, 0, 0, 1])
+
+    def test_ancestors_and_descendants(self):
+        graph = self.graph
+        self.assertEqual(sorted(self.names(graph.ancestors(graph.index_of('d')))), ['a', 'b', 'c'])
+        self.assertEqual(self.names(graph.descendants(graph.index_of('a')))[-1], 'd')
+        self.assertEqual(sorted(self.names(graph.descendants(graph.index_of('b')))), ['d'])
+        self.assertEqual(list(graph.ancestors(graph.index_of('e'))), [])
+
+    def test_longest_path(self):
+        length, path = self.graph.longest_path()
+        self.assertEqual(length, 3)
+        self.assertEqual(self.names(path)[0], 'a')
+        self.assertEqual(self.names(path)[-1], 'd')
+        length, path = self.graph.longest_path([1, 1, 5, 1, 10])
+        self.assertEqual((length, self.names(path)), (10, ['e']))
+        length, path = self.graph.longest_path([1, 1, 5, 1, 0])
+        self.assertEqual((length, self.names(path)), (7, ['a', 'c', 'd']))
+
+    def test_empty(self):
+        graph = Workflow('empty').graph()
+        self.assertEqual(list(graph.topological_order()), [])
+        self.assertEqual(graph.longest_path(), (0, []))
+        self.assertEqual(graph.components()[0], 0)
+
+
+class WorkflowGraphCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.workflow, self.steps = diamond()
+        self.graph = self.workflow.graph()
+
+    def test_cached(self):
+        self.assertIs(self.workflow.graph(), self.graph)
+
+    def test_add_step(self):
+        self.workflow.add_step(WorkflowStep('f'))
+        self.assertEqual(len(self.workflow.graph()), 6)
+
+    def test_step_list_changes(self):
+        del self.workflow.steps[-1]
+        self.assertEqual(len(self.workflow.graph()), 4)
+        self.workflow.steps = list(self.workflow.steps)[:2]
+        self.assertEqual(len(self.workflow.graph()), 2)
+
+    def test_step_input_changes(self):
+        step_input = WorkflowStepInput('late')
+        step_input.set_source('d/output')
+        self.steps['e'].add_input(step_input)
+        graph = self.workflow.graph()
+        self.assertIsNot(graph, self.graph)
+        self.assertEqual(graph.edge_count, 5)
+        step_input.set_source('wf-input')
+        self.assertEqual(self.workflow.graph().edge_count, 4)
+        self.steps['e'].in_.remove(step_input)
+        self.assertEqual(self.workflow.graph().edge_count, 4)
+
+    def test_connect_many(self):
+        self.workflow.connect_many([(self.steps['d'], 'output', self.steps['e'], 'input')])
+        self.assertEqual(self.workflow.graph().edge_count, 5)
+
+
+class LoadedWorkflowGraphTestCase(TestCase):
+
+    def test_loaded_workflow(self):
+        doc = {
+            'class': 'Workflow',
+            'cwlVersion': 'v1.0',
+            'inputs': [{'id': 'x', 'type': 'string'}],
+            'outputs': [],
+            'steps': [
+                {'id': 'first', 'run': 'tool.cwl', 'in': [{'id': 'in', 'source': 'x'}], 'out': ['out']},
+                {'id': 'second', 'run': 'tool.cwl', 'out': ['out'],
+                 'in': [{'id': 'in', 'source': ['first/out', 'x']}]},
+            ],
+        }
+        workflow = cwl_schema.load_document(doc, cwl_schema.file_uri(os.getcwd()) + '/main.cwl')
+        graph = WorkflowGraph(workflow)
+        self.assertEqual(graph.edge_count, 1)
+        self.assertEqual(list(graph.topological_order()), [0, 1])